@@ -0,0 +1,49 @@
+import argparse
+import os
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.catalog import synthetic_raw_frame
+from utils.transform import StreamingDeduplicator, dedup_columns, duplicate_mask
+
+def best_time(func, repeat):
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def streaming_mask(df, batch_size):
+    """Deduplikasi per batch `batch_size` baris, seperti data yang datang per halaman."""
+    deduplicator = StreamingDeduplicator()
+    removed = 0
+    for start in range(0, len(df), batch_size):
+        removed += int(deduplicator.mask(df.iloc[start:start + batch_size]).sum())
+    return removed
+
+def main(sizes, batch_size=20, repeat=3):
+    print(f"{'baris':>10} {'metode':<32} {'waktu (s)':>10} {'speedup':>8} {'duplikat':>9}")
+    for rows in sizes:
+        df = synthetic_raw_frame(rows)
+        subset = dedup_columns(df.columns)
+        methods = [
+            ("drop_duplicates() semua kolom", lambda: int(df.duplicated().sum())),
+            ("drop_duplicates(subset)", lambda: int(df.duplicated(subset=subset).sum())),
+            ("duplicate_mask (factorize)", lambda: int(duplicate_mask(df).sum())),
+            (f"StreamingDeduplicator /{batch_size}", lambda: streaming_mask(df, batch_size)),
+        ]
+        baseline = None
+        for name, func in methods:
+            elapsed, removed = best_time(func, repeat)
+            baseline = baseline or elapsed
+            print(f"{rows:>10} {name:<32} {elapsed:>10.3f} {baseline / elapsed:>7.2f}x {removed:>9}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark deduplikasi: full-row drop_duplicates vs kunci bisnis.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--batch-size", type=int, default=20, help="Baris per batch untuk mode streaming.")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    main(args.sizes, args.batch_size, args.repeat)
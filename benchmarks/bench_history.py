@@ -0,0 +1,87 @@
+import argparse
+import glob
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+import numpy as np
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.catalog import synthetic_raw_frame
+from utils.history import HistoryStore
+from utils.transform import transform_data
+import pandas as pd
+
+def best_time(func, repeat):
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def build_runs(work_dir, runs, rows):
+    """Tulis `runs` snapshot ke CSV per run (seperti sekarang) dan ke HistoryStore."""
+    base = transform_data(synthetic_raw_frame(rows))
+    base = base.drop_duplicates(subset=["Title", "Size", "Gender"])
+    rng = np.random.default_rng(0)
+    store = HistoryStore(os.path.join(work_dir, "history.sqlite"))
+    started = datetime(2025, 5, 1)
+    for run in range(runs):
+        run_at = started + timedelta(days=run)
+        df = base.copy()
+        # Sebagian kecil harga berubah di setiap run
+        changed = rng.random(len(df)) < 0.05
+        df.loc[changed, "Price"] = df.loc[changed, "Price"] * rng.uniform(0.8, 1.2, changed.sum())
+        df.to_csv(os.path.join(work_dir, f"fashion_products_{run_at:%Y%m%d_%H%M%S}.csv"), index=False)
+        store.append_run(df, run_at)
+    return store, base.iloc[len(base) // 2]
+
+def csv_price_history(work_dir, product):
+    """Cara lama: baca dan gabungkan semua CSV lalu filter satu produk."""
+    frames = []
+    for path in sorted(glob.glob(os.path.join(work_dir, "fashion_products_*.csv"))):
+        df = pd.read_csv(path)
+        df["run_at"] = os.path.basename(path)[len("fashion_products_"):-len(".csv")]
+        frames.append(df)
+    all_runs = pd.concat(frames, ignore_index=True)
+    mask = (all_runs["Title"] == product["Title"]) & (all_runs["Size"] == product["Size"]) & (all_runs["Gender"] == product["Gender"])
+    return all_runs[mask]
+
+def csv_diff_last_two(work_dir):
+    paths = sorted(glob.glob(os.path.join(work_dir, "fashion_products_*.csv")))[-2:]
+    old, new = (pd.read_csv(path) for path in paths)
+    merged = old.merge(new, on=["Title", "Size", "Gender"], how="outer", suffixes=("_old", "_new"), indicator=True)
+    return merged[(merged["_merge"] != "both") | (merged["Price_old"] != merged["Price_new"])]
+
+def main(runs=30, rows=1000, repeat=5):
+    with tempfile.TemporaryDirectory() as work_dir:
+        start = time.perf_counter()
+        store, product = build_runs(work_dir, runs, rows)
+        print(f"{runs} run x ~{rows} produk ditulis dalam {time.perf_counter() - start:.2f} s\n")
+
+        queries = [
+            ("riwayat harga 1 produk", lambda: csv_price_history(work_dir, product),
+             lambda: store.price_history(product["Title"], product["Size"], product["Gender"])),
+            ("diff 2 run terakhir", lambda: csv_diff_last_two(work_dir), store.diff_runs),
+            ("snapshot terakhir", lambda: pd.read_csv(sorted(glob.glob(os.path.join(work_dir, "fashion_products_*.csv")))[-1]),
+             store.latest_snapshot),
+        ]
+        print(f"{'query':<26} {'CSV (ms)':>10} {'history (ms)':>13} {'speedup':>8} {'baris':>7}")
+        for name, csv_query, store_query in queries:
+            csv_seconds, expected = best_time(csv_query, repeat)
+            store_seconds, result = best_time(store_query, repeat)
+            print(f"{name:<26} {csv_seconds * 1000:>10.1f} {store_seconds * 1000:>13.2f} "
+                  f"{csv_seconds / store_seconds:>7.0f}x {len(result):>7}")
+            if len(result) != len(expected):
+                print(f"  PERINGATAN: jumlah baris berbeda (CSV {len(expected)})")
+        store.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark query lintas run: scan semua CSV vs HistoryStore (SQLite).")
+    parser.add_argument("--runs", type=int, default=30)
+    parser.add_argument("--rows", type=int, default=1000, help="Produk per run.")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.runs, args.rows, args.repeat)
@@ -0,0 +1,59 @@
+import argparse
+import glob
+import os
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.extract import PARSER_BACKENDS, parse_page, resolve_parser
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+def _without_timestamp(products):
+    return [{key: value for key, value in product.items() if key != "Timestamp"} for product in products]
+
+def load_fixtures(fixture_dir=FIXTURE_DIR):
+    """Membaca semua file HTML di folder fixtures sebagai bytes."""
+    fixtures = {}
+    for path in sorted(glob.glob(os.path.join(fixture_dir, "*.html"))):
+        with open(path, "rb") as f:
+            fixtures[os.path.basename(path)] = f.read()
+    return fixtures
+
+def bench_backend(backend, pages, repeat):
+    """Mengukur waktu rata-rata parsing per halaman (ms) untuk satu backend."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for content in pages:
+            parse_page(content, backend)
+    elapsed = time.perf_counter() - start
+    return elapsed / (repeat * len(pages)) * 1000
+
+def main(repeat=50):
+    fixtures = load_fixtures()
+    pages = list(fixtures.values())
+    if not pages:
+        print(f"Tidak ada fixture HTML di {FIXTURE_DIR}")
+        return
+
+    # Semua backend harus menghasilkan record yang sama dengan html.parser
+    reference = [_without_timestamp(parse_page(content)[0]) for content in pages]
+    timings = {}
+    print(f"{'backend':<12} {'ms/halaman':>12} {'vs html.parser':>15}  output")
+    for backend in PARSER_BACKENDS:
+        result = [_without_timestamp(parse_page(content, backend)[0]) for content in pages]
+        identical = "sama" if result == reference else "BERBEDA"
+        if resolve_parser(backend) is not PARSER_BACKENDS[backend]:
+            identical += " (fallback, paket tidak terpasang)"
+        ms = timings[backend] = bench_backend(backend, pages, repeat)
+        print(f"{backend:<12} {ms:>12.3f} {timings['html.parser'] / ms:>14.2f}x  {identical}")
+
+    # lxml tetap membangun tree BeautifulSoup; hanya selectolax yang melewatinya
+    baseline_ms = timings["html.parser"]
+    print(f"lxml {(1 - timings['lxml'] / baseline_ms) * 100:.0f}% lebih cepat dari html.parser; "
+          f"selectolax {baseline_ms / timings['selectolax']:.1f}x lebih cepat.")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Micro-benchmark backend parser halaman katalog.")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    main(args.repeat)
@@ -0,0 +1,166 @@
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.fake_server import FakeFashionStudioServer
+import main as etl
+
+RESULTS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results", "pipeline.jsonl")
+# Run dianggap regresi jika lebih lambat dari ini dibanding run sebelumnya dengan parameter sama
+REGRESSION_THRESHOLD = 1.2
+
+def git_revision():
+    """Commit pendek yang sedang diuji, atau None jika bukan repo git."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run_once(server, params, work_dir, warm=False):
+    """Jalankan `main` sekali terhadap `server` lokal dan kembalikan ringkasan metriknya.
+
+    `warm` hanya label: cache halaman dari run sebelumnya di `work_dir` selalu dipakai ulang.
+    """
+    cache_dir = os.path.join(work_dir, "cache", "pages")
+    output_dir = os.path.join(work_dir, "output")
+    served_before = (server.requests, server.errors, server.not_modified)
+    # Output print/log dari pipeline tidak ikut dihitung di terminal
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        run_metrics = etl.main(
+            streaming=params["stream"],
+            compact=params["compact"],
+            output_formats=etl.OUTPUT_FORMATS[params["format"]],
+            base_url=server.base_url,
+            spreadsheet_id="",
+            output_dir=output_dir,
+            cache_dir=cache_dir,
+            delay=0,
+            max_workers=params["workers"],
+            parse_workers=params.get("parse_workers", 0),
+        )
+        wall = time.perf_counter() - start
+    requests_served, errors, not_modified = (
+        after - before for after, before in zip((server.requests, server.errors, server.not_modified), served_before)
+    )
+
+    report = run_metrics.report()
+    stages = report["stages"]
+    rows = stages.get("transform.columns", {}).get("rows_out", 0)
+    return {
+        "wall_seconds": wall,
+        "rows": rows,
+        "rows_per_second": rows / wall if wall else None,
+        "pages": len(report["pages"]),
+        "bytes": sum(page["bytes"] for page in report["pages"]),
+        "peak_rss_bytes": report["peak_rss_bytes"],
+        "stage_seconds": {name: values["seconds"] for name, values in stages.items()},
+        "server": {"requests": requests_served, "errors": errors, "not_modified": not_modified},
+        "warm": warm,
+    }
+
+def previous_result(results_file, params, warm):
+    """Hasil terakhir dengan parameter yang sama dari file hasil, atau None."""
+    if not os.path.exists(results_file):
+        return None
+    previous = None
+    with open(results_file, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if entry.get("params") == params and entry.get("warm") == warm:
+                previous = entry
+    return previous
+
+def record_result(results_file, entry):
+    """Tambahkan satu hasil benchmark sebagai baris JSON."""
+    os.makedirs(os.path.dirname(results_file), exist_ok=True)
+    with open(results_file, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry) + "\n")
+
+def main(params, repeat=3, warm=True, results_file=RESULTS_FILE):
+    logging.disable(logging.WARNING)
+    revision = git_revision()
+    print(f"Benchmark pipeline end-to-end: {params}")
+    print(f"{'run':<6} {'median (s)':>11} {'baris/s':>10} {'halaman':>8} {'peak RSS (MB)':>14}  vs sebelumnya")
+
+    runs = [("cold", False)] + ([("warm", True)] if warm else [])
+    regressions = 0
+    for label, is_warm in runs:
+        samples = []
+        for _ in range(repeat):
+            server = FakeFashionStudioServer(params["pages"], params["cards"], params["latency"], params["error_rate"])
+            with server, tempfile.TemporaryDirectory() as work_dir:
+                if is_warm:
+                    run_once(server, params, work_dir)
+                samples.append(run_once(server, params, work_dir, warm=is_warm))
+        samples.sort(key=lambda sample: sample["wall_seconds"])
+        result = samples[len(samples) // 2]
+
+        entry = {
+            "recorded_at": datetime.now().isoformat(),
+            "revision": revision,
+            "params": params,
+            "repeat": repeat,
+            **result,
+        }
+        previous = previous_result(results_file, params, is_warm)
+        comparison = "-"
+        if previous:
+            ratio = result["wall_seconds"] / previous["wall_seconds"]
+            comparison = f"{ratio:.2f}x ({previous.get('revision') or '?'})"
+            if ratio > REGRESSION_THRESHOLD:
+                comparison += " REGRESI"
+                regressions += 1
+        record_result(results_file, entry)
+
+        rss = result["peak_rss_bytes"] / 1e6 if result["peak_rss_bytes"] else float("nan")
+        print(f"{label:<6} {result['wall_seconds']:>11.3f} {result['rows_per_second'] or 0:>10.0f} "
+              f"{result['pages']:>8} {rss:>14.1f}  {comparison}")
+        slowest = sorted(result["stage_seconds"].items(), key=lambda item: item[1], reverse=True)[:5]
+        print("       tahap terlama: " + ", ".join(f"{name} {seconds:.3f}s" for name, seconds in slowest))
+
+    print(f"Hasil dicatat di {results_file}")
+    return regressions
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark pipeline ETL end-to-end terhadap server Fashion Studio lokal.")
+    parser.add_argument("--pages", type=int, default=50)
+    parser.add_argument("--cards", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.0, help="Latensi per response (detik).")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Peluang response 503 (0-1).")
+    parser.add_argument("--workers", type=int, default=1, help="Jumlah halaman yang diambil paralel.")
+    parser.add_argument("--parse-workers", type=int, default=0, help="Jumlah proses parser.")
+    parser.add_argument("--format", choices=sorted(etl.OUTPUT_FORMATS), default="csv")
+    parser.add_argument("--stream", action="store_true")
+    parser.add_argument("--compact", action="store_true")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-warm", action="store_true", help="Lewati run dengan cache halaman yang sudah terisi.")
+    parser.add_argument("--results", default=RESULTS_FILE, help="File JSONL tempat hasil dicatat.")
+    args = parser.parse_args()
+    params = {
+        "pages": args.pages,
+        "cards": args.cards,
+        "latency": args.latency,
+        "error_rate": args.error_rate,
+        "workers": args.workers,
+        "parse_workers": args.parse_workers,
+        "format": args.format,
+        "stream": args.stream,
+        "compact": args.compact,
+    }
+    sys.exit(1 if main(params, args.repeat, not args.no_warm, args.results) else 0)
@@ -0,0 +1,68 @@
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.catalog import product_fields
+from utils.extract import parse_detail_line, typed_product
+from utils.records import ProductBatch
+from utils.transform import transform_to_DataFrame
+
+def generate_products(count, cards_per_page=20):
+    """Record produk seperti hasil `extract_product_data`: string baru per card dan timestamp per card."""
+    for i in range(count):
+        fields = product_fields(i // cards_per_page + 1, i % cards_per_page)
+        product = {"Title": fields["title"], "Price": fields["price"]}
+        for text in (f"Rating: ⭐ {fields['rating']}", f"{fields['colors']} Colors",
+                     f"Size: {fields['size']}", f"Gender: {fields['gender']}"):
+            column, value = parse_detail_line(text)
+            product[column] = value
+        product["Timestamp"] = datetime.now().isoformat()
+        yield product
+
+REPRESENTATIONS = {
+    "list of dict": lambda products: list(products),
+    "ProductBatch": lambda products: ProductBatch(products),
+    "ProductBatch typed": lambda products: ProductBatch((typed_product(p) for p in products), typed=True),
+}
+
+def measure_memory(build, count):
+    """Memori yang masih dipegang hasil `build` setelah semua produk ditampung (tracemalloc)."""
+    gc.collect()
+    tracemalloc.start()
+    result = build(generate_products(count))
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, result
+
+def measure_time(build, count):
+    products = list(generate_products(count))
+    start = time.perf_counter()
+    result = build(iter(products))
+    build_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    df = transform_to_DataFrame(result)
+    return build_seconds, time.perf_counter() - start, df
+
+def main(sizes):
+    print(f"{'produk':>8} {'representasi':<20} {'memori (MB)':>12} {'byte/produk':>12} {'tampung (s)':>12} {'DataFrame (s)':>14}")
+    for count in sizes:
+        baseline = None
+        for name, build in REPRESENTATIONS.items():
+            memory, result = measure_memory(build, count)
+            del result
+            build_seconds, frame_seconds, df = measure_time(build, count)
+            assert len(df) == count
+            baseline = baseline or memory
+            ratio = f"  ({baseline / memory:.1f}x lebih kecil)" if memory != baseline else ""
+            print(f"{count:>8} {name:<20} {memory / 1e6:>12.1f} {memory / count:>12.0f} "
+                  f"{build_seconds:>12.3f} {frame_seconds:>14.3f}{ratio}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark memori list of dict vs ProductBatch (kolom per field).")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000])
+    args = parser.parse_args()
+    main(args.sizes)
@@ -0,0 +1,87 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.fake_server import FakeFashionStudioServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Dependensi sink/backend yang tidak boleh ter-import pada run yang hanya menulis CSV
+# (pyarrow tidak termasuk karena pandas sendiri meng-import-nya jika terpasang)
+FORBIDDEN_ON_CSV_PATH = ("googleapiclient", "google.oauth2", "sqlalchemy", "psycopg2", "selectolax")
+
+CSV_RUN = """
+import json, sys
+import main
+main.main(base_url={base_url!r}, spreadsheet_id="", output_dir={output_dir!r}, cache_dir={cache_dir!r},
+          delay=0, output_formats=("csv",), sinks=("csv",))
+print(json.dumps(sorted(sys.modules)))
+"""
+
+def parse_importtime(stderr):
+    """Baca output `-X importtime` menjadi list (nama modul, level, self µs, cumulative µs)."""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        level = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        entries.append((name.strip(), level, int(self_us), int(cumulative_us)))
+    return entries
+
+def run_importtime(code, env=None):
+    """Jalankan `code` di interpreter baru dengan `-X importtime`; kembalikan (entries, stdout)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, cwd=ROOT, env=env, check=True,
+    )
+    return parse_importtime(result.stderr), result.stdout
+
+def top_level_total_ms(entries):
+    """Total waktu import (ms) = jumlah cumulative modul level teratas."""
+    return sum(cumulative for _, level, _, cumulative in entries if level == 0) / 1000
+
+def main(repeat=5, top=15, budget_ms=None):
+    env = dict(os.environ)
+    env.pop("DATABASE_URL", None)
+
+    import_totals = []
+    for _ in range(repeat):
+        entries, _ = run_importtime("import main", env)
+        import_totals.append(top_level_total_ms(entries))
+    import_ms = statistics.median(import_totals)
+
+    with tempfile.TemporaryDirectory() as work_dir, FakeFashionStudioServer(total_pages=2, cards_per_page=5) as server:
+        code = CSV_RUN.format(base_url=server.base_url, output_dir=os.path.join(work_dir, "output"),
+                              cache_dir=os.path.join(work_dir, "cache", "pages"))
+        run_entries, stdout = run_importtime(code, env)
+    loaded = json.loads(stdout.strip().splitlines()[-1])
+    forbidden = sorted({name for name in loaded for prefix in FORBIDDEN_ON_CSV_PATH
+                        if name == prefix or name.startswith(prefix + ".")})
+
+    print(f"import main (median {repeat}x): {import_ms:.0f} ms")
+    print(f"run CSV-only lengkap: {top_level_total_ms(run_entries):.0f} ms waktu import\n")
+    print(f"{'modul':<40} {'cumulative (ms)':>16}")
+    top_level = sorted((entry for entry in run_entries if entry[1] == 0), key=lambda entry: entry[3], reverse=True)
+    for name, _, _, cumulative in top_level[:top]:
+        print(f"{name:<40} {cumulative / 1000:>16.1f}")
+
+    failed = False
+    if forbidden:
+        print(f"\nGAGAL: modul sink/backend lain ter-import pada run CSV-only: {', '.join(forbidden)}")
+        failed = True
+    if budget_ms is not None and import_ms > budget_ms:
+        print(f"\nGAGAL: import main {import_ms:.0f} ms melebihi budget {budget_ms:.0f} ms")
+        failed = True
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark cold start (python -X importtime) untuk run CSV-only.")
+    parser.add_argument("--repeat", type=int, default=5, help="Jumlah pengukuran `import main`.")
+    parser.add_argument("--top", type=int, default=15, help="Jumlah modul terberat yang dicetak.")
+    parser.add_argument("--budget-ms", type=float, help="Gagal (exit 1) jika median `import main` melebihi nilai ini.")
+    args = parser.parse_args()
+    sys.exit(main(args.repeat, args.top, args.budget_ms))
@@ -0,0 +1,55 @@
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+import numpy as np
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.catalog import synthetic_raw_frame
+from utils import transform
+
+def legacy_parse_columns(df, exchange_rate):
+    """Jalur lama: Series.apply dengan fungsi Python per baris."""
+    price = df['Price'].replace(['Price Not Found', 'Price Unavailable'], np.nan)
+    return (
+        price.apply(transform.clean_price) * exchange_rate,
+        df['Rating'].apply(transform.extract_rating),
+        df['Colors'].apply(transform.extract_colors),
+    )
+
+def vectorized_parse_columns(df, exchange_rate):
+    """Jalur baru: str.replace/str.extract dengan pd.to_numeric."""
+    price = df['Price'].replace(['Price Not Found', 'Price Unavailable'], np.nan)
+    return (
+        transform.clean_price_series(price) * exchange_rate,
+        transform.extract_rating_series(df['Rating']),
+        transform.extract_colors_series(df['Colors']),
+    )
+
+def timed(func, *args):
+    # Output print dari fungsi yang diukur tidak ikut dihitung di terminal
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - start
+    return result, elapsed
+
+def main(sizes, exchange_rate=16000):
+    print(f"{'baris':>10} {'apply (s)':>10} {'vektor (s)':>11} {'speedup':>8} {'transform_data (s)':>19}  hasil")
+    for rows in sizes:
+        df = synthetic_raw_frame(rows)
+        legacy, legacy_s = timed(legacy_parse_columns, df, exchange_rate)
+        vectorized, vector_s = timed(vectorized_parse_columns, df, exchange_rate)
+        _, full_s = timed(transform.transform_data, df, exchange_rate)
+        same = all(
+            np.array_equal(old.to_numpy(dtype=float), new.to_numpy(dtype=float), equal_nan=True)
+            for old, new in zip(legacy, vectorized)
+        )
+        print(f"{rows:>10} {legacy_s:>10.3f} {vector_s:>11.3f} {legacy_s / vector_s:>7.1f}x {full_s:>19.3f}  {'sama' if same else 'BERBEDA'}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark parsing kolom transform_data: apply vs vektor.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+    main(args.sizes)
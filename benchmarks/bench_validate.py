@@ -0,0 +1,63 @@
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+import numpy as np
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.catalog import synthetic_raw_frame
+from utils.transform import compact_dtypes, transform_data
+from utils.validate import Validator
+
+def legacy_checks(df):
+    """Jalur lama: filter judul hard-coded dan pengecekan null per kolom."""
+    df = df[df['Title'] != 'Unknown Product']
+    df = df[df['Price'].notna()]
+    for col in df.columns:
+        if df[col].isnull().any():
+            print(f"Peringatan: Masih ada nilai null di kolom {col}")
+    return df
+
+def many_failures(df):
+    """Salinan `df` dengan sekitar 2/3 baris melanggar satu atau dua aturan."""
+    df = df.copy()
+    position = np.arange(len(df))
+    df.loc[position % 3 != 0, 'Rating'] = 6.0
+    df.loc[position % 2 == 1, 'Price'] = -1.0
+    return df
+
+def best_time(func, repeat):
+    best, result = None, None
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            result = func()
+            elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def main(sizes, repeat=3):
+    print(f"{'baris':>10} {'tipe':<8} {'cek lama (s)':>13} {'validasi (s)':>13} {'baris/s':>12} {'karantina':>10}")
+    for rows in sizes:
+        with contextlib.redirect_stdout(io.StringIO()):
+            # Tanpa aturan: output transform_data sebelum divalidasi
+            cleaned = transform_data(synthetic_raw_frame(rows), validator=Validator(rules=()))
+        for label, df in (("default", cleaned), ("compact", compact_dtypes(cleaned)), ("gagal", many_failures(cleaned))):
+            legacy_s, _ = best_time(lambda: legacy_checks(df), repeat)
+            with tempfile.TemporaryDirectory() as work_dir:
+                path = os.path.join(work_dir, "quarantine.csv")
+                validate_s, _ = best_time(lambda: Validator(quarantine_path=path).apply(df), repeat)
+                validator = Validator()
+                with contextlib.redirect_stdout(io.StringIO()):
+                    validator.apply(df)
+            print(f"{rows:>10} {label:<8} {legacy_s:>13.3f} {validate_s:>13.3f} {rows / validate_s:>12,.0f} "
+                  f"{validator.rows_quarantined:>10}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark tahap validasi (Validator) vs pengecekan ad-hoc lama.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    main(args.sizes, args.repeat)
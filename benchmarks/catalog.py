@@ -0,0 +1,143 @@
+import random
+
+PRODUCT_TYPES = ["T-shirt", "Hoodie", "Pants", "Outerwear", "Jacket", "Shirt", "Dress", "Sweater"]
+SIZES = ["S", "M", "L", "XL", "XXL"]
+GENDERS = ["Men", "Women", "Unisex"]
+
+PAGE_HEADER = '''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <title>Fashion Studio</title>
+    <link rel="stylesheet" href="/static/style.css">
+    <script src="/static/app.js"></script>
+</head>
+<body>
+    <nav class="navbar">
+        <a class="navbar-brand" href="/">Fashion Studio</a>
+        <ul class="nav-links">
+            <li><a href="/">Home</a></li>
+            <li><a href="/collections">Collections</a></li>
+            <li><a href="/about">About</a></li>
+            <li><a href="/contact">Contact</a></li>
+        </ul>
+    </nav>
+    <section class="hero"><h1>Our Collection</h1><p>Discover the latest fashion trends.</p></section>
+    <div id="collectionList" class="collection-grid">
+'''
+
+PAGE_FOOTER = '''    <footer class="footer">
+        <p>&copy; Fashion Studio. All rights reserved.</p>
+        <p><a href="/privacy">Privacy</a> | <a href="/terms">Terms</a></p>
+    </footer>
+</body>
+</html>
+'''
+
+def product_fields(page_number, index, seed=0):
+    """Menghasilkan field produk sintetis yang deterministik untuk halaman dan posisi card."""
+    rng = random.Random(seed * 1_000_003 + page_number * 1_009 + index)
+    product_number = (page_number - 1) * 100 + index
+    title = f"{rng.choice(PRODUCT_TYPES)} {product_number}"
+    if rng.random() < 0.02:
+        return {
+            "title": "Unknown Product",
+            "price": "Price Unavailable",
+            "rating": "Invalid Rating / 5",
+            "colors": 5,
+            "size": "M",
+            "gender": "Men",
+        }
+    return {
+        "title": title,
+        "price": f"${rng.uniform(10, 500):.2f}",
+        "rating": f"{rng.uniform(1, 5):.1f} / 5",
+        "colors": rng.randint(1, 5),
+        "size": rng.choice(SIZES),
+        "gender": rng.choice(GENDERS),
+    }
+
+def render_card(fields):
+    """Render satu card produk dengan markup yang sama seperti Fashion Studio."""
+    price_tag = (
+        f'<span class="price">{fields["price"]}</span>'
+        if fields["price"].startswith("$")
+        else f'<p class="price">{fields["price"]}</p>'
+    )
+    return f'''        <div class="collection-card">
+            <div style="position: relative;">
+                <img src="/static/img/product.jpg" class="collection-image" alt="{fields["title"]}">
+            </div>
+            <div class="product-details">
+                <h3 class="product-title">{fields["title"]}</h3>
+                <div class="price-container">{price_tag}</div>
+                <p style="font-size: 14px; color: #777;">Rating: ⭐ {fields["rating"]}</p>
+                <p style="font-size: 14px; color: #777;">{fields["colors"]} Colors</p>
+                <p style="font-size: 14px; color: #777;">Size: {fields["size"]}</p>
+                <p style="font-size: 14px; color: #777;">Gender: {fields["gender"]}</p>
+            </div>
+        </div>
+'''
+
+def render_pagination(page_number, total_pages):
+    """Render navigasi halaman; tombol `page-item next` hanya ada jika bukan halaman terakhir."""
+    items = []
+    if page_number > 1:
+        items.append(f'<li class="page-item previous"><a class="page-link" href="/page{page_number - 1}">Previous</a></li>')
+    for number in range(max(1, page_number - 2), min(total_pages, page_number + 2) + 1):
+        active = " active" if number == page_number else ""
+        items.append(f'<li class="page-item{active}"><a class="page-link" href="/page{number}">{number}</a></li>')
+    if page_number < total_pages:
+        items.append(f'<li class="page-item next"><a class="page-link" href="/page{page_number + 1}">Next</a></li>')
+    return '    <ul class="pagination">\n        ' + "\n        ".join(items) + "\n    </ul>\n"
+
+def render_catalog_page(page_number, total_pages=50, cards_per_page=20, seed=0):
+    """Render satu halaman katalog lengkap (header, card produk, pagination, footer)."""
+    cards = "".join(
+        render_card(product_fields(page_number, index, seed))
+        for index in range(1, cards_per_page + 1)
+    )
+    if page_number > total_pages:
+        cards = ""
+    pagination = render_pagination(page_number, total_pages) if page_number <= total_pages else ""
+    return PAGE_HEADER + cards + "    </div>\n" + pagination + PAGE_FOOTER
+
+def synthetic_raw_frame(rows, seed=0, duplicate_ratio=0.05):
+    """DataFrame mentah sintetis dengan format kolom hasil `extract_product_data`.
+
+    Sebagian kecil baris adalah duplikat (selain Timestamp) dan produk tidak valid,
+    meniru data hasil scraping sebenarnya.
+    """
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(seed)
+    unique_rows = max(1, int(rows * (1 - duplicate_ratio)))
+    source = rng.integers(0, unique_rows, size=rows)
+    source[:unique_rows] = np.arange(unique_rows)
+
+    types = np.array(PRODUCT_TYPES)[rng.integers(0, len(PRODUCT_TYPES), size=unique_rows)]
+    titles = pd.Series(types).str.cat(pd.Series(np.arange(unique_rows)).astype(str), sep=" ")
+    prices = "$" + pd.Series(np.round(rng.uniform(10, 500, size=unique_rows), 2)).astype(str)
+    ratings = "⭐ " + pd.Series(np.round(rng.uniform(1, 5, size=unique_rows), 1)).astype(str) + " / 5"
+    colors = pd.Series(rng.integers(1, 6, size=unique_rows)).astype(str) + " Colors"
+    sizes = np.array(SIZES)[rng.integers(0, len(SIZES), size=unique_rows)]
+    genders = np.array(GENDERS)[rng.integers(0, len(GENDERS), size=unique_rows)]
+
+    invalid = rng.random(unique_rows) < 0.02
+    titles[invalid] = "Unknown Product"
+    prices[invalid] = "Price Unavailable"
+    ratings[invalid] = "⭐ Invalid Rating / 5"
+
+    base = pd.DataFrame({
+        "Title": titles.to_numpy(dtype=object),
+        "Price": prices.to_numpy(dtype=object),
+        "Rating": ratings.to_numpy(dtype=object),
+        "Colors": colors.to_numpy(dtype=object),
+        "Size": sizes.astype(object),
+        "Gender": genders.astype(object),
+    })
+    df = base.iloc[source].reset_index(drop=True)
+    start = pd.Timestamp("2025-05-01T00:00:00")
+    df["Timestamp"] = (start + pd.to_timedelta(np.arange(rows) // 20, unit="s")).strftime("%Y-%m-%dT%H:%M:%S.%f")
+    return df
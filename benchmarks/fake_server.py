@@ -0,0 +1,141 @@
+import argparse
+import hashlib
+import os
+import random
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.catalog import render_catalog_page
+
+PAGE_PATH = re.compile(r"^/(?:page(\d+))?/?$")
+
+class FakeFashionStudioServer:
+    """Server HTTP lokal yang menyajikan katalog sintetis dengan markup Fashion Studio.
+
+    `/` adalah halaman 1 dan `/pageN` halaman N; halaman setelah `total_pages` tidak berisi
+    card. `latency` (detik) ditambahkan ke setiap response dan `error_rate` adalah peluang
+    response 503, sehingga retry dan rate limit scraper ikut teruji. Response memakai ETag
+    agar conditional GET (PageCache) bisa menjawab 304. Dipakai sebagai context manager.
+    """
+
+    def __init__(self, total_pages=50, cards_per_page=20, latency=0.0, error_rate=0.0, seed=0, host="127.0.0.1", port=0):
+        self.total_pages = total_pages
+        self.cards_per_page = cards_per_page
+        self.latency = latency
+        self.error_rate = error_rate
+        self.seed = seed
+        self.requests = 0
+        self.errors = 0
+        self.not_modified = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._pages = {}
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def page(self, page_number):
+        """Konten (bytes) dan ETag halaman; hasil render disimpan agar server tidak jadi bottleneck."""
+        with self._lock:
+            if page_number not in self._pages:
+                html = render_catalog_page(page_number, self.total_pages, self.cards_per_page, self.seed)
+                content = html.encode("utf-8")
+                self._pages[page_number] = (content, f'"{hashlib.sha256(content).hexdigest()[:16]}"')
+            return self._pages[page_number]
+
+    def _should_fail(self):
+        with self._lock:
+            self.requests += 1
+            failed = self.error_rate > 0 and self._rng.random() < self.error_rate
+            if failed:
+                self.errors += 1
+            return failed
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Header dan body dikirim terpisah; tanpa ini delayed ACK menambah ~40 ms per request
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                if server.latency:
+                    time.sleep(server.latency)
+                match = PAGE_PATH.match(self.path)
+                if server._should_fail():
+                    self._send(503, b"Service Unavailable")
+                    return
+                if not match:
+                    self._send(404, b"Not Found")
+                    return
+
+                content, etag = server.page(int(match.group(1) or 1))
+                if self.headers.get("If-None-Match") == etag:
+                    with server._lock:
+                        server.not_modified += 1
+                    self._send(304, b"", etag=etag)
+                    return
+                self._send(200, content, etag=etag, content_type="text/html; charset=utf-8")
+
+            def _send(self, status, body, etag=None, content_type="text/plain"):
+                try:
+                    self.send_response(status)
+                    self.send_header("Content-Type", content_type)
+                    self.send_header("Content-Length", str(len(body)))
+                    if etag:
+                        self.send_header("ETag", etag)
+                    self.end_headers()
+                    if body:
+                        self.wfile.write(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    # Klien menutup koneksi, misalnya scraper yang dibatalkan
+                    self.close_connection = True
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        """Jalankan server di thread latar belakang."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="fake-fashion-studio", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Hentikan server dan tutup socket-nya."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Server lokal katalog Fashion Studio sintetis.")
+    parser.add_argument("--pages", type=int, default=50)
+    parser.add_argument("--cards", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.0, help="Latensi per response (detik).")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Peluang response 503 (0-1).")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+    server = FakeFashionStudioServer(args.pages, args.cards, args.latency, args.error_rate, port=args.port).start()
+    print(f"Fake Fashion Studio berjalan di {server.base_url} (Ctrl+C untuk berhenti)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
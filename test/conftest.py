@@ -0,0 +1,40 @@
+import os
+import shutil
+import socket
+import subprocess
+import tempfile
+import pytest
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+@pytest.fixture(scope="session")
+def postgres_url():
+    """URL PostgreSQL lokal untuk test integrasi.
+
+    Memakai TEST_POSTGRES_URL jika di-set; jika tidak, menjalankan server sementara
+    dengan initdb/pg_ctl selama sesi test. Test di-skip jika keduanya tidak tersedia.
+    """
+    url = os.environ.get("TEST_POSTGRES_URL")
+    if url:
+        yield url
+        return
+
+    initdb, pg_ctl = shutil.which("initdb"), shutil.which("pg_ctl")
+    if not (initdb and pg_ctl):
+        pytest.skip("PostgreSQL tidak tersedia (set TEST_POSTGRES_URL atau pasang initdb/pg_ctl)")
+
+    data_dir = tempfile.mkdtemp(prefix="etl-pg-")
+    port = _free_port()
+    subprocess.run([initdb, "-D", data_dir, "-U", "postgres", "-A", "trust"], check=True, capture_output=True)
+    subprocess.run(
+        [pg_ctl, "-D", data_dir, "-o", f"-p {port} -k {data_dir} -h 127.0.0.1", "-w", "start"],
+        check=True, capture_output=True,
+    )
+    try:
+        yield f"postgresql+psycopg2://postgres@127.0.0.1:{port}/postgres"
+    finally:
+        subprocess.run([pg_ctl, "-D", data_dir, "-m", "fast", "stop"], capture_output=True)
+        shutil.rmtree(data_dir, ignore_errors=True)
@@ -0,0 +1,84 @@
+import sys
+import os
+import asyncio
+import time
+import pytest
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.fake_server import FakeFashionStudioServer
+from utils.async_extract import async_scrape_fashion_studio, aiter_fashion_studio_pages, create_async_client
+from utils.cache import PageCache
+from utils.extract import scrape_fashion_studio
+
+def _without_timestamp(products):
+    return [{key: value for key, value in product.items() if key != "Timestamp"} for product in products]
+
+def test_async_scrape_matches_sync_scraper():
+    """Test versi async menghasilkan list of dict yang sama dengan scrape_fashion_studio."""
+    with FakeFashionStudioServer(total_pages=4, cards_per_page=5) as server:
+        expected = scrape_fashion_studio(server.base_url, delay=0)
+        data = asyncio.run(async_scrape_fashion_studio(server.base_url, delay=0, max_concurrency=3))
+
+    assert len(data) == 20
+    assert _without_timestamp(data) == _without_timestamp(expected)
+
+def test_async_scrape_retries_injected_errors():
+    """Test response 503 dicoba ulang sampai berhasil."""
+    with FakeFashionStudioServer(total_pages=5, cards_per_page=2, error_rate=0.3, seed=1) as server:
+        data = asyncio.run(async_scrape_fashion_studio(server.base_url, delay=0, max_retries=10,
+                                                       backoff_factor=0, backoff_jitter=0))
+
+        assert len(data) == 10
+        assert server.errors > 0
+
+def test_async_scrape_uses_page_cache(tmp_path):
+    """Test run kedua memakai conditional GET dan hasil parsing dari PageCache."""
+    cache = PageCache(str(tmp_path / "pages"))
+    with FakeFashionStudioServer(total_pages=3, cards_per_page=4) as server:
+        first = asyncio.run(async_scrape_fashion_studio(server.base_url, delay=0, cache=cache))
+        second = asyncio.run(async_scrape_fashion_studio(server.base_url, delay=0, cache=cache))
+
+        assert server.not_modified == 3
+    assert _without_timestamp(second) == _without_timestamp(first)
+
+def test_async_scrape_shared_semaphore_limits_concurrency():
+    """Test semaphore bersama membatasi request yang berjalan bersamaan."""
+    async def run(base_url):
+        semaphore = asyncio.Semaphore(1)
+        async with create_async_client() as client:
+            start = time.perf_counter()
+            data = await async_scrape_fashion_studio(base_url, delay=0, max_concurrency=4,
+                                                     client=client, semaphore=semaphore)
+            return data, time.perf_counter() - start
+
+    with FakeFashionStudioServer(total_pages=4, cards_per_page=1, latency=0.1) as server:
+        data, elapsed = asyncio.run(run(server.base_url))
+
+    assert len(data) == 4
+    assert elapsed >= 0.4
+
+def test_async_scrape_can_be_cancelled():
+    """Test membatalkan task menghentikan scraping tanpa menunggu request yang tersisa."""
+    async def run(base_url):
+        task = asyncio.create_task(async_scrape_fashion_studio(base_url, delay=0, max_concurrency=2))
+        await asyncio.sleep(0.2)
+        start = time.perf_counter()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        pending = [other for other in asyncio.all_tasks() if other is not asyncio.current_task()]
+        return time.perf_counter() - start, pending
+
+    with FakeFashionStudioServer(total_pages=20, cards_per_page=1, latency=0.5) as server:
+        elapsed, pending = asyncio.run(run(server.base_url))
+
+    assert elapsed < 0.4
+    assert pending == []
+
+def test_aiter_pages_rejects_unknown_parser():
+    """Test parser yang tidak dikenal ditolak sebelum request dikirim."""
+    async def run():
+        async for _ in aiter_fashion_studio_pages("http://127.0.0.1:1/", parser="regex"):
+            pass
+
+    with pytest.raises(ValueError, match="regex"):
+        asyncio.run(run())
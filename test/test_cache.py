@@ -0,0 +1,47 @@
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.cache import PageCache, content_hash
+
+PRODUCT = {"Title": "Item 1", "Price": "$100", "Rating": "⭐4/5", "Colors": "3 Colors",
+           "Size": "L", "Gender": "Male", "Timestamp": "2025-05-01T00:00:00"}
+
+def test_page_cache_put_and_get(tmp_path):
+    """Test entri cache tersimpan dan bisa dibaca kembali berdasarkan URL."""
+    cache = PageCache(str(tmp_path))
+    cache.put("https://dummy.com/", content_hash(b"html"), [PRODUCT], 1, True,
+              etag='"abc"', last_modified="Wed, 01 May 2025 00:00:00 GMT")
+
+    entry = cache.get("https://dummy.com/")
+
+    assert entry["products"] == [PRODUCT]
+    assert entry["has_next"] is True
+    assert entry["content_hash"] == content_hash(b"html")
+    assert cache.get("https://dummy.com/page2") is None
+
+def test_page_cache_conditional_headers(tmp_path):
+    """Test header conditional GET dibentuk dari ETag dan Last-Modified."""
+    entry = {"etag": '"abc"', "last_modified": "Wed, 01 May 2025 00:00:00 GMT"}
+
+    headers = PageCache.conditional_headers(entry)
+
+    assert headers == {"If-None-Match": '"abc"', "If-Modified-Since": "Wed, 01 May 2025 00:00:00 GMT"}
+    assert PageCache.conditional_headers(None) == {}
+
+def test_page_cache_evicts_least_recently_used(tmp_path):
+    """Test eviction menghapus entri yang paling lama tidak dipakai saat melebihi batas ukuran."""
+    cache = PageCache(str(tmp_path), max_bytes=10 * 1024 * 1024)
+    for page in range(3):
+        cache.put(f"https://dummy.com/page{page}", "hash", [PRODUCT] * 5, 5, True)
+        time.sleep(0.01)
+    entry_size = cache.size() // 3
+
+    cache.get("https://dummy.com/page0")  # page0 baru dipakai, page1 jadi yang tertua
+    cache.max_bytes = entry_size * 2 + entry_size // 2
+    removed = cache.evict()
+
+    assert removed == 1
+    assert cache.get("https://dummy.com/page1") is None
+    assert cache.get("https://dummy.com/page0") is not None
+    assert cache.get("https://dummy.com/page2") is not None
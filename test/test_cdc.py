@@ -0,0 +1,98 @@
+import sys
+import os
+import glob
+import pandas as pd
+from unittest.mock import patch
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.fake_server import FakeFashionStudioServer
+from utils.cdc import capture_changes, commit_state, read_state
+from utils.sinks import run_sinks
+from utils.transform import compact_dtypes
+import main as etl
+
+def _products(timestamp="2025-05-01T00:00:00"):
+    return pd.DataFrame({
+        'Title': ['Hoodie 1', 'Pants 2', 'Jacket 3'],
+        'Price': [800000.0, 480000.0, 1200000.0],
+        'Rating': [4.5, 3.9, 4.1],
+        'Colors': [3, 2, 5],
+        'Size': ['M', 'L', 'XL'],
+        'Gender': ['Unisex', 'Men', 'Women'],
+        'Timestamp': [timestamp] * 3,
+    })
+
+def test_first_run_inserts_everything(tmp_path):
+    """Test tanpa state sebelumnya, semua produk dianggap baru."""
+    changes = capture_changes(_products(), str(tmp_path / "state.csv"))
+
+    assert len(changes.inserted) == 3
+    assert changes.updated.empty and changes.deleted.empty
+    assert changes.initial
+    assert not changes.is_empty
+
+def test_changes_detected_against_previous_state(tmp_path):
+    """Test produk baru, berubah, dan hilang terdeteksi; perubahan Timestamp saja diabaikan."""
+    state_path = str(tmp_path / "state.csv")
+    commit_state(capture_changes(_products(), state_path), state_path)
+
+    current = _products(timestamp="2025-05-02T00:00:00")
+    current.loc[1, 'Price'] = 500000.0
+    current = current[current['Title'] != 'Jacket 3']
+    current = pd.concat([current, pd.DataFrame([{
+        'Title': 'Shirt 4', 'Price': 320000.0, 'Rating': 4.0, 'Colors': 1,
+        'Size': 'S', 'Gender': 'Men', 'Timestamp': "2025-05-02T00:00:00",
+    }])], ignore_index=True)
+
+    changes = capture_changes(current, state_path)
+
+    assert changes.inserted['Title'].tolist() == ['Shirt 4']
+    assert changes.updated['Title'].tolist() == ['Pants 2']
+    assert changes.deleted.to_dict('records') == [{'Title': 'Jacket 3', 'Size': 'XL', 'Gender': 'Women'}]
+    assert changes.unchanged == 1
+    assert changes.changed['Title'].tolist() == ['Shirt 4', 'Pants 2']
+
+def test_unchanged_catalog_is_empty_delta(tmp_path):
+    """Test katalog yang sama (termasuk versi compact dtypes) tidak menghasilkan delta."""
+    state_path = str(tmp_path / "state.csv")
+    commit_state(capture_changes(_products(), state_path), state_path)
+
+    changes = capture_changes(compact_dtypes(_products(timestamp="2025-05-03T00:00:00")), state_path)
+
+    assert changes.is_empty
+    assert changes.unchanged == 3
+
+def test_state_only_saved_on_commit(tmp_path):
+    """Test state index baru hanya ditulis lewat commit_state."""
+    state_path = str(tmp_path / "state.csv")
+    changes = capture_changes(_products(), state_path)
+    assert read_state(state_path) is None
+
+    commit_state(changes, state_path)
+
+    state = read_state(state_path)
+    assert state['Title'].tolist() == ['Hoodie 1', 'Pants 2', 'Jacket 3']
+    assert state['_row_hash'].dtype == 'uint64'
+
+def test_main_changes_only_overwrites_sheet_first_and_writes_deletions(tmp_path):
+    """Test run pertama menulis ulang Sheet (bukan append) dan produk yang hilang ditulis ke file *_deleted."""
+    output_dir = str(tmp_path / "output")
+    calls = []
+
+    def fake_run_sinks(df, sinks):
+        calls.append(sinks)
+        # Sink file tetap ditulis; Google Sheets hanya dicatat opsinya
+        return run_sinks(df, {name: options for name, options in sinks.items() if name != "gsheet"})
+
+    with FakeFashionStudioServer(total_pages=2, cards_per_page=5) as server, \
+         patch("main.run_sinks", side_effect=fake_run_sinks):
+        for max_pages in (2, 1):
+            etl.main(base_url=server.base_url, spreadsheet_id="dummy_id", output_dir=output_dir,
+                     cache_dir=str(tmp_path / "cache" / "pages"), delay=0, max_pages=max_pages,
+                     changes_only=True, sinks=("csv", "gsheet"))
+
+    assert "mode" not in calls[0]["gsheet"]
+    assert "mode" not in calls[1]["gsheet"]
+    [deleted_path] = glob.glob(os.path.join(output_dir, "fashion_products_deleted_*.csv"))
+    deleted = pd.read_csv(deleted_path)
+    assert list(deleted.columns) == ["Title", "Size", "Gender"]
+    assert len(deleted) > 0
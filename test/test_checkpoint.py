@@ -0,0 +1,87 @@
+import sys
+import os
+import pytest
+from unittest.mock import patch
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils import extract
+from utils.checkpoint import CrawlCheckpoint
+
+BASE_URL = "https://dummy.com/"
+
+def _catalog_page(title, has_next=True):
+    """Membuat HTML satu halaman katalog sederhana untuk test."""
+    html = f'<div class="collection-card"><h3 class="product-title">{title}</h3><span class="price">$100</span></div>'
+    if has_next:
+        html += '<li class="page-item next"></li>'
+    return html.encode("utf-8")
+
+@pytest.fixture
+def checkpoint(tmp_path):
+    with CrawlCheckpoint(str(tmp_path / "crawl.sqlite")) as checkpoint:
+        yield checkpoint
+
+def test_checkpoint_save_and_resume_state(checkpoint):
+    """Test halaman tersimpan urut, bisa dilanjutkan, dan tidak bisa dilanjutkan setelah selesai."""
+    checkpoint.save_page(BASE_URL, 2, [{"Title": "Item 2"}])
+    checkpoint.save_page(BASE_URL, 1, [{"Title": "Item 1"}])
+
+    assert list(checkpoint.iter_pages(BASE_URL)) == [(1, [{"Title": "Item 1"}]), (2, [{"Title": "Item 2"}])]
+    assert checkpoint.last_page(BASE_URL) == 1
+    assert checkpoint.can_resume(BASE_URL)
+    assert not checkpoint.can_resume("https://lain.com/")
+
+    checkpoint.mark_finished(BASE_URL)
+    assert not checkpoint.can_resume(BASE_URL)
+
+    checkpoint.reset(BASE_URL)
+    assert list(checkpoint.iter_pages(BASE_URL)) == []
+    assert checkpoint.last_page(BASE_URL) is None
+
+def test_checkpoint_persists_across_connections(tmp_path):
+    """Test progres tetap ada setelah checkpoint dibuka ulang (run berikutnya)."""
+    path = str(tmp_path / "crawl.sqlite")
+    with CrawlCheckpoint(path) as checkpoint:
+        checkpoint.save_page(BASE_URL, 1, [{"Title": "Item 1"}])
+
+    with CrawlCheckpoint(path) as checkpoint:
+        assert checkpoint.can_resume(BASE_URL)
+        assert list(checkpoint.iter_pages(BASE_URL)) == [(1, [{"Title": "Item 1"}])]
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+@patch("utils.extract.fetching_content")
+def test_scrape_resumes_after_failed_page(mock_fetching, checkpoint, max_workers):
+    """Test crawl yang gagal di halaman 3 dilanjutkan dari halaman 3 tanpa mengambil ulang halaman 1-2."""
+    pages = {
+        BASE_URL: _catalog_page("Item 1"),
+        f"{BASE_URL}page2": _catalog_page("Item 2"),
+        f"{BASE_URL}page3": _catalog_page("Item 3"),
+        f"{BASE_URL}page4": _catalog_page("Item 4", has_next=False),
+    }
+    mock_fetching.side_effect = lambda url, session=None: None if url.endswith("page3") else pages.get(url)
+
+    first = extract.scrape_fashion_studio(BASE_URL, delay=0, max_workers=max_workers, checkpoint=checkpoint)
+    assert [item["Title"] for item in first] == ["Item 1", "Item 2"]
+    assert checkpoint.last_page(BASE_URL) == 2
+
+    fetched = []
+    def fake_fetch(url, session=None):
+        fetched.append(url)
+        return pages.get(url)
+    mock_fetching.side_effect = fake_fetch
+
+    resumed = extract.scrape_fashion_studio(BASE_URL, delay=0, max_workers=max_workers, checkpoint=checkpoint, resume=True)
+
+    assert [item["Title"] for item in resumed] == ["Item 1", "Item 2", "Item 3", "Item 4"]
+    assert BASE_URL not in fetched and f"{BASE_URL}page2" not in fetched
+    assert not checkpoint.can_resume(BASE_URL)
+
+@patch("utils.extract.fetching_content")
+def test_scrape_without_resume_starts_over(mock_fetching, checkpoint):
+    """Test run tanpa resume mengabaikan progres lama dan mengambil dari halaman awal."""
+    checkpoint.save_page(BASE_URL, 1, [{"Title": "Lama"}])
+    mock_fetching.side_effect = lambda url, session=None: _catalog_page("Item 1", has_next=False)
+
+    result = extract.scrape_fashion_studio(BASE_URL, delay=0, checkpoint=checkpoint)
+
+    assert [item["Title"] for item in result] == ["Item 1"]
+    assert list(checkpoint.iter_pages(BASE_URL))[0][1][0]["Title"] == "Item 1"
@@ -0,0 +1,100 @@
+import sys
+import os
+import glob
+import pytest
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.fake_server import FakeFashionStudioServer
+from utils.config import DEFAULTS, RunConfig, load_config, resolve_config
+import main as etl
+
+def test_load_config_toml_maps_sections_to_main_parameters(tmp_path):
+    """Test kunci per bagian TOML dipetakan ke nama parameter `main`."""
+    path = tmp_path / "config.toml"
+    path.write_text(
+        '[fetch]\nworkers = 8\nparser = "lxml"\n'
+        '[output]\nformats = ["csv", "parquet"]\n'
+        '[sinks]\nenabled = "postgres"\nbatch_size = 500\n'
+    )
+
+    params = load_config(str(path))
+
+    assert params == {
+        "max_workers": 8,
+        "parser": "lxml",
+        "output_formats": ("csv", "parquet"),
+        "sinks": ("postgres",),
+        "batch_size": 500,
+    }
+
+def test_load_config_yaml(tmp_path):
+    """Test konfigurasi YAML memberi hasil yang sama dengan TOML."""
+    pytest.importorskip("yaml")
+    path = tmp_path / "config.yaml"
+    path.write_text("source:\n  max_pages: 3\n  delay: 0\ntransform:\n  compact: true\n")
+
+    assert load_config(str(path)) == {"max_pages": 3, "delay": 0, "compact": True}
+
+@pytest.mark.parametrize("content, message", [
+    ("[fetch]\nworkerz = 2\n", "fetch.workerz"),
+    ("[network]\nworkers = 2\n", "[network]"),
+    ('[output]\nformats = ["xlsx"]\n', "xlsx"),
+])
+def test_load_config_rejects_unknown_keys(tmp_path, content, message):
+    """Test salah ketik di file konfigurasi menimbulkan error, bukan diabaikan."""
+    path = tmp_path / "config.toml"
+    path.write_text(content)
+
+    with pytest.raises(ValueError, match=message):
+        load_config(str(path))
+
+def test_config_precedence_defaults_file_cli(tmp_path):
+    """Test urutan prioritas: default < file konfigurasi < opsi CLI."""
+    path = tmp_path / "config.toml"
+    path.write_text("[fetch]\nworkers = 8\nparse_workers = 2\n")
+
+    args = etl.build_parser().parse_args(["--config", str(path), "--workers", "3"])
+    config = etl.config_from_args(args)
+
+    assert config["max_workers"] == 3
+    assert config["parse_workers"] == 2
+    assert config["streaming"] is False
+    assert config["base_url"] == DEFAULTS["base_url"]
+    assert resolve_config() == DEFAULTS
+
+def test_main_dry_run_writes_no_sink(tmp_path):
+    """Test dry-run mengambil dan mentransformasi data tanpa menulis file output."""
+    output_dir = str(tmp_path / "output")
+    with FakeFashionStudioServer(total_pages=2, cards_per_page=5) as server:
+        run_metrics = etl.main(base_url=server.base_url, spreadsheet_id="", output_dir=output_dir,
+                               cache_dir=str(tmp_path / "cache" / "pages"), delay=0, dry_run=True)
+
+    assert glob.glob(os.path.join(output_dir, "fashion_products_*")) == []
+    assert run_metrics.report()["stages"]["transform.columns"]["rows_out"] > 0
+    assert "load.csv" not in run_metrics.report()["stages"]
+
+def test_main_accepts_run_config(tmp_path):
+    """Test `main` menerima RunConfig hasil konfigurasi, dan opsi yang tidak dikenal ditolak."""
+    output_dir = str(tmp_path / "output")
+    with FakeFashionStudioServer(total_pages=2, cards_per_page=5) as server:
+        config = RunConfig(**resolve_config(overrides={"base_url": server.base_url, "output_dir": output_dir}))
+        etl.main(config, spreadsheet_id="", cache_dir=str(tmp_path / "cache" / "pages"), delay=0, sinks=("csv",))
+
+    assert len(glob.glob(os.path.join(output_dir, "fashion_products_*.csv"))) == 1
+    with pytest.raises(TypeError):
+        etl.main(max_worker=2)
+
+def test_load_config_sources(tmp_path):
+    """Test tabel [[sources]] dibaca sebagai daftar sumber dan kunci yang salah ditolak."""
+    path = tmp_path / "config.toml"
+    path.write_text(
+        '[[sources]]\nname = "a"\nbase_url = "https://a.example.com/"\nrequests_per_second = 2\n'
+        '[[sources]]\nname = "b"\nbase_url = "https://b.example.com/"\n'
+    )
+    assert load_config(str(path)) == {"sources": (
+        {"name": "a", "base_url": "https://a.example.com/", "requests_per_second": 2},
+        {"name": "b", "base_url": "https://b.example.com/"},
+    )}
+
+    path.write_text('[[sources]]\nname = "a"\nurl = "https://a.example.com/"\n')
+    with pytest.raises(ValueError, match="sources.url"):
+        load_config(str(path))
@@ -1,11 +1,13 @@
 import sys
 import os
+import time
 import pytest
 from unittest.mock import patch, Mock
 from bs4 import BeautifulSoup
 from datetime import datetime
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils import extract
+from utils.cache import PageCache
 
 @patch("utils.extract.requests.Session")
 def test_fetching_content_success(mock_session):
@@ -183,6 +185,271 @@ def test_scrape_fashion_studio_error_handling(mock_fetching):
     assert isinstance(result, list)
     assert len(result) == 0
 
+def _catalog_page(title, has_next=True):
+    """Membuat HTML satu halaman katalog sederhana untuk test."""
+    html = f'''
+    <div class="collection-card">
+        <h3 class="product-title">{title}</h3>
+        <span class="price">$100</span>
+        <p style="font-size: 14px;">Rating: ⭐4/5</p>
+        <p style="font-size: 14px;">Colors: 3 Colors</p>
+        <p style="font-size: 14px;">Size: L</p>
+        <p style="font-size: 14px;">Gender: Male</p>
+    </div>
+    '''
+    if has_next:
+        html += '<li class="page-item next"></li>'
+    return html.encode("utf-8")
+
+@patch("utils.extract.fetching_content")
+def test_scrape_fashion_studio_concurrent_keeps_page_order(mock_fetching):
+    """Test mode paralel: hasil tetap urut halaman dan berhenti saat tidak ada tombol next."""
+    pages = {
+        "https://dummy.com/": _catalog_page("Item 1"),
+        "https://dummy.com/page2": _catalog_page("Item 2"),
+        "https://dummy.com/page3": _catalog_page("Item 3", has_next=False),
+        "https://dummy.com/page4": _catalog_page("Item 4"),
+    }
+
+    def fake_fetch(url, session=None):
+        # Halaman awal sengaja dibuat paling lambat agar urutan selesai acak
+        if url == "https://dummy.com/":
+            time.sleep(0.05)
+        return pages.get(url)
+
+    mock_fetching.side_effect = fake_fetch
+
+    result = extract.scrape_fashion_studio("https://dummy.com/", max_workers=4, requests_per_second=None, delay=0)
+
+    assert [item["Title"] for item in result] == ["Item 1", "Item 2", "Item 3"]
+
+@patch("utils.extract.fetching_content")
+def test_scrape_fashion_studio_concurrent_stops_on_empty_page(mock_fetching):
+    """Test mode paralel berhenti pada halaman tanpa collection-card."""
+    pages = {
+        "https://dummy.com/": _catalog_page("Item 1"),
+        "https://dummy.com/page2": b"<p>Tidak ada produk</p>",
+        "https://dummy.com/page3": _catalog_page("Item 3"),
+    }
+    mock_fetching.side_effect = lambda url, session=None: pages.get(url)
+
+    result = extract.scrape_fashion_studio("https://dummy.com/", max_workers=3, max_pages=3, delay=0)
+
+    assert [item["Title"] for item in result] == ["Item 1"]
+
+@patch("utils.extract.fetching_content")
+def test_scrape_fashion_studio_parse_workers_keep_page_order(mock_fetching):
+    """Test parsing di proses terpisah: hasil sama dengan parsing biasa dan tetap urut halaman."""
+    pages = {f"https://dummy.com/page{number}": _catalog_page(f"Item {number}") for number in range(2, 6)}
+    pages["https://dummy.com/"] = _catalog_page("Item 1")
+    pages["https://dummy.com/page6"] = _catalog_page("Item 6", has_next=False)
+
+    def fake_fetch(url, session=None):
+        # Halaman awal sengaja dibuat paling lambat agar urutan selesai acak
+        if url == "https://dummy.com/":
+            time.sleep(0.05)
+        return pages.get(url)
+
+    mock_fetching.side_effect = fake_fetch
+
+    result = extract.scrape_fashion_studio("https://dummy.com/", max_workers=2, parse_workers=2, delay=0)
+    expected = extract.scrape_fashion_studio("https://dummy.com/", delay=0)
+
+    assert [item["Title"] for item in result] == [f"Item {number}" for number in range(1, 7)]
+    assert [{k: v for k, v in item.items() if k != "Timestamp"} for item in result] == \
+        [{k: v for k, v in item.items() if k != "Timestamp"} for item in expected]
+
+def test_process_page_records_parse_time_from_parser_process():
+    """Test lama parsing dari proses parser ikut tercatat di metrik halaman."""
+    from utils import metrics
+    page = extract.FetchedPage("https://dummy.com/", _catalog_page("Item 1"))
+    parsed = extract.parse_page(page.content, "html.parser")
+
+    run = metrics.start_run()
+    try:
+        extract.process_page(page, parsed=parsed, parse_seconds=0.25)
+    finally:
+        metrics.finish_run()
+
+    assert run.pages[0]["parse_seconds"] >= 0.25
+
+def test_rate_limiter_spaces_requests():
+    """Test RateLimiter memberi jarak antar request sesuai batas per detik."""
+    limiter = extract.RateLimiter(requests_per_second=50)
+    start = time.monotonic()
+    for _ in range(5):
+        limiter.wait()
+    elapsed = time.monotonic() - start
+
+    # 5 request dengan 50 rps butuh minimal 4 interval 0.02 detik
+    assert elapsed >= 0.08
+
+def test_create_session_retry_configuration():
+    """Test create_session memasang connection pool dan retry untuk 429/5xx."""
+    session = extract.create_session(pool_size=8, max_retries=3)
+    adapter = session.get_adapter("https://example.com")
+
+    assert adapter._pool_maxsize == 8
+    assert adapter.max_retries.total == 3
+    assert 429 in adapter.max_retries.status_forcelist
+    assert 503 in adapter.max_retries.status_forcelist
+    assert adapter.max_retries.respect_retry_after_header is True
+    assert session.headers["Connection"] == "keep-alive"
+    session.close()
+
+@patch("utils.extract.fetching_content")
+def test_scrape_fashion_studio_reuses_session(mock_fetching):
+    """Test scrape_fashion_studio memakai satu session yang sama untuk semua halaman."""
+    mock_fetching.side_effect = [_catalog_page("Item 1"), _catalog_page("Item 2", has_next=False)]
+    session = Mock()
+
+    extract.scrape_fashion_studio("https://dummy.com/", delay=0, session=session)
+
+    sessions = [call.kwargs["session"] for call in mock_fetching.call_args_list]
+    assert sessions == [session, session]
+    session.close.assert_not_called()
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "fixtures")
+
+@pytest.mark.parametrize("backend", ["lxml", "selectolax"])
+def test_parse_page_backends_match_html_parser(backend):
+    """Test setiap backend parser menghasilkan record yang sama dengan html.parser."""
+    with open(os.path.join(FIXTURE_DIR, "page1.html"), "rb") as f:
+        content = f.read()
+
+    expected, expected_cards, expected_next = extract.parse_page(content, "html.parser")
+    result, card_count, has_next = extract.parse_page(content, backend)
+
+    strip = lambda rows: [{k: v for k, v in row.items() if k != "Timestamp"} for row in rows]
+    assert strip(result) == strip(expected)
+    assert card_count == expected_cards == 20
+    assert has_next is expected_next is True
+
+@pytest.mark.parametrize("backend", ["html.parser", "lxml", "selectolax"])
+def test_parse_page_last_page_has_no_next(backend):
+    """Test halaman terakhir tidak memiliki tombol page-item next di semua backend."""
+    with open(os.path.join(FIXTURE_DIR, "page50.html"), "rb") as f:
+        content = f.read()
+
+    _, card_count, has_next = extract.parse_page(content, backend)
+
+    assert card_count == 20
+    assert has_next is False
+
+def test_parse_page_fallback_warns_once(capsys):
+    """Test backend yang paketnya tidak terpasang turun ke html.parser dengan satu peringatan saja."""
+    with open(os.path.join(FIXTURE_DIR, "page1.html"), "rb") as f:
+        content = f.read()
+
+    extract.resolve_parser.cache_clear()
+    try:
+        with patch("utils.extract._module_available", return_value=False):
+            results = [extract.parse_page(content, "selectolax") for _ in range(3)]
+    finally:
+        extract.resolve_parser.cache_clear()
+
+    out = capsys.readouterr().out
+    assert out.count("Paket selectolax tidak tersedia") == 1
+    assert out.count("Paket lxml tidak tersedia") == 1
+    assert all(card_count == 20 for _, card_count, _ in results)
+
+def test_scrape_fashion_studio_unknown_parser():
+    """Test parser yang tidak dikenal langsung ditolak."""
+    with pytest.raises(ValueError):
+        extract.scrape_fashion_studio("https://dummy.com/", parser="regex")
+
+def _mock_response(status_code, content=b"", headers=None):
+    response = Mock()
+    response.status_code = status_code
+    response.content = content
+    response.headers = headers or {}
+    return response
+
+def test_scrape_fashion_studio_reuses_cache_on_not_modified(tmp_path):
+    """Test halaman yang dijawab 304 tidak di-parsing ulang dan memakai record dari cache dengan Timestamp baru."""
+    cache = PageCache(str(tmp_path))
+    session = Mock()
+    session.get.return_value = _mock_response(200, _catalog_page("Item 1", has_next=False), {"ETag": '"v1"'})
+
+    first = extract.scrape_fashion_studio("https://dummy.com/", delay=0, session=session, cache=cache)
+
+    session.get.return_value = _mock_response(304)
+    with patch("utils.extract.parse_page") as mock_parse:
+        second = extract.scrape_fashion_studio("https://dummy.com/", delay=0, session=session, cache=cache)
+
+    mock_parse.assert_not_called()
+    without_timestamp = lambda products: [{k: v for k, v in p.items() if k != "Timestamp"} for p in products]
+    assert without_timestamp(second) == without_timestamp(first)
+    # Record dari cache mendapat Timestamp run ini, bukan Timestamp run sebelumnya
+    assert second[0]["Timestamp"] > first[0]["Timestamp"]
+    assert session.get.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+
+def test_fetch_page_detects_unchanged_content_hash(tmp_path):
+    """Test konten dengan hash yang sama dianggap tidak berubah meski server tidak mendukung 304."""
+    cache = PageCache(str(tmp_path))
+    content = _catalog_page("Item 1")
+    session = Mock()
+    session.get.return_value = _mock_response(200, content)
+
+    page = extract.fetch_page("https://dummy.com/", session=session, cache=cache)
+    extract.process_page(page, cache=cache)
+    page_again = extract.fetch_page("https://dummy.com/", session=session, cache=cache)
+
+    assert page.cached is None
+    assert page_again.cached is not None
+    assert page_again.cached["products"][0]["Title"] == "Item 1"
+
+@patch("utils.extract.fetching_content")
+def test_iter_fashion_studio_pages_yields_per_page(mock_fetching):
+    """Test generator menghasilkan satu batch produk untuk setiap halaman."""
+    mock_fetching.side_effect = [_catalog_page("Item 1"), _catalog_page("Item 2", has_next=False)]
+
+    batches = extract.iter_fashion_studio_pages("https://dummy.com/", delay=0, session=Mock())
+    first = next(batches)
+
+    assert [item["Title"] for item in first] == ["Item 1"]
+    assert mock_fetching.call_count == 1  # Halaman berikutnya belum diambil
+    assert [[item["Title"] for item in batch] for batch in batches] == [["Item 2"]]
+
+@pytest.mark.parametrize("text, expected", [
+    ("Rating: ⭐ 4.8 / 5", ("Rating", "⭐ 4.8 / 5")),
+    ("3 Colors", ("Colors", "3 Colors")),
+    ("Size: M", ("Size", "M")),
+    ("Gender: Women", ("Gender", "Women")),
+    ("Rating:Invalid Rating", ("Rating", "Invalid Rating")),
+    ("Discount: 10%", None),
+])
+def test_parse_detail_line(text, expected):
+    """Test label detail card dipetakan ke kolom yang benar."""
+    assert extract.parse_detail_line(text) == expected
+
+def test_typed_product_matches_transform_rules():
+    """Test record bertipe sama dengan hasil clean_price/extract_rating/extract_colors."""
+    from utils import transform
+    products = [
+        {"Title": "A", "Price": "$1,234.50", "Rating": "⭐ 4.8 / 5", "Colors": "3 Colors", "Size": "M", "Gender": "Men"},
+        {"Title": "B", "Price": "Price Unavailable", "Rating": "Invalid Rating / 5", "Colors": "-", "Size": "L", "Gender": "Women"},
+    ]
+    for product in products:
+        typed = extract.typed_product(product)
+        for column, parse in (("Price", transform.clean_price), ("Rating", transform.extract_rating)):
+            expected = parse(product[column])
+            assert typed[column] == expected or (expected != expected and typed[column] != typed[column])
+        assert typed["Colors"] == transform.extract_colors(product["Colors"])
+        assert typed["Size"] == product["Size"]
+
+@patch("utils.extract.fetching_content")
+def test_iter_fashion_studio_pages_typed_records(mock_fetching):
+    """Test typed=True menghasilkan Price/Rating/Colors bertipe tanpa mengubah kolom lain."""
+    mock_fetching.side_effect = [_catalog_page("Item 1", has_next=False)]
+
+    [batch] = extract.iter_fashion_studio_pages("https://dummy.com/", delay=0, session=Mock(), typed=True)
+
+    assert isinstance(batch[0]["Price"], float)
+    assert isinstance(batch[0]["Rating"], float)
+    assert isinstance(batch[0]["Colors"], int)
+    assert batch[0]["Title"] == "Item 1"
+
 if __name__ == "__main__":
     # Contoh penggunaan fungsi scrape_fashion_studio
     data = extract.scrape_fashion_studio("https://fashion-studio.dicoding.dev/", start_page=1, delay=1)
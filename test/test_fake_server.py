@@ -0,0 +1,39 @@
+import sys
+import os
+import glob
+import pandas as pd
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.fake_server import FakeFashionStudioServer
+from utils.extract import scrape_fashion_studio, create_session
+import main as etl
+
+def test_scrape_against_fake_server():
+    """Test scraper membaca seluruh katalog sintetis dan berhenti di halaman terakhir."""
+    with FakeFashionStudioServer(total_pages=3, cards_per_page=5) as server:
+        data = scrape_fashion_studio(server.base_url, delay=0)
+
+        assert len(data) == 15
+        assert server.requests == 3
+
+def test_fake_server_injected_errors_are_retried():
+    """Test response 503 yang disuntikkan server dipulihkan oleh retry session."""
+    with FakeFashionStudioServer(total_pages=5, cards_per_page=2, error_rate=0.3, seed=1) as server:
+        session = create_session(max_retries=10, backoff_factor=0, backoff_jitter=0)
+        data = scrape_fashion_studio(server.base_url, delay=0, session=session)
+
+        assert len(data) == 10
+        assert server.errors > 0
+
+def test_main_end_to_end_against_fake_server(tmp_path):
+    """Test pipeline `main` lengkap menulis CSV dan laporan metrik dari server lokal."""
+    output_dir = str(tmp_path / "output")
+    with FakeFashionStudioServer(total_pages=2, cards_per_page=10) as server:
+        run_metrics = etl.main(base_url=server.base_url, spreadsheet_id="", output_dir=output_dir,
+                               cache_dir=str(tmp_path / "cache" / "pages"), delay=0)
+
+    csv_files = glob.glob(os.path.join(output_dir, "fashion_products_*.csv"))
+    report_files = glob.glob(os.path.join(output_dir, "run_report_*.json"))
+    assert len(csv_files) == 1 and len(report_files) == 1
+    df = pd.read_csv(csv_files[0])
+    assert 0 < len(df) <= 20
+    assert run_metrics.report()["stages"]["load.csv"]["rows_in"] == len(df)
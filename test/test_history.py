@@ -0,0 +1,116 @@
+import sys
+import os
+import pandas as pd
+import pytest
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.fake_server import FakeFashionStudioServer
+from utils.history import HistoryStore, save_to_history
+from utils.pipeline import stream_pipeline
+from utils.transform import compact_dtypes
+import main as etl
+
+def _frame(rows):
+    """DataFrame dengan kolom hasil transform_data dari list (title, size, price)."""
+    return pd.DataFrame([
+        {"Title": title, "Price": price, "Rating": 4.5, "Colors": 3, "Size": size,
+         "Gender": "Men", "Timestamp": "2025-05-01T00:00:00"}
+        for title, size, price in rows
+    ])
+
+@pytest.fixture
+def store(tmp_path):
+    with HistoryStore(str(tmp_path / "history.sqlite")) as store:
+        yield store
+
+def test_append_run_and_latest_snapshot(store):
+    """Test snapshot run terakhir berisi data run itu dengan kolom seperti transform_data."""
+    store.append_run(_frame([("Shirt", "M", 100.0)]), run_at="2025-05-01T00:00:00")
+    df = _frame([("Shirt", "M", 120.0), ("Pants", "L", 80.0)])
+    store.append_run(compact_dtypes(df), run_at="2025-05-02T00:00:00")
+
+    snapshot = store.latest_snapshot()
+
+    assert list(snapshot.columns) == list(df.columns)
+    assert snapshot[["Title", "Price"]].values.tolist() == [["Shirt", 120.0], ["Pants", 80.0]]
+    assert store.runs()["row_count"].tolist() == [1, 2]
+
+def test_price_history_per_product(store):
+    """Test riwayat harga satu produk urut run, bisa difilter per Size dan tanggal."""
+    for day, price in enumerate([100.0, 90.0, 95.0], start=1):
+        store.append_run(_frame([("Shirt", "M", price), ("Shirt", "L", price + 1), ("Pants", "M", 50.0)]),
+                         run_at=f"2025-05-0{day}T00:00:00")
+
+    history = store.price_history("Shirt", size="M")
+    assert history["Price"].tolist() == [100.0, 90.0, 95.0]
+    assert len(store.price_history("Shirt")) == 6
+    assert store.price_history("Shirt", size="M", since="2025-05-02")["Price"].tolist() == [90.0, 95.0]
+
+def test_diff_runs_reports_new_removed_and_changed(store):
+    """Test diff dua run terakhir hanya berisi produk baru, dihapus, dan berubah."""
+    store.append_run(_frame([("Shirt", "M", 100.0), ("Pants", "M", 50.0), ("Hat", "S", 10.0)]))
+    store.append_run(_frame([("Shirt", "M", 110.0), ("Pants", "M", 50.0), ("Jacket", "L", 200.0)]))
+
+    diff = store.diff_runs().set_index("Title")
+
+    assert diff["status"].to_dict() == {"Hat": "dihapus", "Jacket": "baru", "Shirt": "berubah"}
+    assert diff.loc["Shirt", "price_change"] == 10.0
+
+def test_append_keeps_last_row_per_product(store):
+    """Test produk yang muncul dua kali dalam satu run disimpan sekali (baris terakhir)."""
+    store.append_run(_frame([("Shirt", "M", 100.0), ("Shirt", "M", 105.0)]))
+
+    assert store.latest_snapshot()["Price"].tolist() == [105.0]
+
+def test_products_are_kept_per_source(store):
+    """Test produk yang sama dari dua sumber tidak saling menimpa dan bisa difilter per Source."""
+    shop_a = _frame([("Shirt", "M", 100.0), ("Pants", "L", 80.0)]).assign(Source="shop-a")
+    shop_b = _frame([("Shirt", "M", 90.0), ("Pants", "L", 70.0)]).assign(Source="shop-b")
+    store.append_run(pd.concat([shop_a, shop_b], ignore_index=True))
+
+    snapshot = store.latest_snapshot()
+
+    assert store.runs()["row_count"].tolist() == [4]
+    assert snapshot[["Source", "Price"]].values.tolist() == [
+        ["shop-a", 100.0], ["shop-a", 80.0], ["shop-b", 90.0], ["shop-b", 70.0],
+    ]
+    assert store.price_history("Shirt", source="shop-b")["Price"].tolist() == [90.0]
+
+def test_importing_sinks_does_not_load_scraper():
+    """Test sink history (dan registry sink) tidak meng-import scraper maupun httpx."""
+    import subprocess
+    code = ("import sys, utils.sinks; heavy = ('utils.scheduler', 'utils.async_extract', 'utils.extract', 'httpx'); "
+            "print(sorted(m for m in sys.modules if m.startswith(heavy)))")
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, cwd=root, check=True)
+
+    assert result.stdout.strip() == "[]"
+
+def test_save_to_history_sink(tmp_path):
+    """Test sink history mengembalikan True dan gagal dengan False."""
+    path = str(tmp_path / "history.sqlite")
+    assert save_to_history(_frame([("Shirt", "M", 100.0)]), path) is True
+    assert save_to_history(pd.DataFrame({"Title": ["x"]}), path) is False
+
+def test_stream_pipeline_appends_batches_to_one_run(store):
+    """Test semua batch streaming masuk ke satu run yang sama."""
+    product = {"Rating": "⭐4.0/5", "Colors": "2 Colors", "Size": "M", "Gender": "Men",
+               "Timestamp": "2025-05-01T00:00:00"}
+    pages = iter([[{"Title": "Item 1", "Price": "$10", **product}], [{"Title": "Item 2", "Price": "$20", **product}]])
+
+    stream_pipeline(pages, exchange_rate=1, history=store)
+
+    runs = store.runs()
+    assert len(runs) == 1 and runs["row_count"].iloc[0] == 2
+
+def test_main_appends_each_run_to_history(tmp_path):
+    """Test setiap run `main` menambah satu run di output/history.sqlite."""
+    output_dir = str(tmp_path / "output")
+    with FakeFashionStudioServer(total_pages=2, cards_per_page=5) as server:
+        for _ in range(2):
+            etl.main(base_url=server.base_url, spreadsheet_id="", output_dir=output_dir,
+                     cache_dir=str(tmp_path / "cache" / "pages"), delay=0)
+
+    with HistoryStore(os.path.join(output_dir, "history.sqlite")) as store:
+        runs = store.runs()
+        assert len(runs) == 2
+        assert store.diff_runs().empty
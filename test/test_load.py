@@ -1,10 +1,13 @@
+import json
 import pandas as pd
 import sys
 import os
 import pytest
 from unittest.mock import patch, Mock, MagicMock
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from utils.load import save_to_csv, load_to_gsheet, save_to_postgresql
+from utils import load as utils_load
+from utils.load import save_to_csv, load_to_gsheet, save_to_postgresql, load_to_postgres, save_to_parquet, ParquetBatchWriter, load_to_gsheet_chunked
+from utils.load import append_to_gsheet, clear_gsheet
 
 # Test fungsi save_to_csv()
 def test_save_to_csv_success(tmp_path):
@@ -30,6 +33,17 @@ def test_save_to_csv_error(mock_to_csv, capsys):
     assert "❌ Gagal menyimpan ke CSV: Simulated error" in captured.out
     assert result is False  
 
+# Test fungsi save_to_csv() dengan mode append
+def test_save_to_csv_append(tmp_path):
+    """Test apakah save_to_csv menambahkan batch tanpa menulis ulang header."""
+    file_path = tmp_path / "stream.csv"
+
+    save_to_csv(pd.DataFrame({'col1': [1]}), file_path, append=True)
+    result = save_to_csv(pd.DataFrame({'col1': [2]}), file_path, append=True)
+
+    assert result is True
+    assert pd.read_csv(file_path)['col1'].tolist() == [1, 2]
+
 # Test fungsi load_to_gsheet() jika berhasil
 @patch('utils.load.Credentials')
 @patch('utils.load.build')
@@ -70,4 +84,306 @@ def test_load_to_gsheet_error(mock_build, mock_credentials, capsys):
 
     captured = capsys.readouterr()
     assert "❌ Gagal mengirim ke Google Sheets" in captured.out
-    assert result is False 
\ No newline at end of file
+    assert result is False
+
+def _clean_products():
+    return pd.DataFrame({
+        'Title': ['Hoodie 1', 'Pants 2'],
+        'Price': [800000.0, 480000.0],
+        'Rating': [4.5, 3.9],
+        'Colors': [3, 2],
+        'Size': ['M', 'L'],
+        'Gender': ['Unisex', 'Men'],
+        'Timestamp': ['2025-05-01T00:00:00', '2025-05-01T00:00:00'],
+    })
+
+def _postgres_engine(columns=None, unique_keys=(("Title", "Size", "Gender"),)):
+    """Engine tiruan; tabel tujuan yang sudah ada punya `columns` (default kolom _clean_products) dan `unique_keys`."""
+    engine = MagicMock()
+    cursor = engine.raw_connection.return_value.cursor.return_value.__enter__.return_value
+    columns = list(_clean_products().columns) if columns is None else columns
+    cursor.fetchall.side_effect = [[(col,) for col in columns], [(list(keys),) for keys in unique_keys]]
+    return engine, cursor
+
+# Test fungsi load_to_postgres() memakai COPY lalu upsert
+def test_load_to_postgres_copy_and_upsert():
+    """Test apakah load_to_postgres memakai COPY ke staging lalu INSERT ... ON CONFLICT."""
+    engine, cursor = _postgres_engine()
+    copied = []
+    cursor.copy_expert.side_effect = lambda query, buffer: copied.append((query, buffer.read()))
+
+    result = load_to_postgres(_clean_products(), "postgresql://dummy", engine=engine, chunk_size=1)
+
+    statements = [call.args[0] for call in cursor.execute.call_args_list]
+    assert result is True
+    assert len(copied) == 2  # Satu COPY per potongan baris
+    assert copied[0][0].startswith('COPY "fashion_products_staging"')
+    assert copied[0][1].startswith("Hoodie 1,800000.0,4.5,3,M,Unisex")
+    assert 'UNIQUE ("Title", "Size", "Gender")' in statements[0]
+    assert 'ON CONFLICT ("Title", "Size", "Gender") DO UPDATE SET "Price" = EXCLUDED."Price"' in statements[-1]
+    engine.raw_connection.return_value.commit.assert_called_once()
+
+def test_load_to_postgres_deletes_keys_in_same_transaction():
+    """Test apakah delete_keys dihapus lewat tabel staging di transaksi yang sama dengan upsert."""
+    engine, cursor = _postgres_engine()
+    copied = []
+    cursor.copy_expert.side_effect = lambda query, buffer: copied.append((query, buffer.read()))
+    deleted = pd.DataFrame({'Title': ['Jacket 9'], 'Size': ['L'], 'Gender': ['Men']})
+
+    result = load_to_postgres(_clean_products(), "postgresql://dummy", engine=engine, delete_keys=deleted)
+
+    statements = [call.args[0] for call in cursor.execute.call_args_list]
+    assert result is True
+    assert copied[-1] == ('COPY "fashion_products_deleted" ("Title", "Size", "Gender") FROM STDIN WITH (FORMAT csv)', "Jacket 9,L,Men\n")
+    assert statements[-1].startswith('DELETE FROM "fashion_products" t USING "fashion_products_deleted" d')
+    engine.raw_connection.return_value.commit.assert_called_once()
+
+# Test tabel dari run satu sumber ditolak dengan pesan yang jelas
+def test_load_to_postgres_rejects_table_without_source_key(capsys):
+    """Test apakah tabel lama tanpa kolom Source dan kunci (Source, ...) ditolak sebelum COPY."""
+    engine, cursor = _postgres_engine()
+    df = _clean_products().assign(Source="shop-a")
+
+    result = load_to_postgres(df, "postgresql://dummy", engine=engine,
+                              conflict_columns=("Source", "Title", "Size", "Gender"))
+
+    assert result is False
+    cursor.copy_expert.assert_not_called()
+    engine.raw_connection.return_value.rollback.assert_called_once()
+    output = capsys.readouterr().out
+    assert 'ADD COLUMN "Source" TEXT NOT NULL DEFAULT \'\'' in output
+    assert 'ADD UNIQUE ("Source", "Title", "Size", "Gender")' in output
+
+# Test fungsi load_to_postgres() jika terjadi error
+def test_load_to_postgres_error_rolls_back(capsys):
+    """Test apakah load_to_postgres melakukan rollback dan mengembalikan False saat gagal."""
+    engine, cursor = _postgres_engine()
+    cursor.copy_expert.side_effect = Exception("COPY gagal")
+
+    result = load_to_postgres(_clean_products(), "postgresql://dummy", engine=engine)
+
+    assert result is False
+    engine.raw_connection.return_value.rollback.assert_called_once()
+    assert "❌ Gagal memuat ke PostgreSQL: COPY gagal" in capsys.readouterr().out
+
+# Test integrasi dengan PostgreSQL lokal (di-skip jika tidak tersedia)
+def test_load_to_postgres_integration(postgres_url):
+    """Test upsert ke PostgreSQL sungguhan: baris dengan kunci sama diperbarui, bukan digandakan."""
+    from sqlalchemy import text
+    table = "fashion_products_test"
+    df = _clean_products()
+
+    assert load_to_postgres(df, postgres_url, table_name=table) is True
+    df.loc[0, 'Price'] = 900000.0
+    assert load_to_postgres(df, postgres_url, table_name=table) is True
+
+    with utils_load.get_engine(postgres_url).connect() as connection:
+        rows = connection.execute(text(f'SELECT "Title", "Price" FROM {table} ORDER BY "Title"')).fetchall()
+        connection.execute(text(f"DROP TABLE {table}"))
+        connection.commit()
+    assert [tuple(row) for row in rows] == [("Hoodie 1", 900000.0), ("Pants 2", 480000.0)]
+
+# Test fungsi save_to_parquet()
+def test_save_to_parquet_single_file(tmp_path):
+    """Test apakah save_to_parquet menulis file Parquet terkompresi dengan row group sesuai ukuran."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    file_path = tmp_path / "products.parquet"
+
+    result = save_to_parquet(_clean_products(), str(file_path), compression="snappy", row_group_size=1)
+
+    metadata = pq.ParquetFile(file_path).metadata
+    assert result is True
+    assert metadata.num_rows == 2
+    assert metadata.num_row_groups == 2
+    assert metadata.row_group(0).column(0).compression == "SNAPPY"
+    pd.testing.assert_frame_equal(pd.read_parquet(file_path), _clean_products())
+
+def test_save_to_parquet_partitioned(tmp_path):
+    """Test apakah save_to_parquet menulis dataset berpartisi Hive per run_date dan Gender."""
+    pytest.importorskip("pyarrow")
+
+    result = save_to_parquet(_clean_products(), str(tmp_path), partition_cols=['run_date', 'Gender'], run_date="2025-05-09")
+
+    assert result is True
+    assert (tmp_path / "run_date=2025-05-09" / "Gender=Men").is_dir()
+    assert (tmp_path / "run_date=2025-05-09" / "Gender=Unisex").is_dir()
+
+def test_parquet_batch_writer_appends_batches(tmp_path):
+    """Test ParquetBatchWriter menulis setiap batch sebagai row group di file yang sama."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    file_path = tmp_path / "stream.parquet"
+    df = _clean_products()
+
+    with ParquetBatchWriter(str(file_path)) as writer:
+        writer.write(df.iloc[:1])
+        writer.write(df.iloc[1:])
+
+    assert pq.ParquetFile(file_path).metadata.num_row_groups == 2
+    assert pd.read_parquet(file_path)['Title'].tolist() == ['Hoodie 1', 'Pants 2']
+
+class FakeRequest:
+    def __init__(self, action):
+        self.action = action
+
+    def execute(self):
+        return self.action()
+
+class FakeSheetsService:
+    """Tiruan lokal Google Sheets API (spreadsheets().values()) yang menyimpan sel di memori.
+
+    `fail_calls` berisi nomor pemanggilan execute (mulai 1) yang harus gagal.
+    """
+
+    def __init__(self, fail_calls=()):
+        self.cells = {}
+        self.calls = 0
+        self.fail_calls = set(fail_calls)
+        self.requests = []
+        self.clears = []
+
+    def spreadsheets(self):
+        return self
+
+    def values(self):
+        return self
+
+    def _maybe_fail(self):
+        self.calls += 1
+        if self.calls in self.fail_calls:
+            raise ConnectionError(f"Simulated failure on call {self.calls}")
+
+    def _write(self, start_row, rows):
+        for offset, row in enumerate(rows):
+            self.cells[start_row + offset] = row
+
+    def batchUpdate(self, spreadsheetId, body):
+        def action():
+            self._maybe_fail()
+            for item in body['data']:
+                row = int(item['range'].split('!')[-1].lstrip('ABCDEFGHIJKLMNOPQRSTUVWXYZ'))
+                self._write(row, item['values'])
+                self.requests.append(('batchUpdate', item['range'], len(item['values'])))
+            return {'totalUpdatedRows': sum(len(item['values']) for item in body['data'])}
+        return FakeRequest(action)
+
+    def clear(self, spreadsheetId, range, body):
+        def action():
+            self._maybe_fail()
+            self.cells.clear()
+            self.clears.append(range)
+            return {'clearedRange': range}
+        return FakeRequest(action)
+
+    def append(self, spreadsheetId, range, valueInputOption, insertDataOption, body):
+        def action():
+            self._maybe_fail()
+            next_row = max(self.cells, default=0) + 1
+            self._write(next_row, body['values'])
+            self.requests.append(('append', range, len(body['values'])))
+            return {'updates': {'updatedRows': len(body['values'])}}
+        return FakeRequest(action)
+
+    def rows(self):
+        return [self.cells[row] for row in sorted(self.cells)]
+
+def _products(count):
+    return pd.DataFrame({'Title': [f'Item {i}' for i in range(count)], 'Price': [float(i) for i in range(count)]})
+
+# Test fungsi load_to_gsheet_chunked() mengirim data per blok
+def test_load_to_gsheet_chunked_overwrite_in_blocks():
+    """Test apakah data dikirim per blok baris ke posisi yang benar lewat batchUpdate."""
+    service = FakeSheetsService()
+
+    result = load_to_gsheet_chunked(_products(5), 'dummy_id', 'Sheet1!A1', chunk_size=2, service=service)
+
+    assert result is True
+    assert [request[1] for request in service.requests] == ['Sheet1!A1', 'Sheet1!A3', 'Sheet1!A5']
+    assert service.rows()[0] == ['Title', 'Price']
+    assert service.rows()[1:] == [[f'Item {i}', float(i)] for i in range(5)]
+
+# Test overwrite mengosongkan sheet sehingga data yang lebih sedikit tidak menyisakan baris lama
+def test_load_to_gsheet_chunked_overwrite_clears_rows_of_larger_previous_upload():
+    """Test apakah upload 3 baris setelah 5 baris tidak menyisakan baris ke-4 dan ke-5 yang lama."""
+    service = FakeSheetsService()
+
+    load_to_gsheet_chunked(_products(5), 'dummy_id', 'Sheet1!A1', chunk_size=2, service=service)
+    result = load_to_gsheet_chunked(_products(3), 'dummy_id', 'Sheet1!A1', chunk_size=2, service=service)
+
+    assert result is True
+    assert service.clears == ['Sheet1', 'Sheet1']
+    assert service.rows() == [['Title', 'Price']] + [[f'Item {i}', float(i)] for i in range(3)]
+
+# Test retry per blok
+@patch('utils.load.time.sleep')
+def test_load_to_gsheet_chunked_retries_failed_block(mock_sleep):
+    """Test apakah blok yang gagal sementara dicoba ulang dengan backoff."""
+    service = FakeSheetsService(fail_calls={2, 3})
+
+    result = load_to_gsheet_chunked(_products(3), 'dummy_id', 'Sheet1!A1', chunk_size=2, service=service)
+
+    assert result is True
+    assert mock_sleep.call_count == 2
+    assert len(service.rows()) == 4
+
+# Test checkpoint: upload yang gagal bisa dilanjutkan
+@patch('utils.load.time.sleep')
+def test_load_to_gsheet_chunked_resumes_from_checkpoint(mock_sleep, tmp_path):
+    """Test apakah upload yang gagal dilanjutkan dari blok terakhir yang berhasil."""
+    checkpoint = tmp_path / "gsheet.json"
+    service = FakeSheetsService(fail_calls={3})
+    df = _products(7)
+
+    first = load_to_gsheet_chunked(df, 'dummy_id', 'Sheet1!A1', chunk_size=2, mode='append',
+                                   checkpoint_path=str(checkpoint), service=service, max_retries=0)
+
+    assert first is False
+    assert json.loads(checkpoint.read_text())['rows_written'] == 4
+
+    second = load_to_gsheet_chunked(df, 'dummy_id', 'Sheet1!A1', chunk_size=2, mode='append',
+                                    checkpoint_path=str(checkpoint), service=service, max_retries=0)
+
+    assert second is True
+    assert not checkpoint.exists()
+    assert [row[0] for row in service.rows()] == [f'Item {i}' for i in range(7)]
+
+# Test checkpoint dari data lain tidak dipakai
+@patch('utils.load.time.sleep')
+def test_load_to_gsheet_chunked_ignores_checkpoint_of_other_data(mock_sleep, tmp_path):
+    """Test apakah checkpoint dari DataFrame lain dengan jumlah baris sama diabaikan."""
+    checkpoint = tmp_path / "gsheet.json"
+    first = load_to_gsheet_chunked(_products(5), 'dummy_id', 'Sheet1!A1', chunk_size=2, mode='append',
+                                   checkpoint_path=str(checkpoint), service=FakeSheetsService(fail_calls={2}),
+                                   max_retries=0)
+    assert first is False
+
+    service = FakeSheetsService()
+    other = _products(5).assign(Price=lambda df: df['Price'] + 1)
+    second = load_to_gsheet_chunked(other, 'dummy_id', 'Sheet1!A1', chunk_size=2, mode='append',
+                                    checkpoint_path=str(checkpoint), service=service)
+
+    assert second is True
+    assert [row[1] for row in service.rows()] == [float(i + 1) for i in range(5)]
+
+# Test append_to_gsheet() dan clear_gsheet() memakai service yang di-cache
+@patch('utils.load.get_sheets_service')
+def test_append_and_clear_gsheet_use_cached_service(mock_service):
+    """Test apakah append dan clear memakai get_sheets_service, dan clear mengosongkan seluruh sheet."""
+    values = mock_service.return_value.spreadsheets.return_value.values.return_value
+
+    assert clear_gsheet('dummy_id', 'Sheet1!A1') is True
+    assert append_to_gsheet(_products(2), 'dummy_id', 'Sheet1!A1') is True
+
+    values.clear.assert_called_once_with(spreadsheetId='dummy_id', range='Sheet1', body={})
+    assert values.append.call_args.kwargs['body'] == {'values': [['Item 0', 0.0], ['Item 1', 1.0]]}
+    assert mock_service.call_count == 2
+
+
+def test_importing_main_does_not_load_sink_dependencies():
+    """Test library Google API dan database tidak ter-import sebelum sink-nya dipakai."""
+    import subprocess
+    code = ("import sys, main; heavy = ('googleapiclient', 'google.oauth2', 'sqlalchemy', 'psycopg2'); "
+            "print(sorted(m for m in sys.modules if m.startswith(heavy)))")
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, cwd=root, check=True)
+
+    assert result.stdout.strip() == "[]"
@@ -0,0 +1,114 @@
+import sys
+import os
+import json
+import pytest
+import pandas as pd
+from unittest.mock import patch
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils import metrics
+from utils.extract import FetchedPage, process_page
+from utils.transform import transform_data
+from utils.load import save_to_csv
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "fixtures")
+
+@pytest.fixture
+def run_metrics():
+    collector = metrics.start_run()
+    yield collector
+    metrics.finish_run()
+
+def test_stage_records_time_rows_and_memory():
+    """Test satu tahap mencatat panggilan, bytes, baris masuk/keluar/terbuang, dan peak RSS."""
+    collector = metrics.RunMetrics()
+
+    with collector.stage("transform.price", rows_in=10) as stage:
+        stage["rows_out"] = 7
+        stage["bytes"] = 128
+    collector.record("transform.price", 0.5, rows_in=5, rows_out=5)
+
+    entry = collector.report()["stages"]["transform.price"]
+    assert entry["calls"] == 2
+    assert entry["seconds"] >= 0.5
+    assert entry["bytes"] == 128
+    assert (entry["rows_in"], entry["rows_out"], entry["rows_dropped"]) == (15, 12, 3)
+    assert entry["peak_rss_bytes"] > 0
+
+def test_null_metrics_when_no_run_active():
+    """Test tanpa run aktif, pencatatan diabaikan tanpa error."""
+    metrics.finish_run()
+    with metrics.get_metrics().stage("parse") as stage:
+        stage["rows_out"] = 1
+    metrics.get_metrics().record_page("https://dummy.com/", 0.1, 0.1, 10, 1)
+
+def test_pipeline_stages_are_instrumented(run_metrics, tmp_path):
+    """Test parsing halaman, setiap langkah transform, dan loader tercatat di laporan run."""
+    with open(os.path.join(FIXTURE_DIR, "page1.html"), "rb") as f:
+        content = f.read()
+    page = FetchedPage("https://dummy.com/", content)
+    page.fetch_seconds = 0.25
+
+    products, card_count, _ = process_page(page)
+    df = transform_data(pd.DataFrame(products), compact=True)
+    save_to_csv(df, str(tmp_path / "products.csv"))
+
+    report = run_metrics.report()
+    stages = report["stages"]
+    assert stages["parse"]["bytes"] == len(content)
+    assert stages["parse"]["rows_out"] == len(products)
+    assert stages["extract_product_data"]["calls"] == card_count
+    for name in ("transform.deduplicate", "transform.price", "transform.columns", "transform.validate", "transform.compact"):
+        assert name in stages
+    assert stages["transform.deduplicate"]["rows_in"] == len(products)
+    assert stages["transform.validate"]["rows_out"] == len(df)
+    assert stages["load.csv"]["rows_in"] == len(df)
+
+    assert report["pages"] == [{
+        "url": "https://dummy.com/",
+        "fetch_seconds": 0.25,
+        "parse_seconds": pytest.approx(report["pages"][0]["parse_seconds"]),
+        "bytes": len(content),
+        "products": len(products),
+        "cached": False,
+        "peak_rss_bytes": report["pages"][0]["peak_rss_bytes"],
+    }]
+
+@patch("utils.extract.requests.Session")
+def test_fetching_content_records_bytes(mock_session, run_metrics):
+    """Test bytes yang diambil dari server tercatat di tahap fetching_content."""
+    from utils.extract import fetching_content
+    mock_session.return_value.get.return_value.content = b"<html>12345</html>"
+
+    fetching_content("https://dummy.com/")
+
+    assert run_metrics.report()["stages"]["fetching_content"]["bytes"] == len(b"<html>12345</html>")
+
+def test_json_and_prometheus_reports(tmp_path):
+    """Test laporan JSON dan teks Prometheus ditulis dari metrik yang sama."""
+    collector = metrics.RunMetrics()
+    collector.record("load.csv", 1.5, rows_in=3, rows_out=3)
+    collector.record_page("https://dummy.com/", 0.2, 0.1, 2048, 20)
+
+    report = json.loads(open(collector.write_json(str(tmp_path / "report.json"))).read())
+    text = open(collector.write_prometheus(str(tmp_path / "etl.prom"))).read()
+
+    assert report["stages"]["load.csv"]["seconds"] == 1.5
+    assert report["pages"][0]["bytes"] == 2048
+    assert "# TYPE etl_stage_seconds_total counter" in text
+    assert 'etl_stage_seconds_total{stage="load.csv"} 1.5' in text
+    assert 'etl_stage_rows_in_total{stage="load.csv"} 3' in text
+    assert "etl_pages_total 1" in text
+
+def test_profile_call_prints_hottest_functions(tmp_path):
+    """Test profile_call mengembalikan hasil fungsi dan mencetak statistik cProfile."""
+    import io
+    def work(n):
+        return sum(i * i for i in range(n))
+
+    stream = io.StringIO()
+    output_path = tmp_path / "run.prof"
+    result = metrics.profile_call(work, 1000, top=5, output_path=str(output_path), stream=stream)
+
+    assert result == sum(i * i for i in range(1000))
+    assert "work" in stream.getvalue()
+    assert output_path.exists()
@@ -0,0 +1,48 @@
+import sys
+import os
+import pandas as pd
+from unittest.mock import patch
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils import pipeline
+
+def _product(title, price="$10"):
+    return {"Title": title, "Price": price, "Rating": "⭐4.0/5", "Colors": "2 Colors",
+            "Size": "M", "Gender": "Men", "Timestamp": "2025-05-01T00:00:00"}
+
+def test_stream_pipeline_appends_batches_to_csv(tmp_path):
+    """Test stream_pipeline menulis setiap batch ke CSV yang sama dengan satu header."""
+    csv_path = tmp_path / "stream.csv"
+    csv_path.write_text("isi lama\n")
+    pages = iter([[_product("Item 1")], [_product("Item 2"), _product("Item 3")]])
+
+    total = pipeline.stream_pipeline(pages, exchange_rate=1, csv_filename=str(csv_path))
+
+    df = pd.read_csv(csv_path)
+    assert total == 3
+    assert df["Title"].tolist() == ["Item 1", "Item 2", "Item 3"]
+
+@patch("utils.pipeline.append_to_gsheet")
+@patch("utils.pipeline.load_to_gsheet")
+@patch("utils.pipeline.clear_gsheet")
+def test_stream_pipeline_overwrites_then_appends_gsheet(mock_clear, mock_load, mock_append):
+    """Test Sheet dikosongkan sekali, batch pertama menimpa Sheet dan batch berikutnya ditambahkan."""
+    pages = iter([[_product("Item 1")], [_product("Item 2")], [_product("Item 3")]])
+
+    pipeline.stream_pipeline(pages, exchange_rate=1, spreadsheet_id="dummy_id")
+
+    mock_clear.assert_called_once_with("dummy_id", "Sheet1!A1")
+    assert mock_load.call_count == 1
+    assert mock_append.call_count == 2
+
+@patch("utils.pipeline.save_to_csv")
+def test_stream_pipeline_compact_batches(mock_save):
+    """Test compact=True membuat setiap batch streaming memakai tipe hemat memori."""
+    pages = iter([[_product("Item 1")], [_product("Item 2")]])
+
+    pipeline.stream_pipeline(pages, exchange_rate=1, csv_filename="stream.csv", compact=True)
+
+    assert mock_save.call_count == 2
+    for call in mock_save.call_args_list:
+        df = call.args[0]
+        assert df["Size"].dtype == "category"
+        assert df["Rating"].dtype == "float32"
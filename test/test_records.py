@@ -0,0 +1,74 @@
+import sys
+import os
+import numpy as np
+import pandas as pd
+import pytest
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.fake_server import FakeFashionStudioServer
+from utils.extract import scrape_fashion_studio, typed_product
+from utils.records import ProductBatch
+from utils.transform import transform_data, transform_to_DataFrame
+
+def _products():
+    return [
+        {"Title": "Shirt 1", "Price": "$10.50", "Rating": "⭐ 4.5 / 5", "Colors": "3 Colors",
+         "Size": "M", "Gender": "Men", "Timestamp": "2025-05-01T12:00:00.123456"},
+        {"Title": "Pants 2", "Price": "$20.00", "Rating": "⭐ 4.0 / 5", "Colors": "3 Colors",
+         "Size": "M", "Gender": "Men", "Timestamp": "2025-05-01T12:00:01.000001"},
+    ]
+
+def test_product_batch_round_trip():
+    """Test iterasi batch menghasilkan dict produk yang sama dengan input."""
+    batch = ProductBatch(_products())
+
+    assert len(batch) == 2
+    assert list(batch) == _products()
+
+def test_product_batch_to_frame_matches_list_of_dict():
+    """Test DataFrame dari batch sama dengan DataFrame dari list of dict, sebelum dan sesudah transformasi."""
+    expected = pd.DataFrame(_products())
+    df = transform_to_DataFrame(ProductBatch(_products()))
+
+    assert df["Timestamp"].dtype == "datetime64[ns]"
+    pd.testing.assert_frame_equal(df.drop(columns="Timestamp"), expected.drop(columns="Timestamp"))
+    pd.testing.assert_frame_equal(transform_data(df), transform_data(expected))
+
+def test_typed_batch_to_frame_does_not_copy():
+    """Test kolom numerik DataFrame memakai buffer batch, dan append berikutnya tidak mengubahnya."""
+    batch = ProductBatch([typed_product(product) for product in _products()], typed=True)
+    df = batch.to_frame()
+
+    assert np.shares_memory(df["Price"].to_numpy(), np.frombuffer(batch._columns["Price"]))
+    assert df["Colors"].dtype == np.int64
+
+    batch.append(typed_product(_products()[0]))
+    assert len(batch) == 3 and len(df) == 2
+
+def test_product_batch_to_arrow():
+    """Test konversi ke Arrow menjaga tipe kolom numerik dan timestamp."""
+    pa = pytest.importorskip("pyarrow")
+    table = ProductBatch([typed_product(product) for product in _products()], typed=True).to_arrow()
+
+    assert table.schema.field("Price").type == pa.float64()
+    assert table.schema.field("Timestamp").type == pa.timestamp("ns")
+    assert table.column("Title").to_pylist() == ["Shirt 1", "Pants 2"]
+
+def test_scrape_fashion_studio_as_batch():
+    """Test as_batch=True menghasilkan produk yang sama dengan list of dict."""
+    with FakeFashionStudioServer(total_pages=2, cards_per_page=5) as server:
+        data = scrape_fashion_studio(server.base_url, delay=0)
+        batch = scrape_fashion_studio(server.base_url, delay=0, as_batch=True)
+
+    assert isinstance(batch, ProductBatch)
+    columns = ["Title", "Price", "Rating", "Colors", "Size", "Gender"]
+    assert [[p[c] for c in columns] for p in batch] == [[p[c] for c in columns] for p in data]
+
+def test_invalid_batch_timestamp_is_quarantined():
+    """Test Timestamp yang tidak valid (NaT) tidak berubah menjadi string "NaT" dan gagal validasi."""
+    products = _products()
+    products[1]["Timestamp"] = "bukan tanggal"
+
+    df = transform_data(ProductBatch(products).to_frame())
+
+    assert df["Title"].tolist() == ["Shirt 1"]
+    assert df["Timestamp"].tolist() == ["2025-05-01T12:00:00.123456"]
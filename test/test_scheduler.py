@@ -0,0 +1,77 @@
+import sys
+import os
+import glob
+import socket
+import pandas as pd
+import pytest
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.fake_server import FakeFashionStudioServer
+from utils.extract import scrape_fashion_studio
+from utils.history import HistoryStore
+from utils.scheduler import Source, crawl_sources, host_limiters
+import main as etl
+
+COLUMNS = ["Title", "Price", "Rating", "Colors", "Size", "Gender"]
+
+def _closed_port_url():
+    """URL ke port lokal yang tidak sedang dipakai server mana pun."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}/"
+
+def test_crawl_sources_tags_products_with_source():
+    """Test setiap sumber di-crawl lengkap dan produknya diberi kolom Source."""
+    with FakeFashionStudioServer(total_pages=2, cards_per_page=5, seed=1) as first, \
+         FakeFashionStudioServer(total_pages=3, cards_per_page=4, seed=2) as second:
+        batch = crawl_sources([Source("first", first.base_url, delay=0), {"name": "second", "base_url": second.base_url, "delay": 0}])
+        expected = {
+            "first": scrape_fashion_studio(first.base_url, delay=0),
+            "second": scrape_fashion_studio(second.base_url, delay=0),
+        }
+
+    df = batch.to_frame()
+    assert df["Source"].value_counts().to_dict() == {"first": 10, "second": 12}
+    for name, products in expected.items():
+        assert df.loc[df["Source"] == name, COLUMNS].values.tolist() == pd.DataFrame(products)[COLUMNS].values.tolist()
+
+def test_host_limiters_use_slowest_rate_per_host():
+    """Test sumber di host yang sama berbagi satu limiter dengan batas paling lambat."""
+    limiters = host_limiters([
+        Source("a", "https://shop.example.com/men/", requests_per_second=4),
+        Source("b", "https://SHOP.example.com/women/", delay=1),
+        Source("c", "https://outlet.example.com/", delay=0),
+    ])
+
+    assert set(limiters) == {"shop.example.com", "outlet.example.com"}
+    assert limiters["shop.example.com"].interval == 1.0
+    assert limiters["outlet.example.com"].interval == 0.0
+
+def test_crawl_sources_continues_when_one_source_fails():
+    """Test sumber yang tidak bisa dihubungi tidak menghentikan sumber lain."""
+    with FakeFashionStudioServer(total_pages=1, cards_per_page=5) as server:
+        batch = crawl_sources([Source("down", _closed_port_url(), delay=0), Source("up", server.base_url, delay=0)],
+                              max_retries=0)
+
+    assert set(product["Source"] for product in batch) == {"up"}
+    assert len(batch) == 5
+
+def test_crawl_sources_rejects_duplicate_names():
+    with pytest.raises(ValueError, match="unik"):
+        crawl_sources([Source("a", "http://127.0.0.1:1/"), Source("a", "http://127.0.0.1:2/")])
+
+def test_main_with_sources_writes_source_column(tmp_path):
+    """Test `main` dengan banyak sumber menghasilkan satu CSV dan riwayat dengan kolom Source."""
+    output_dir = str(tmp_path / "output")
+    with FakeFashionStudioServer(total_pages=2, cards_per_page=5, seed=1) as first, \
+         FakeFashionStudioServer(total_pages=2, cards_per_page=5, seed=1) as second:
+        etl.main(sources=[{"name": "first", "base_url": first.base_url}, {"name": "second", "base_url": second.base_url}],
+                 spreadsheet_id="", output_dir=output_dir, cache_dir=str(tmp_path / "cache" / "pages"),
+                 delay=0, sinks=("csv", "history"))
+
+    [csv_path] = glob.glob(os.path.join(output_dir, "fashion_products_*.csv"))
+    df = pd.read_csv(csv_path)
+    # Katalog kedua identik, tetapi produknya tidak dianggap duplikat karena sumbernya berbeda
+    assert df.groupby("Source").size().to_dict() == {"first": len(df) // 2, "second": len(df) // 2}
+    with HistoryStore(os.path.join(output_dir, "history.sqlite")) as store:
+        assert store.runs()["row_count"].tolist() == [len(df)]
@@ -0,0 +1,70 @@
+import sys
+import os
+import time
+import pandas as pd
+import pytest
+from unittest.mock import patch
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils import sinks
+
+DF = pd.DataFrame({'Title': ['Item 1'], 'Price': [16000.0]})
+
+def _slow_sink(df, seconds=0.2, result=True):
+    time.sleep(seconds)
+    return result
+
+def _broken_sink(df):
+    raise RuntimeError("koneksi terputus")
+
+@pytest.fixture(autouse=True)
+def fake_sinks():
+    """Daftarkan sink tiruan hanya selama test berjalan."""
+    with patch.dict(sinks.SINKS, {'slow': _slow_sink, 'broken': _broken_sink}):
+        yield
+
+def test_run_sinks_runs_concurrently():
+    """Test semua sink berjalan bersamaan, bukan berurutan."""
+    start = time.perf_counter()
+    results = sinks.run_sinks(DF, {
+        'slow_a': {'sink': 'slow', 'seconds': 0.3},
+        'slow_b': {'sink': 'slow', 'seconds': 0.3},
+        'slow_c': {'sink': 'slow', 'seconds': 0.3},
+    })
+    elapsed = time.perf_counter() - start
+
+    assert [result.name for result in results] == ['slow_a', 'slow_b', 'slow_c']
+    assert all(result.success for result in results)
+    assert all(result.duration >= 0.3 for result in results)
+    assert elapsed < 0.8
+
+def test_run_sinks_reports_failures_and_timeouts():
+    """Test kegagalan dan timeout dilaporkan per sink tanpa menghentikan sink lain."""
+    results = {result.name: result for result in sinks.run_sinks(DF, {
+        'slow': {'seconds': 1.0, 'timeout': 0.1},
+        'broken': {},
+        'false': {'sink': 'slow', 'seconds': 0, 'result': False},
+        'csv': {'filename': os.devnull},
+    })}
+
+    assert results['slow'].success is False and "timeout" in results['slow'].error
+    assert results['broken'].success is False and results['broken'].error == "koneksi terputus"
+    assert results['false'].success is False
+    assert results['csv'].success is True
+
+def test_run_sinks_unknown_sink():
+    """Test sink yang tidak terdaftar langsung ditolak."""
+    with pytest.raises(ValueError):
+        sinks.run_sinks(DF, {'ftp': {}})
+
+def test_register_sink_decorator():
+    """Test register_sink menambahkan loader baru ke registry."""
+    @sinks.register_sink('memory')
+    def memory_sink(df, store):
+        store.extend(df['Title'])
+        return True
+
+    store = []
+    results = sinks.run_sinks(DF, {'memory': {'store': store}})
+
+    assert results[0].success is True
+    assert store == ['Item 1']
@@ -6,6 +6,7 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils import transform
+from utils.validate import Validator
 
 def test_transform_to_DataFrame():
     """Test konversi dari list of dict ke DataFrame."""
@@ -136,8 +137,20 @@ def test_transform_data_error_handling():
     # Simulasi error saat transformasi
     with patch('pandas.DataFrame.copy', side_effect=Exception("Transformation error")):
         result = transform.transform_data(data)
-        # Harus mengembalikan data asli jika terjadi error
-        assert result.equals(data)
+        # Data mentah tidak dikembalikan; hasilnya DataFrame kosong dengan kolom yang sama
+        assert result.empty
+        assert list(result.columns) == list(data.columns)
+
+@pytest.mark.parametrize("data", [None, [{"Title": "Test", "Price": "$10"}]])
+def test_transform_data_error_handling_non_dataframe(data):
+    """Test input bukan DataFrame dikarantina dan menghasilkan DataFrame kosong berkolom COLUMNS."""
+    validator = Validator()
+
+    result = transform.transform_data(data, validator=validator)
+
+    assert result.empty
+    assert list(result.columns) == list(transform.COLUMNS)
+    assert validator.rows_quarantined == (0 if data is None else 1)
 
 def test_transform_data_comprehensive():
     """Test komprehensif untuk transform_data dengan semua kasus."""
@@ -193,4 +206,140 @@ def test_transform_data_comprehensive():
     # Verifikasi data pertama
     assert transformed.iloc[0]['Title'] == "Product 1"
     assert transformed.iloc[0]['Price'] == 100 * exchange_rate
-    assert transformed.iloc[0]['Rating'] == 4
\ No newline at end of file
+    assert transformed.iloc[0]['Rating'] == 4
+
+def test_transform_batches_streams_clean_frames():
+    """Test transform_batches membersihkan setiap batch dan melewati batch yang kosong."""
+    batches = [
+        [{"Title": "Shirt", "Price": "$20", "Rating": "⭐4.3/5", "Colors": "3 Colors", "Size": "L", "Gender": "Men", "Timestamp": "2024-05-01T12:00:00"}],
+        [],
+        [{"Title": "Unknown Product", "Price": "$20", "Rating": "⭐4.3/5", "Colors": "3 Colors", "Size": "L", "Gender": "Men", "Timestamp": "2024-05-01T12:00:00"}],
+        [{"Title": "Pants", "Price": "$10", "Rating": "⭐4.0/5", "Colors": "1 Colors", "Size": "M", "Gender": "Women", "Timestamp": "2024-05-01T12:00:00"}],
+    ]
+
+    frames = list(transform.transform_batches(iter(batches), exchange_rate=10))
+
+    assert [frame["Title"].tolist() for frame in frames] == [["Shirt"], ["Pants"]]
+    assert frames[1]["Price"].iloc[0] == 100.0
+
+def test_vectorized_parsers_match_scalar_versions(capsys):
+    """Test versi vektor memberi hasil yang sama dengan clean_price/extract_rating/extract_colors."""
+    prices = pd.Series(["$99.99", "$1,234.56", "$0", "Not a price", None, np.nan, " $5 "], dtype=object)
+    ratings = pd.Series(["⭐4.5/5", "Rating: ⭐3.7/5", "4.0 / 5", "No rating", None, "⭐ Invalid Rating / 5"], dtype=object)
+    colors = pd.Series(["3 Colors", "Colors: 5", "1", "No colors", None], dtype=object)
+
+    pd.testing.assert_series_equal(transform.clean_price_series(prices), prices.apply(transform.clean_price).astype(float))
+    pd.testing.assert_series_equal(transform.extract_rating_series(ratings), ratings.apply(transform.extract_rating).astype(float))
+    pd.testing.assert_series_equal(transform.extract_colors_series(colors), colors.apply(transform.extract_colors).astype(int))
+
+def test_clean_price_series_reports_errors_once(capsys):
+    """Test error parsing harga diringkas dalam satu pesan, bukan per baris."""
+    prices = pd.Series(["abc"] * 100 + ["$10"], dtype=object)
+
+    result = transform.clean_price_series(prices)
+
+    output = capsys.readouterr().out
+    assert result.isna().sum() == 100
+    assert output.count("\n") == 1
+    assert "100 nilai Price tidak valid" in output
+
+def _raw_rows(count):
+    return pd.DataFrame([
+        {
+            "Title": f"Product {i}",
+            "Price": f"${10 + i}.50",
+            "Rating": "⭐4.5/5",
+            "Colors": "3 Colors",
+            "Size": ["S", "M", "L"][i % 3],
+            "Gender": ["Men", "Women"][i % 2],
+            "Timestamp": f"2025-05-01T12:00:{i % 60:02d}.000000"
+        }
+        for i in range(count)
+    ])
+
+def test_transform_data_compact_dtypes(capsys):
+    """Test opsi compact menghasilkan tipe data hemat memori dan melaporkan memori."""
+    raw = _raw_rows(300)
+
+    transformed = transform.transform_data(raw, 16000, compact=True)
+
+    assert isinstance(transformed['Size'].dtype, pd.CategoricalDtype)
+    assert isinstance(transformed['Gender'].dtype, pd.CategoricalDtype)
+    assert transformed['Colors'].dtype == 'int8'
+    assert transformed['Price'].dtype == 'float32'
+    assert transformed['Rating'].dtype == 'float32'
+    assert pd.api.types.is_datetime64_any_dtype(transformed['Timestamp'])
+    assert pd.api.types.is_string_dtype(transformed['Title'])
+    assert transformed['Price'].iloc[0] == 10.5 * 16000
+    assert transform.memory_usage_bytes(transformed) < transform.memory_usage_bytes(raw)
+    assert "Penggunaan memori" in capsys.readouterr().out
+
+def test_transform_data_compact_keeps_float64_when_precision_lost():
+    """Test Price tetap float64 jika float32 akan mengubah nilai lebih dari Rp1."""
+    raw = _raw_rows(1)
+    raw['Price'] = "$123456789.01"
+
+    transformed = transform.transform_data(raw, 16000, compact=True)
+
+    assert transformed['Price'].dtype == 'float64'
+
+
+def _product(title, timestamp="2024-05-01T12:00:00", size="L"):
+    return {"Title": title, "Price": "$20", "Rating": "⭐4.3/5", "Colors": "3 Colors",
+            "Size": size, "Gender": "Men", "Timestamp": timestamp}
+
+def test_transform_data_typed_records_match_raw():
+    """Test record bertipe dari extract menghasilkan DataFrame yang sama dengan record string."""
+    from utils.extract import typed_product
+    raw = [
+        _product("Shirt"),
+        {**_product("Pants"), "Price": "$1,050.99", "Rating": "⭐ 4.8 / 5", "Colors": "5 Colors"},
+        {**_product("Hat"), "Rating": "Invalid Rating / 5", "Colors": "-", "Size": "M"},
+        {**_product("Cap"), "Price": "Price Unavailable"},
+    ]
+
+    expected = transform.transform_data(pd.DataFrame(raw))
+    result = transform.transform_data(pd.DataFrame([typed_product(product) for product in raw]))
+
+    pd.testing.assert_frame_equal(result, expected)
+
+def test_transform_data_dedup_ignores_timestamp():
+    """Test produk yang hanya berbeda Timestamp dianggap duplikat, dan dedup_subset bisa diatur."""
+    raw_data = pd.DataFrame([
+        _product("Shirt", "2024-05-01T12:00:00"),
+        _product("Shirt", "2024-05-01T12:00:05"),
+        _product("Shirt", "2024-05-01T12:00:09", size="M"),
+        _product("Pants"),
+    ])
+
+    assert transform.transform_data(raw_data)["Title"].tolist() == ["Shirt", "Shirt", "Pants"]
+    by_title = transform.transform_data(raw_data, dedup_subset=["Title"])
+    assert by_title["Title"].tolist() == ["Shirt", "Pants"]
+    assert by_title["Timestamp"].iloc[0] == "2024-05-01T12:00:00"
+
+def test_duplicate_mask_matches_pandas_duplicated():
+    """Test duplicate_mask sama dengan DataFrame.duplicated(subset), termasuk untuk nilai kosong."""
+    df = pd.DataFrame({
+        "Title": ["A", "B", "A", None, None, "A", None],
+        "Price": ["$1", "$1", "$1", "$2", "$2", "$3", "$2"],
+        "Timestamp": ["t1", "t2", "t3", "t4", "t5", "t6", "t7"],
+    })
+    subset = ["Title", "Price"]
+
+    expected = df.duplicated(subset=subset).to_numpy()
+    assert transform.duplicate_mask(df).tolist() == expected.tolist()
+    assert transform.duplicate_mask(df, subset=["Title"]).tolist() == df.duplicated(subset=["Title"]).tolist()
+
+def test_streaming_deduplicator_across_batches():
+    """Test StreamingDeduplicator menghapus duplikat di dalam dan antar batch."""
+    deduplicator = transform.StreamingDeduplicator()
+    batches = [
+        [_product("Shirt"), _product("Shirt", "2024-05-01T12:00:01")],
+        [_product("Shirt", "2024-05-01T12:01:00"), _product("Pants")],
+        [_product("Pants", "2024-05-01T12:02:00")],
+    ]
+
+    frames = list(transform.transform_batches(iter(batches), deduplicator=deduplicator))
+
+    assert [frame["Title"].tolist() for frame in frames] == [["Shirt"], ["Pants"]]
+    assert len(deduplicator) == 2
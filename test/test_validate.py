@@ -0,0 +1,103 @@
+import sys
+import os
+import glob
+import json
+import numpy as np
+import pandas as pd
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.fake_server import FakeFashionStudioServer
+from utils.transform import transform_data
+from utils.validate import Validator, in_range, matches, none_of, not_null, one_of
+import main as etl
+
+def _clean_frame():
+    """DataFrame dengan kolom hasil transform_data: 1 baris valid dan 3 baris yang melanggar aturan."""
+    return pd.DataFrame({
+        "Title": ["Shirt", "Unknown Product", "Pants", None],
+        "Price": [100.0, 50.0, -1.0, 10.0],
+        "Rating": [4.5, 4.0, 6.0, 3.0],
+        "Colors": [3, 2, 1, 1],
+        "Size": ["M", "L", "S", "M"],
+        "Gender": ["Men", "Women", "Unisex", "Men"],
+        "Timestamp": ["2025-05-01T00:00:00"] * 4,
+    })
+
+def test_rule_checks():
+    """Test setiap jenis aturan menghasilkan mask pelanggaran yang benar; nilai kosong hanya dilaporkan not_null."""
+    df = pd.DataFrame({"Size": ["M", "XXXXL", None], "Price": [10.0, -5.0, np.nan], "Code": ["A1", "b2", None]})
+
+    assert not_null("Size").failures(df).tolist() == [False, False, True]
+    assert one_of("Size", ["S", "M", "L"]).failures(df).tolist() == [False, True, False]
+    assert none_of("Size", ["M"]).failures(df).tolist() == [True, False, False]
+    assert in_range("Price", minimum=0).failures(df).tolist() == [False, True, False]
+    assert matches("Code", r"[A-Z]\d").failures(df).tolist() == [False, True, False]
+    assert in_range("Price", minimum=0).failures(pd.DataFrame({"Price": ["$10"]})).tolist() == [True]
+    assert not_null("Missing").failures(df).tolist() == [True, True, True]
+
+def test_validator_quarantines_rows_with_reasons(tmp_path):
+    """Test baris yang gagal ditulis ke file karantina dengan alasan, lintas beberapa batch."""
+    path = str(tmp_path / "quarantine.csv")
+    validator = Validator(quarantine_path=path)
+
+    valid = validator.apply(_clean_frame())
+    validator.apply(_clean_frame().iloc[1:2])
+
+    assert valid["Title"].tolist() == ["Shirt"]
+    quarantine = pd.read_csv(path)
+    assert quarantine["Alasan"].tolist() == [
+        "Title.forbidden", "Price.range; Rating.range", "Title.not_null", "Title.forbidden",
+    ]
+    report = validator.report()
+    assert (report["rows_in"], report["rows_valid"], report["rows_quarantined"]) == (5, 1, 4)
+    failures = {rule["name"]: rule["failed"] for rule in report["rules"]}
+    assert failures["Title.forbidden"] == 2 and failures["Rating.range"] == 1
+
+def test_validator_without_path_keeps_quarantine_in_memory():
+    """Test tanpa quarantine_path baris yang gagal tetap tercatat beserta alasannya."""
+    validator = Validator()
+
+    validator.apply(_clean_frame())
+
+    quarantine = validator.quarantined()
+    assert quarantine["Title"].tolist()[:1] == ["Unknown Product"]
+    assert quarantine["Alasan"].tolist() == ["Title.forbidden", "Price.range; Rating.range", "Title.not_null"]
+
+def test_validator_error_quarantines_whole_batch(tmp_path):
+    """Test validasi yang error tidak meneruskan data yang belum tervalidasi."""
+    path = str(tmp_path / "quarantine.csv")
+    validator = Validator(rules=[matches("Title", "(")], quarantine_path=path)
+
+    assert validator.apply(_clean_frame()).empty
+    assert len(pd.read_csv(path)) == 4
+
+def test_transform_data_with_validator_does_not_return_raw_data():
+    """Test transformasi yang gagal mengkarantina data mentah alih-alih mengembalikannya."""
+    validator = Validator()
+    raw = pd.DataFrame([{"Title": "Test", "Price": "$10"}])
+
+    assert transform_data(raw, validator=validator).empty
+    assert validator.rows_quarantined == 1
+
+def test_transform_data_without_validator_does_not_return_raw_data(capsys):
+    """Test tanpa validator pun transformasi yang gagal tidak mengembalikan data mentah."""
+    raw = pd.DataFrame([{"Title": "Test", "Price": "$10"}])
+
+    assert transform_data(raw).empty
+    assert "1 dikarantina" in capsys.readouterr().out
+
+def test_main_writes_quarantine_and_report(tmp_path):
+    """Test `main` menulis file karantina dan laporan validasi; produk tidak valid tidak dimuat."""
+    output_dir = str(tmp_path / "output")
+    with FakeFashionStudioServer(total_pages=10, cards_per_page=20) as server:
+        etl.main(base_url=server.base_url, spreadsheet_id="", output_dir=output_dir,
+                 cache_dir=str(tmp_path / "cache" / "pages"), delay=0, sinks=("csv",))
+
+    [csv_path] = glob.glob(os.path.join(output_dir, "fashion_products_*.csv"))
+    [quarantine_path] = glob.glob(os.path.join(output_dir, "quarantine_*.csv"))
+    [report_path] = glob.glob(os.path.join(output_dir, "validation_report_*.json"))
+    assert "Unknown Product" not in pd.read_csv(csv_path)["Title"].tolist()
+    quarantine = pd.read_csv(quarantine_path)
+    assert (quarantine["Title"] == "Unknown Product").all()
+    with open(report_path, encoding="utf-8") as f:
+        report = json.load(f)
+    assert report["rows_quarantined"] == len(quarantine)
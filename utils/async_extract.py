@@ -0,0 +1,194 @@
+import asyncio
+import random
+import time
+from utils.cache import content_hash
+from utils.extract import (
+    HEADERS, REQUEST_TIMEOUT, RETRY_STATUS_CODES, PARSER_BACKENDS,
+    FetchedPage, build_page_url, process_page, typed_product,
+)
+from utils.lazy import LazyImport
+from utils.metrics import get_metrics
+
+httpx = LazyImport('httpx')
+
+def create_async_client(max_connections=10):
+    """AsyncClient httpx dengan connection pool dan keep-alive, header sama dengan `create_session`."""
+    return httpx.AsyncClient(
+        headers=HEADERS,
+        timeout=REQUEST_TIMEOUT,
+        limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        follow_redirects=True,
+    )
+
+def _retry_delay(response, attempt, backoff_factor, backoff_jitter):
+    """Jeda sebelum retry: header Retry-After jika ada, jika tidak exponential backoff + jitter."""
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after and retry_after.isdigit():
+        return float(retry_after)
+    return backoff_factor * (2 ** attempt) + random.uniform(0, backoff_jitter)
+
+async def async_fetching_response(url, client, headers=None, max_retries=5, backoff_factor=0.5, backoff_jitter=0.5):
+    """Versi async `fetching_response`: GET dengan retry untuk 429/5xx dan error koneksi.
+
+    Mengembalikan response (termasuk 304), atau None jika gagal. Pembatalan task
+    (CancelledError) tidak ditangkap sehingga tetap diteruskan ke pemanggil.
+    """
+    try:
+        with get_metrics().stage("fetching_content") as stage:
+            for attempt in range(max_retries + 1):
+                try:
+                    response = await client.get(url, headers=headers)
+                except httpx.TransportError:
+                    if attempt == max_retries:
+                        raise
+                    await asyncio.sleep(_retry_delay(None, attempt, backoff_factor, backoff_jitter))
+                    continue
+                if response.status_code in RETRY_STATUS_CODES and attempt < max_retries:
+                    await asyncio.sleep(_retry_delay(response, attempt, backoff_factor, backoff_jitter))
+                    continue
+                if response.is_error:
+                    response.raise_for_status()
+                stage["bytes"] = len(response.content or b"")
+                return response
+    except Exception as e:
+        print(f"Terjadi kesalahan ketika melakukan requests terhadap {url}: {e}")
+        return None
+
+async def async_fetch_page(url, client, cache=None, **retry_options):
+    """Versi async `fetch_page`: FetchedPage dengan conditional GET jika `cache` diberikan."""
+    start = time.perf_counter()
+    entry = cache.get(url) if cache is not None else None
+    headers = cache.conditional_headers(entry) if cache is not None else None
+    response = await async_fetching_response(url, client, headers=headers, **retry_options)
+    if response is None:
+        return None
+    if response.status_code == 304 and entry:
+        page = FetchedPage(url, cached=entry)
+    elif not response.content:
+        return None
+    else:
+        page = FetchedPage(
+            url,
+            response.content,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            content_hash=content_hash(response.content),
+        )
+        if entry and entry.get("content_hash") == page.content_hash:
+            page.cached = entry
+    page.fetch_seconds = time.perf_counter() - start
+    return page
+
+class AsyncRateLimiter:
+    """Versi asyncio `RateLimiter`: membatasi request per detik tanpa memblokir event loop."""
+
+    def __init__(self, requests_per_second=None):
+        self.interval = 1.0 / requests_per_second if requests_per_second else 0.0
+        self._next_slot = 0.0
+
+    async def wait(self):
+        """Tunggu sampai slot request berikutnya tersedia."""
+        if not self.interval:
+            return
+        now = time.monotonic()
+        slot = max(self._next_slot, now)
+        self._next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+async def aiter_fashion_studio_pages(base_url, start_page=1, delay=2, max_pages=50, max_concurrency=10,
+                                     requests_per_second=None, client=None, parser="html.parser", cache=None,
+                                     semaphore=None, typed=False, limiter=None, **retry_options):
+    """Async generator yang menghasilkan daftar produk per halaman, urut halaman.
+
+    Paling banyak `max_concurrency` halaman diambil bersamaan; `semaphore` (asyncio.Semaphore)
+    bisa dibagi beberapa scraper di event loop yang sama agar batas koneksinya berlaku
+    bersama. Parsing dijalankan di thread (`asyncio.to_thread`) dengan logika ekstraksi
+    yang sama dengan versi sinkron sehingga event loop tidak tertahan. Halaman yang sudah
+    dijadwalkan dibatalkan begitu katalog habis, terjadi kegagalan, atau generator/task
+    pemanggil dibatalkan. `typed=True` menghasilkan record bertipe (lihat `typed_product`).
+    `limiter` (AsyncRateLimiter) menggantikan batas dari `requests_per_second`, misalnya agar
+    beberapa sumber di host yang sama berbagi satu batas kecepatan.
+    """
+    if parser not in PARSER_BACKENDS:
+        raise ValueError(f"Parser tidak dikenal: {parser}. Pilihan: {', '.join(PARSER_BACKENDS)}")
+    if requests_per_second is None and delay:
+        requests_per_second = 1.0 / delay
+    max_concurrency = max(max_concurrency, 1)
+    semaphore = semaphore or asyncio.Semaphore(max_concurrency)
+    limiter = limiter or AsyncRateLimiter(requests_per_second)
+    last_page = start_page + max_pages - 1
+    total_products = 0
+    pages_scraped = 0
+
+    async def fetch(page_number):
+        async with semaphore:
+            await limiter.wait()
+            url = build_page_url(base_url, page_number)
+            print(f"Scraping halaman: {url}")
+            return await async_fetch_page(url, client, cache, **retry_options)
+
+    owns_client = client is None
+    if owns_client:
+        client = create_async_client(max_connections=max_concurrency)
+    tasks = {}
+    try:
+        next_to_schedule = start_page
+        page_number = start_page
+        while page_number <= last_page:
+            while next_to_schedule <= last_page and len(tasks) < max_concurrency:
+                tasks[next_to_schedule] = asyncio.create_task(fetch(next_to_schedule))
+                next_to_schedule += 1
+
+            page = await tasks.pop(page_number)
+            if page is None:
+                print(f"Gagal mengambil konten dari halaman {page_number}")
+                break
+
+            products, card_count, has_next = await asyncio.to_thread(process_page, page, parser, cache)
+            if not card_count:
+                print(f"Tidak ada produk yang ditemukan pada halaman {page_number}")
+                break
+
+            total_products += len(products)
+            pages_scraped += 1
+            yield [typed_product(product) for product in products] if typed else products
+            if not has_next:
+                print("Tidak ada halaman berikutnya. Proses scraping selesai.")
+                break
+            page_number += 1
+    finally:
+        for task in tasks.values():
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+        if owns_client:
+            await client.aclose()
+
+    print(f"Proses scraping selesai. Total {total_products} produk berhasil di-scrape dari {pages_scraped} halaman.")
+
+async def async_scrape_fashion_studio(base_url, start_page=1, delay=2, max_pages=50, max_concurrency=10,
+                                      requests_per_second=None, client=None, parser="html.parser", cache=None,
+                                      semaphore=None, typed=False, **retry_options):
+    """Versi coroutine `scrape_fashion_studio` untuk dijalankan di event loop asyncio.
+
+    Mengembalikan list of dict yang sama dengan versi sinkron. Batas kecepatan mengikuti
+    `requests_per_second` (default diturunkan dari `delay`), konkurensi dibatasi
+    `max_concurrency` atau `semaphore` bersama. `client` (httpx.AsyncClient) bisa dipakai
+    bersama antar scraper; jika tidak diberikan, client dibuat dan ditutup di sini.
+    `retry_options` (max_retries, backoff_factor, backoff_jitter) diteruskan ke
+    `async_fetching_response`. Membatalkan task yang menjalankan coroutine ini menghentikan
+    semua request yang sedang berjalan.
+    """
+    data = []
+    pages = aiter_fashion_studio_pages(base_url, start_page, delay, max_pages, max_concurrency,
+                                       requests_per_second, client, parser, cache, semaphore, typed,
+                                       **retry_options)
+    try:
+        async for products in pages:
+            data.extend(products)
+    except Exception as e:
+        print(f"Terjadi kesalahan saat melakukan scraping: {e}")
+    finally:
+        await pages.aclose()
+    return data
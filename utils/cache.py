@@ -0,0 +1,104 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+def content_hash(content):
+    """Hash SHA-256 dari konten halaman (bytes)."""
+    return hashlib.sha256(content).hexdigest()
+
+class PageCache:
+    """Cache halaman di disk, dikunci berdasarkan URL.
+
+    Setiap entri menyimpan ETag/Last-Modified, hash konten, dan hasil parsing halaman
+    (record produk, jumlah card, ada tombol next) sehingga halaman yang tidak berubah
+    tidak perlu di-parsing ulang. Jika total ukuran melebihi `max_bytes`, entri yang
+    paling lama tidak dipakai dihapus lebih dulu.
+    """
+
+    def __init__(self, cache_dir=".cache/pages", max_bytes=50 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, url):
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, url):
+        """Ambil entri cache untuk URL, atau None jika belum ada/rusak."""
+        path = self._path(url)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get("url") != url:
+            return None
+        try:
+            os.utime(path)  # Tandai sebagai baru dipakai untuk eviction
+        except OSError:
+            pass
+        return entry
+
+    def put(self, url, content_hash, products, card_count, has_next, etag=None, last_modified=None):
+        """Simpan hasil parsing halaman beserta validator HTTP-nya secara atomik."""
+        entry = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "content_hash": content_hash,
+            "products": products,
+            "card_count": card_count,
+            "has_next": has_next,
+        }
+        path = self._path(url)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self.evict()
+        return entry
+
+    @staticmethod
+    def conditional_headers(entry):
+        """Header If-None-Match/If-Modified-Since untuk conditional GET."""
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def size(self):
+        """Total ukuran file cache dalam bytes."""
+        return sum(item.stat().st_size for item in os.scandir(self.cache_dir) if item.name.endswith(".json"))
+
+    def evict(self):
+        """Hapus entri yang paling lama tidak dipakai sampai ukuran cache <= max_bytes."""
+        with self._lock:
+            entries = [
+                (item.stat().st_mtime, item.stat().st_size, item.path)
+                for item in os.scandir(self.cache_dir)
+                if item.name.endswith(".json")
+            ]
+            total = sum(size for _, size, _ in entries)
+            removed = 0
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                removed += 1
+            return removed
@@ -0,0 +1,116 @@
+import os
+import tempfile
+from dataclasses import dataclass
+import pandas as pd
+
+KEY_COLUMNS = ("Title", "Size", "Gender")
+# Kolom yang berubah setiap run sehingga tidak ikut menentukan apakah produk berubah
+VOLATILE_COLUMNS = ("Timestamp",)
+
+def _canonical(frame):
+    """Samakan tipe kolom sebelum hashing agar hasil compact/tidak compact memberi hash yang sama.
+
+    Kolom float dibandingkan pada presisi float32, sesuai tipe hasil `compact_dtypes`.
+    """
+    canonical = {}
+    for col in frame.columns:
+        values = frame[col]
+        if pd.api.types.is_float_dtype(values):
+            canonical[col] = values.astype("float32").astype("float64")
+        elif pd.api.types.is_integer_dtype(values):
+            canonical[col] = values.astype("int64")
+        else:
+            canonical[col] = values.astype(str)
+    return pd.DataFrame(canonical, index=frame.index)
+
+def row_hashes(df, columns):
+    """Hash uint64 yang stabil antar run untuk setiap baris, dihitung dari `columns`."""
+    return pd.util.hash_pandas_object(_canonical(df[list(columns)]), index=False).to_numpy()
+
+@dataclass
+class ChangeSet:
+    """Hasil CDC: produk baru, produk yang berubah, kunci produk yang hilang, dan state baru.
+
+    `initial` bernilai True jika belum ada state run sebelumnya, sehingga semua produk
+    dianggap baru padahal sink tujuan bisa saja sudah berisi data.
+    """
+    inserted: pd.DataFrame
+    updated: pd.DataFrame
+    deleted: pd.DataFrame
+    unchanged: int
+    state: pd.DataFrame
+    initial: bool = False
+
+    @property
+    def changed(self):
+        """Baris baru dan berubah sekaligus, misalnya untuk upsert."""
+        return pd.concat([self.inserted, self.updated])
+
+    @property
+    def is_empty(self):
+        return self.inserted.empty and self.updated.empty and self.deleted.empty
+
+    def summary(self):
+        return (f"Perubahan data: {len(self.inserted)} baru, {len(self.updated)} berubah, "
+                f"{len(self.deleted)} dihapus, {self.unchanged} tetap")
+
+def read_state(state_path, key_columns=KEY_COLUMNS):
+    """Baca state index run sebelumnya, atau None jika belum ada."""
+    if not os.path.exists(state_path):
+        return None
+    dtypes = {col: str for col in key_columns}
+    dtypes.update({"_key_hash": "uint64", "_row_hash": "uint64"})
+    return pd.read_csv(state_path, dtype=dtypes, keep_default_na=False)
+
+def capture_changes(df, state_path, key_columns=KEY_COLUMNS, exclude=VOLATILE_COLUMNS):
+    """Bandingkan DataFrame hasil transformasi dengan state index run sebelumnya.
+
+    Produk dikenali dari `key_columns` dan dianggap berubah jika hash semua kolom selain
+    `exclude` berbeda. Jika satu kunci muncul beberapa kali, baris terakhir yang dipakai.
+    State baru hanya disimpan lewat `commit_state`, setelah delta berhasil dimuat.
+    """
+    key_columns = list(key_columns)
+    value_columns = [col for col in df.columns if col not in exclude]
+    key_hash = row_hashes(df, key_columns)
+    last_per_key = ~pd.Series(key_hash).duplicated(keep="last").to_numpy()
+    current = df[last_per_key]
+    key_hash = key_hash[last_per_key]
+    row_hash = row_hashes(current, value_columns)
+
+    state = current[key_columns].astype(str).reset_index(drop=True)
+    state["_key_hash"] = key_hash
+    state["_row_hash"] = row_hash
+
+    previous = read_state(state_path, key_columns)
+    if previous is None:
+        empty_keys = pd.DataFrame(columns=key_columns)
+        return ChangeSet(current, current.iloc[0:0], empty_keys, 0, state, initial=True)
+
+    previous_hash = pd.Series(previous["_row_hash"].to_numpy(), index=previous["_key_hash"].to_numpy())
+    existing = pd.Index(key_hash).isin(previous_hash.index)
+    old_hash = previous_hash.reindex(key_hash[existing]).to_numpy()
+    updated = existing.copy()
+    updated[existing] = old_hash != row_hash[existing]
+
+    deleted = previous.loc[~previous["_key_hash"].isin(key_hash), key_columns].reset_index(drop=True)
+    return ChangeSet(
+        inserted=current[~existing],
+        updated=current[updated],
+        deleted=deleted,
+        unchanged=int(existing.sum() - updated.sum()),
+        state=state,
+    )
+
+def commit_state(changes, state_path):
+    """Simpan state index dari ChangeSet secara atomik sebagai acuan run berikutnya."""
+    directory = os.path.dirname(state_path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            changes.state.to_csv(f, index=False)
+        os.replace(tmp_path, state_path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
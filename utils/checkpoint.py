@@ -0,0 +1,97 @@
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+class CrawlCheckpoint:
+    """Progres crawl yang disimpan di SQLite agar scraping bisa dilanjutkan setelah gagal.
+
+    Untuk setiap `base_url` dicatat halaman terakhir yang selesai dan apakah crawl sudah
+    selesai, serta record produk setiap halaman. Setiap halaman disimpan dalam satu
+    transaksi sehingga checkpoint tidak pernah berisi halaman yang setengah tertulis.
+    """
+
+    def __init__(self, path=os.path.join(".cache", "crawl_checkpoint.sqlite")):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS crawl (
+                base_url TEXT PRIMARY KEY,
+                last_page INTEGER,
+                finished INTEGER NOT NULL DEFAULT 0,
+                updated_at TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS pages (
+                base_url TEXT NOT NULL,
+                page_number INTEGER NOT NULL,
+                products TEXT NOT NULL,
+                PRIMARY KEY (base_url, page_number)
+            );
+        """)
+        self._conn.commit()
+
+    def save_page(self, base_url, page_number, products):
+        """Simpan produk satu halaman dan tandai halaman itu sebagai halaman terakhir yang selesai."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages (base_url, page_number, products) VALUES (?, ?, ?)",
+                (base_url, page_number, json.dumps(products, ensure_ascii=False)),
+            )
+            self._conn.execute(
+                """INSERT INTO crawl (base_url, last_page, finished, updated_at) VALUES (?, ?, 0, ?)
+                   ON CONFLICT (base_url) DO UPDATE SET
+                       last_page = excluded.last_page, finished = 0, updated_at = excluded.updated_at""",
+                (base_url, page_number, datetime.now().isoformat()),
+            )
+
+    def last_page(self, base_url):
+        """Nomor halaman terakhir yang selesai, atau None jika belum ada."""
+        with self._lock:
+            row = self._conn.execute("SELECT last_page FROM crawl WHERE base_url = ?", (base_url,)).fetchone()
+        return row[0] if row else None
+
+    def can_resume(self, base_url):
+        """True jika ada crawl untuk `base_url` yang terhenti sebelum selesai."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT last_page, finished FROM crawl WHERE base_url = ?", (base_url,)
+            ).fetchone()
+        return bool(row) and row[0] is not None and not row[1]
+
+    def iter_pages(self, base_url):
+        """Yield (nomor halaman, produk) yang tersimpan, urut halaman."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT page_number, products FROM pages WHERE base_url = ? ORDER BY page_number", (base_url,)
+            ).fetchall()
+        for page_number, products in rows:
+            yield page_number, json.loads(products)
+
+    def mark_finished(self, base_url):
+        """Tandai crawl `base_url` selesai sehingga run berikutnya mulai dari awal."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE crawl SET finished = 1, updated_at = ? WHERE base_url = ?",
+                (datetime.now().isoformat(), base_url),
+            )
+
+    def reset(self, base_url):
+        """Hapus progres `base_url` untuk memulai crawl baru."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM pages WHERE base_url = ?", (base_url,))
+            self._conn.execute("DELETE FROM crawl WHERE base_url = ?", (base_url,))
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
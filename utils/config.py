@@ -0,0 +1,154 @@
+import os
+from dataclasses import dataclass, fields
+from typing import Any, Optional, Tuple
+
+BASE_URL = 'https://fashion-studio.dicoding.dev/'
+SPREADSHEET_ID = '1YQ6ghlMhOt1vE_A5mBLi8fdEk9YcVjj0Sh1mLDmDHUo'
+RANGE_NAME = 'Sheet1!A1'
+OUTPUT_DIR = 'output'
+CACHE_DIR = os.path.join('.cache', 'pages')
+
+@dataclass
+class RunConfig:
+    """Opsi satu run `main`. Nilai default dipakai jika opsi tidak di-set di file konfigurasi maupun CLI."""
+    # Katalog yang di-crawl; `sources` (Source atau dict name/base_url/...) meng-crawl banyak
+    # katalog bersamaan menggantikan `base_url`, dan Source ikut menjadi kunci produk
+    base_url: str = BASE_URL
+    max_pages: int = 50
+    delay: float = 2
+    # Lanjutkan crawl yang terhenti dari halaman setelah checkpoint terakhir
+    resume: bool = False
+    max_workers: int = 1
+    # Jumlah proses parser; 0 berarti parsing di proses utama
+    parse_workers: int = 0
+    requests_per_second: Optional[float] = None
+    parser: str = 'html.parser'
+    cache_dir: str = CACHE_DIR
+    # Scraper langsung menghasilkan Price/Rating/Colors bertipe
+    typed_records: bool = False
+    exchange_rate: float = 16000
+    # Tipe data hemat memori (lihat `compact_dtypes`)
+    compact: bool = False
+    # Transformasi dan load per halaman
+    streaming: bool = False
+    # Muat hanya produk baru/berubah (dan penghapusan) dibanding run sebelumnya
+    changes_only: bool = False
+    output_dir: str = OUTPUT_DIR
+    # 'csv' dan/atau 'parquet'; `partition` menulis Parquet berpartisi per tanggal run dan Gender
+    output_formats: Tuple[str, ...] = ('csv',)
+    partition: bool = False
+    prometheus_path: Optional[str] = None
+    # Sink yang ditulis (None berarti semua yang dikonfigurasi) dan ukuran blok Sheets/PostgreSQL
+    sinks: Optional[Tuple[str, ...]] = None
+    batch_size: Optional[int] = None
+    # Kosong berarti Google Sheets dilewati
+    spreadsheet_id: str = SPREADSHEET_ID
+    range_name: str = RANGE_NAME
+    sources: Optional[Tuple[Any, ...]] = None
+    # Ambil dan transformasi data tanpa menulis ke sink mana pun
+    dry_run: bool = False
+
+# Nilai default setiap opsi yang bisa di-set di file konfigurasi maupun CLI
+DEFAULTS = {field.name: field.default for field in fields(RunConfig) if field.name != 'dry_run'}
+
+# Bagian dan kunci di file konfigurasi -> nama parameter `main`
+CONFIG_KEYS = {
+    'source': {'base_url': 'base_url', 'max_pages': 'max_pages', 'delay': 'delay', 'resume': 'resume'},
+    'fetch': {
+        'workers': 'max_workers',
+        'parse_workers': 'parse_workers',
+        'requests_per_second': 'requests_per_second',
+        'parser': 'parser',
+        'cache_dir': 'cache_dir',
+        'typed_records': 'typed_records',
+    },
+    'transform': {
+        'exchange_rate': 'exchange_rate',
+        'compact': 'compact',
+        'streaming': 'streaming',
+        'changes_only': 'changes_only',
+    },
+    'output': {'dir': 'output_dir', 'formats': 'output_formats', 'partition': 'partition', 'prometheus': 'prometheus_path'},
+    'sinks': {'enabled': 'sinks', 'batch_size': 'batch_size'},
+    'gsheet': {'spreadsheet_id': 'spreadsheet_id', 'range_name': 'range_name'},
+}
+
+# Kunci setiap tabel [[sources]] (lihat `utils.scheduler.Source`)
+SOURCE_KEYS = ('name', 'base_url', 'max_pages', 'delay', 'requests_per_second', 'max_concurrency')
+
+def _read_file(path):
+    """Baca file TOML (.toml) atau YAML (.yaml/.yml) menjadi dict."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.toml':
+        try:
+            import tomllib
+        except ImportError:  # Python < 3.11
+            import tomli as tomllib
+        with open(path, 'rb') as f:
+            return tomllib.load(f)
+    if extension in ('.yaml', '.yml'):
+        try:
+            import yaml
+        except ImportError:
+            raise ValueError("Paket PyYAML dibutuhkan untuk membaca konfigurasi YAML")
+        with open(path, 'r', encoding='utf-8') as f:
+            return yaml.safe_load(f) or {}
+    raise ValueError(f"Format konfigurasi tidak dikenal: {path} (gunakan .toml, .yaml, atau .yml)")
+
+def load_config(path):
+    """Baca file konfigurasi dan kembalikan dict parameter `main` yang di-set di file itu.
+
+    Bagian atau kunci yang tidak dikenal menimbulkan ValueError agar salah ketik tidak
+    diam-diam diabaikan.
+    """
+    raw = _read_file(path)
+    if not isinstance(raw, dict):
+        raise ValueError(f"Isi konfigurasi {path} harus berupa mapping")
+
+    params = {}
+    for section, values in raw.items():
+        if section == 'sources':
+            params['sources'] = _load_sources(values)
+            continue
+        if section not in CONFIG_KEYS:
+            raise ValueError(f"Bagian konfigurasi tidak dikenal: [{section}]. Pilihan: {', '.join(CONFIG_KEYS)}, sources")
+        if not isinstance(values, dict):
+            raise ValueError(f"Bagian [{section}] harus berisi pasangan kunci = nilai")
+        for key, value in values.items():
+            if key not in CONFIG_KEYS[section]:
+                raise ValueError(f"Kunci tidak dikenal: {section}.{key}. Pilihan: {', '.join(CONFIG_KEYS[section])}")
+            params[CONFIG_KEYS[section][key]] = value
+
+    for name in ('output_formats', 'sinks'):
+        if isinstance(params.get(name), str):
+            params[name] = (params[name],)
+        elif params.get(name) is not None:
+            params[name] = tuple(params[name])
+    unknown_formats = set(params.get('output_formats', ())) - {'csv', 'parquet'}
+    if unknown_formats:
+        raise ValueError(f"Format output tidak dikenal: {', '.join(sorted(unknown_formats))}. Pilihan: csv, parquet")
+    return params
+
+def _load_sources(values):
+    """Validasi daftar [[sources]] menjadi tuple dict berisi `name` dan `base_url` (wajib) serta opsi lain."""
+    if not isinstance(values, list):
+        raise ValueError("Bagian sources harus berupa daftar tabel [[sources]]")
+    sources = []
+    for source in values:
+        if not isinstance(source, dict):
+            raise ValueError("Setiap entri [[sources]] harus berisi pasangan kunci = nilai")
+        unknown = set(source) - set(SOURCE_KEYS)
+        if unknown:
+            raise ValueError(f"Kunci tidak dikenal: sources.{', sources.'.join(sorted(unknown))}. Pilihan: {', '.join(SOURCE_KEYS)}")
+        if not source.get('name') or not source.get('base_url'):
+            raise ValueError("Setiap entri [[sources]] membutuhkan name dan base_url")
+        sources.append(dict(source))
+    return tuple(sources)
+
+def resolve_config(path=None, overrides=None):
+    """Gabungkan DEFAULTS, file konfigurasi `path`, lalu `overrides` (nilai None diabaikan)."""
+    params = dict(DEFAULTS)
+    if path:
+        params.update(load_config(path))
+    params.update({name: value for name, value in (overrides or {}).items() if value is not None})
+    return params
@@ -0,0 +1,233 @@
+import os
+import sqlite3
+import threading
+from datetime import datetime
+import pandas as pd
+from utils.metrics import timed
+from utils.records import SOURCE_COLUMN
+
+class HistoryStore:
+    """Riwayat hasil `transform_data` dari setiap run dalam satu file SQLite.
+
+    Produk disimpan sekali di tabel `products` (unik per Source, Title, Size, Gender; Source
+    kosong untuk run satu sumber) dan setiap run menambah baris di `observations`. Observasi dikelompokkan per run (primary key
+    (run_id, product_id)) sehingga snapshot dan diff antar run cukup membaca satu range,
+    sedangkan indeks (product_id, run_id) dan `runs.run_at` melayani riwayat harga per
+    produk. Query lintas run tidak perlu lagi membaca ulang semua file CSV.
+    """
+
+    def __init__(self, path=os.path.join("output", "history.sqlite")):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS runs (
+                run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                run_at TEXT NOT NULL,
+                row_count INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE INDEX IF NOT EXISTS idx_runs_run_at ON runs (run_at);
+            CREATE TABLE IF NOT EXISTS products (
+                product_id INTEGER PRIMARY KEY,
+                source TEXT NOT NULL DEFAULT '',
+                title TEXT NOT NULL,
+                size TEXT NOT NULL,
+                gender TEXT NOT NULL,
+                UNIQUE (source, title, size, gender)
+            );
+            CREATE TABLE IF NOT EXISTS observations (
+                product_id INTEGER NOT NULL REFERENCES products (product_id),
+                run_id INTEGER NOT NULL REFERENCES runs (run_id),
+                price REAL,
+                rating REAL,
+                colors INTEGER,
+                scraped_at TEXT,
+                PRIMARY KEY (run_id, product_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_observations_product ON observations (product_id, run_id);
+        """)
+        self._conn.commit()
+
+    def begin_run(self, run_at=None):
+        """Catat run baru dan kembalikan run_id-nya; batch bisa ditambahkan lewat `append`."""
+        run_at = run_at or datetime.now()
+        if isinstance(run_at, datetime):
+            run_at = run_at.isoformat(timespec="seconds")
+        with self._lock, self._conn:
+            return self._conn.execute("INSERT INTO runs (run_at) VALUES (?)", (run_at,)).lastrowid
+
+    def append(self, df, run_id):
+        """Tambahkan DataFrame hasil transformasi ke run `run_id` dalam satu transaksi.
+
+        Jika satu produk muncul lebih dari sekali dalam run yang sama, baris terakhir yang dipakai.
+        Produk dari sumber berbeda (kolom Source) disimpan terpisah; tanpa kolom Source
+        semua produk masuk ke sumber ''.
+        """
+        if df.empty:
+            return 0
+        sources = _column_values(df, SOURCE_COLUMN) if SOURCE_COLUMN in df.columns else [None] * len(df)
+        sources = [source if source is not None else "" for source in sources]
+        rows = list(zip(sources, *(_column_values(df, col) for col in
+                                   ("Title", "Size", "Gender", "Price", "Rating", "Colors", "Timestamp"))))
+        with self._lock, self._conn:
+            self._conn.execute("""
+                CREATE TEMP TABLE IF NOT EXISTS staging (
+                    source TEXT, title TEXT, size TEXT, gender TEXT,
+                    price REAL, rating REAL, colors INTEGER, scraped_at TEXT
+                )""")
+            self._conn.execute("DELETE FROM staging")
+            self._conn.executemany("INSERT INTO staging VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            self._conn.execute("""
+                INSERT OR IGNORE INTO products (source, title, size, gender)
+                SELECT DISTINCT source, title, size, gender FROM staging""")
+            self._conn.execute("""
+                INSERT OR REPLACE INTO observations (product_id, run_id, price, rating, colors, scraped_at)
+                SELECT p.product_id, ?, s.price, s.rating, s.colors, s.scraped_at
+                FROM staging s JOIN products p
+                  ON p.source = s.source AND p.title = s.title AND p.size = s.size AND p.gender = s.gender
+                ORDER BY s.rowid""", (run_id,))
+            self._conn.execute("""
+                UPDATE runs SET row_count = (SELECT COUNT(*) FROM observations WHERE run_id = ?)
+                WHERE run_id = ?""", (run_id, run_id))
+        return len(rows)
+
+    def append_run(self, df, run_at=None):
+        """Simpan seluruh DataFrame sebagai satu run baru dan kembalikan run_id-nya."""
+        run_id = self.begin_run(run_at)
+        self.append(df, run_id)
+        return run_id
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            return pd.read_sql_query(sql, self._conn, params=params)
+
+    def runs(self):
+        """Daftar run (run_id, run_at, row_count), urut waktu."""
+        return self._query("SELECT run_id, run_at, row_count FROM runs ORDER BY run_at, run_id")
+
+    def latest_run_id(self, before=None):
+        """run_id terakhir (atau terakhir sebelum run `before`), None jika belum ada."""
+        if before is None:
+            row = self._query("SELECT run_id FROM runs ORDER BY run_at DESC, run_id DESC LIMIT 1")
+        else:
+            row = self._query("""
+                SELECT run_id FROM runs
+                WHERE (run_at, run_id) < (SELECT run_at, run_id FROM runs WHERE run_id = ?)
+                ORDER BY run_at DESC, run_id DESC LIMIT 1""", (before,))
+        return int(row["run_id"].iloc[0]) if not row.empty else None
+
+    def snapshot(self, run_id=None):
+        """Produk pada run `run_id` (default run terakhir) dengan kolom seperti output transform_data.
+
+        Kolom Source hanya disertakan jika run berisi produk dari sumber bernama.
+        """
+        run_id = run_id if run_id is not None else self.latest_run_id()
+        df = self._query("""
+            SELECT p.title AS Title, o.price AS Price, o.rating AS Rating, o.colors AS Colors,
+                   p.size AS Size, p.gender AS Gender, o.scraped_at AS Timestamp, p.source AS Source
+            FROM observations o JOIN products p USING (product_id)
+            WHERE o.run_id = ?
+            ORDER BY o.product_id""", (run_id,))
+        return df if (df[SOURCE_COLUMN] != "").any() else df.drop(columns=SOURCE_COLUMN)
+
+    def latest_snapshot(self):
+        """Snapshot run terakhir."""
+        return self.snapshot()
+
+    def price_history(self, title, size=None, gender=None, since=None, source=None):
+        """Riwayat harga, rating, dan warna produk `title` (opsional per Size/Gender/Source) per run.
+
+        `since` (datetime atau string ISO) membatasi run yang diambil, misalnya 30 hari terakhir.
+        """
+        conditions, params = ["p.title = ?"], [title]
+        if size is not None:
+            conditions.append("p.size = ?")
+            params.append(size)
+        if gender is not None:
+            conditions.append("p.gender = ?")
+            params.append(gender)
+        if source is not None:
+            conditions.append("p.source = ?")
+            params.append(source)
+        if since is not None:
+            conditions.append("r.run_at >= ?")
+            params.append(since.isoformat() if isinstance(since, datetime) else since)
+        return self._query(f"""
+            SELECT r.run_id, r.run_at, p.source AS Source, p.title AS Title, p.size AS Size, p.gender AS Gender,
+                   o.price AS Price, o.rating AS Rating, o.colors AS Colors
+            FROM products p
+            JOIN observations o USING (product_id)
+            JOIN runs r USING (run_id)
+            WHERE {' AND '.join(conditions)}
+            ORDER BY p.source, p.size, p.gender, r.run_at, r.run_id""", params)
+
+    def diff_runs(self, old_run_id=None, new_run_id=None):
+        """Perbedaan dua run per produk: status 'baru', 'dihapus', atau 'berubah'.
+
+        Default membandingkan run terakhir dengan run sebelumnya. Produk yang harga, rating,
+        dan jumlah warnanya sama di kedua run tidak ikut dikembalikan.
+        """
+        new_run_id = new_run_id if new_run_id is not None else self.latest_run_id()
+        old_run_id = old_run_id if old_run_id is not None else self.latest_run_id(before=new_run_id)
+        # Kedua run dibaca lewat primary key (run_id, product_id) sehingga diff tetap
+        # linear terhadap jumlah produk per run
+        return self._query("""
+            WITH changes AS (
+                SELECT n.product_id,
+                       CASE WHEN o.product_id IS NULL THEN 'baru' ELSE 'berubah' END AS status,
+                       o.price AS old_price, n.price AS new_price,
+                       o.rating AS old_rating, n.rating AS new_rating,
+                       o.colors AS old_colors, n.colors AS new_colors
+                FROM observations n
+                LEFT JOIN observations o ON o.product_id = n.product_id AND o.run_id = :old
+                WHERE n.run_id = :new
+                  AND (o.product_id IS NULL OR o.price IS NOT n.price
+                       OR o.rating IS NOT n.rating OR o.colors IS NOT n.colors)
+                UNION ALL
+                SELECT o.product_id, 'dihapus', o.price, NULL, o.rating, NULL, o.colors, NULL
+                FROM observations o
+                WHERE o.run_id = :old AND NOT EXISTS (
+                    SELECT 1 FROM observations n WHERE n.product_id = o.product_id AND n.run_id = :new
+                )
+            )
+            SELECT p.source AS Source, p.title AS Title, p.size AS Size, p.gender AS Gender, c.status,
+                   c.old_price, c.new_price, c.new_price - c.old_price AS price_change,
+                   c.old_rating, c.new_rating, c.old_colors, c.new_colors
+            FROM changes c JOIN products p USING (product_id)
+            ORDER BY c.status, p.source, p.title, p.size, p.gender""", {"old": old_run_id, "new": new_run_id})
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+def _column_values(df, column):
+    """Nilai kolom sebagai tipe Python yang diterima sqlite3 (None untuk kosong)."""
+    values = df[column]
+    if pd.api.types.is_datetime64_any_dtype(values):
+        values = values.dt.strftime("%Y-%m-%dT%H:%M:%S.%f")
+    elif isinstance(values.dtype, pd.CategoricalDtype) or pd.api.types.is_string_dtype(values):
+        values = values.astype(object)
+    values = values.astype(object).where(values.notna(), None)
+    return values.tolist()
+
+@timed("load.history")
+def save_to_history(df, path=os.path.join("output", "history.sqlite"), run_at=None):
+    """Tambahkan DataFrame sebagai satu run baru di HistoryStore `path`."""
+    try:
+        with HistoryStore(path) as store:
+            run_id = store.append_run(df, run_at)
+        print(f"Data berhasil ditambahkan ke riwayat {path} (run {run_id}).")
+        return True
+    except Exception as e:
+        print(f"Terjadi kesalahan saat menyimpan riwayat: {e}")
+        return False
@@ -0,0 +1,35 @@
+import importlib
+import threading
+
+class LazyImport:
+    """Pengganti modul atau atribut modul yang baru di-import saat pertama kali dipakai.
+
+    Dipakai untuk dependensi berat yang hanya dibutuhkan sink atau backend tertentu,
+    misalnya `build = LazyImport('googleapiclient.discovery', 'build')`. Nama di level
+    modul tetap ada sehingga bisa diganti dengan `unittest.mock.patch` seperti biasa.
+    """
+
+    def __init__(self, module, attribute=None):
+        self._module = module
+        self._attribute = attribute
+        self._target = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._target is None:
+            with self._lock:
+                if self._target is None:
+                    target = importlib.import_module(self._module)
+                    self._target = getattr(target, self._attribute) if self._attribute else target
+        return self._target
+
+    def __getattr__(self, name):
+        return getattr(self._load(), name)
+
+    def __call__(self, *args, **kwargs):
+        return self._load()(*args, **kwargs)
+
+    def __repr__(self):
+        name = f"{self._module}.{self._attribute}" if self._attribute else self._module
+        state = "loaded" if self._target is not None else "not loaded"
+        return f"<LazyImport {name} ({state})>"
@@ -1,19 +1,140 @@
+import os
+import io
+import hashlib
+import json
+import random
+import re
+import time
+import uuid
+from datetime import date
 import pandas as pd
-from google.oauth2.service_account import Credentials
-from googleapiclient.discovery import build
-import psycopg2
-from sqlalchemy import create_engine
+from utils.lazy import LazyImport
+from utils.metrics import timed
 
-def save_to_csv(df, filename="products.csv"):
-    """Simpan DataFrame ke file CSV lokal."""
+# Library Google API dan database baru di-import saat sink-nya dipakai,
+# sehingga run yang hanya menulis CSV/Parquet tidak menanggung waktu import-nya
+Credentials = LazyImport('google.oauth2.service_account', 'Credentials')
+build = LazyImport('googleapiclient.discovery', 'build')
+psycopg2 = LazyImport('psycopg2')
+create_engine = LazyImport('sqlalchemy', 'create_engine')
+
+SHEETS_SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
+RETRYABLE_HTTP_STATUS = (429, 500, 502, 503, 504)
+
+# Service Google Sheets di-cache per file kredensial
+_SHEETS_SERVICES = {}
+
+# Engine dipakai bersama antar pemanggilan (dan antar run dalam satu proses) per URL database
+_ENGINES = {}
+
+@timed("load.csv")
+def save_to_csv(df, filename="products.csv", append=False):
+    """Simpan DataFrame ke file CSV lokal.
+
+    Dengan `append=True`, baris ditambahkan ke file yang sudah ada (header hanya ditulis
+    jika file belum ada/kosong), dipakai untuk menulis batch secara streaming.
+    """
     try:
-        df.to_csv(filename, index=False)
+        if append and os.path.exists(filename) and os.path.getsize(filename) > 0:
+            df.to_csv(filename, mode='a', header=False, index=False)
+        else:
+            df.to_csv(filename, index=False)
         print(f"✅ Data berhasil disimpan ke {filename}")
         return True
     except Exception as e:
         print(f"❌ Gagal menyimpan ke CSV: {e}")
         return False
         
+def _parquet_table(df, partition_cols, run_date):
+    """Ubah DataFrame ke tabel Arrow, menambahkan kolom run_date jika dipakai untuk partisi."""
+    import pyarrow as pa
+
+    if partition_cols and 'run_date' in partition_cols and 'run_date' not in df.columns:
+        df = df.assign(run_date=run_date or date.today().isoformat())
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+@timed("load.parquet")
+def save_to_parquet(df, path, compression="zstd", row_group_size=100000, partition_cols=None, run_date=None):
+    """Simpan DataFrame ke file Parquet terkompresi (zstd/snappy).
+
+    Tanpa `partition_cols`, ditulis satu file di `path`. Dengan `partition_cols`
+    (misalnya `['run_date', 'Gender']`), `path` menjadi folder dataset berpartisi
+    gaya Hive (`run_date=2025-05-09/Gender=Men/...`).
+    """
+    try:
+        import pyarrow.parquet as pq
+
+        table = _parquet_table(df, partition_cols, run_date)
+        if partition_cols:
+            pq.write_to_dataset(
+                table,
+                root_path=path,
+                partition_cols=list(partition_cols),
+                compression=compression,
+                row_group_size=row_group_size,
+                basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet"
+            )
+        else:
+            pq.write_table(table, path, compression=compression, row_group_size=row_group_size)
+        print(f"✅ Data berhasil disimpan ke {path} (Parquet, {compression})")
+        return True
+    except Exception as e:
+        print(f"❌ Gagal menyimpan ke Parquet: {e}")
+        return False
+
+class ParquetBatchWriter:
+    """Menulis batch DataFrame secara streaming ke Parquet.
+
+    Tanpa partisi, semua batch ditulis sebagai row group ke satu file yang sama;
+    dengan partisi, setiap batch menjadi file baru di dalam dataset.
+    """
+
+    def __init__(self, path, compression="zstd", row_group_size=100000, partition_cols=None, run_date=None):
+        self.path = path
+        self.compression = compression
+        self.row_group_size = row_group_size
+        self.partition_cols = partition_cols
+        self.run_date = run_date or date.today().isoformat()
+        self.rows_written = 0
+        self._writer = None
+
+    @timed("load.parquet")
+    def write(self, df):
+        """Tulis satu batch; mengembalikan True jika berhasil."""
+        if self.partition_cols:
+            ok = save_to_parquet(df, self.path, self.compression, self.row_group_size,
+                                 self.partition_cols, self.run_date)
+            self.rows_written += len(df) if ok else 0
+            return ok
+        try:
+            import pyarrow.parquet as pq
+
+            table = _parquet_table(df, None, self.run_date)
+            if self._writer is None:
+                self._writer = pq.ParquetWriter(self.path, table.schema, compression=self.compression)
+            else:
+                table = table.cast(self._writer.schema)
+            self._writer.write_table(table, row_group_size=self.row_group_size)
+            self.rows_written += len(df)
+            return True
+        except Exception as e:
+            print(f"❌ Gagal menulis batch ke Parquet: {e}")
+            return False
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            print(f"✅ {self.rows_written} baris disimpan ke {self.path} (Parquet, {self.compression})")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+@timed("load.gsheet")
 def load_to_gsheet(df, spreadsheet_id, range_name):
     """Kirim DataFrame ke Google Sheets."""
     try:
@@ -40,3 +161,343 @@ def load_to_gsheet(df, spreadsheet_id, range_name):
     except Exception as e:
         print(f"❌ Gagal mengirim ke Google Sheets: {e}")
         return False
+
+@timed("load.gsheet_append")
+def append_to_gsheet(df, spreadsheet_id, range_name, include_header=False):
+    """Tambahkan baris DataFrame di bawah data yang sudah ada di Google Sheets."""
+    try:
+        service = get_sheets_service()
+
+        data = _sheet_values(df)
+        if include_header:
+            data = [df.columns.tolist()] + data
+
+        body = {'values': data}
+        result = service.spreadsheets().values().append(
+            spreadsheetId=spreadsheet_id,
+            range=range_name,
+            valueInputOption='RAW',
+            insertDataOption='INSERT_ROWS',
+            body=body
+        ).execute()
+
+        updated_cells = result.get('updates', {}).get('updatedCells')
+        print(f"✅ {updated_cells} sel ditambahkan di Google Sheets.")
+        return True
+
+    except Exception as e:
+        print(f"❌ Gagal menambahkan ke Google Sheets: {e}")
+        return False
+
+def _sheet_name(service, spreadsheet_id, range_name):
+    """Nama sheet (tab) pada `range_name`, atau sheet pertama jika `range_name` tidak menyebutnya."""
+    sheet = range_name.rpartition('!')[0]
+    if sheet:
+        return sheet
+    spreadsheet = service.spreadsheets().get(
+        spreadsheetId=spreadsheet_id, fields='sheets.properties.title'
+    ).execute()
+    return spreadsheet['sheets'][0]['properties']['title']
+
+def clear_gsheet(spreadsheet_id, range_name, service=None):
+    """Kosongkan sheet tujuan `range_name` agar baris dari run sebelumnya tidak tertinggal.
+
+    Yang dikosongkan adalah seluruh sheet (tab) pada `range_name`, atau sheet pertama jika
+    `range_name` tidak menyebut nama sheet.
+    """
+    try:
+        service = service or get_sheets_service()
+        sheet = _sheet_name(service, spreadsheet_id, range_name)
+        service.spreadsheets().values().clear(spreadsheetId=spreadsheet_id, range=sheet, body={}).execute()
+        return True
+
+    except Exception as e:
+        print(f"❌ Gagal mengosongkan Google Sheets: {e}")
+        return False
+
+def get_sheets_service(credentials_file='google-sheets-api.json'):
+    """Service Google Sheets yang dibuat sekali lalu dipakai ulang per file kredensial."""
+    service = _SHEETS_SERVICES.get(credentials_file)
+    if service is None:
+        creds = Credentials.from_service_account_file(credentials_file, scopes=SHEETS_SCOPES)
+        service = build('sheets', 'v4', credentials=creds, cache_discovery=False)
+        _SHEETS_SERVICES[credentials_file] = service
+    return service
+
+def _split_a1(range_name):
+    """Pecah range A1 seperti 'Sheet1!B3' menjadi ('Sheet1!', 'B', 3)."""
+    sheet, _, cell = range_name.rpartition('!')
+    match = re.match(r'^([A-Za-z]*)(\d*)', cell)
+    column = match.group(1) or 'A'
+    row = int(match.group(2)) if match.group(2) else 1
+    return (f"{sheet}!" if sheet else ""), column.upper(), row
+
+def _sheet_values(frame):
+    """Nilai DataFrame dalam bentuk list yang aman dikirim ke Sheets API (NaN jadi sel kosong)."""
+    frame = frame.astype(object)
+    rows = frame.where(frame.notna(), "").values.tolist()
+    return [
+        [value if isinstance(value, (str, int, float, bool)) else str(value) for value in row]
+        for row in rows
+    ]
+
+def _is_retryable(error):
+    """Error jaringan dan HTTP 429/5xx layak dicoba ulang; error 4xx lain tidak."""
+    status = getattr(getattr(error, 'resp', None), 'status', None)
+    return status is None or int(status) in RETRYABLE_HTTP_STATUS
+
+def _execute_with_retry(request, max_retries, backoff_factor):
+    """Jalankan request Sheets API dengan exponential backoff + jitter."""
+    for attempt in range(max_retries + 1):
+        try:
+            return request().execute()
+        except Exception as e:
+            if attempt == max_retries or not _is_retryable(e):
+                raise
+            delay = backoff_factor * (2 ** attempt) + random.uniform(0, backoff_factor)
+            print(f"⚠️ Request Google Sheets gagal ({e}), mencoba lagi dalam {delay:.1f} detik")
+            time.sleep(delay)
+
+def _frame_fingerprint(df):
+    """Sidik jari isi, urutan baris, dan nama kolom DataFrame untuk mencocokkan checkpoint."""
+    digest = hashlib.sha1(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    digest.update(json.dumps([str(column) for column in df.columns]).encode('utf-8'))
+    return digest.hexdigest()
+
+def _read_checkpoint(checkpoint_path, spreadsheet_id, range_name, mode, total_rows, fingerprint):
+    """Baca jumlah baris yang sudah terkirim dari checkpoint yang cocok, atau 0.
+
+    Checkpoint hanya dipakai jika dibuat untuk data yang sama (`fingerprint`); data lain
+    dengan jumlah baris yang kebetulan sama dikirim ulang dari awal.
+    """
+    if not checkpoint_path or not os.path.exists(checkpoint_path):
+        return 0
+    try:
+        with open(checkpoint_path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return 0
+    expected = {'spreadsheet_id': spreadsheet_id, 'range_name': range_name, 'mode': mode,
+                'total_rows': total_rows, 'fingerprint': fingerprint}
+    if any(state.get(key) != value for key, value in expected.items()):
+        return 0
+    return int(state.get('rows_written', 0))
+
+def _write_checkpoint(checkpoint_path, spreadsheet_id, range_name, mode, total_rows, fingerprint, rows_written):
+    """Simpan progres upload secara atomik."""
+    state = {
+        'spreadsheet_id': spreadsheet_id,
+        'range_name': range_name,
+        'mode': mode,
+        'total_rows': total_rows,
+        'fingerprint': fingerprint,
+        'rows_written': rows_written,
+    }
+    tmp_path = f"{checkpoint_path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f)
+    os.replace(tmp_path, checkpoint_path)
+
+@timed("load.gsheet")
+def load_to_gsheet_chunked(df, spreadsheet_id, range_name, chunk_size=1000, mode='overwrite',
+                           checkpoint_path=None, service=None, credentials_file='google-sheets-api.json',
+                           max_retries=5, backoff_factor=1.0):
+    """Kirim DataFrame ke Google Sheets per blok baris, dengan retry dan checkpoint.
+
+    Mode 'overwrite' mengosongkan sheet tujuan (lihat `clear_gsheet`) lalu menulis header + data
+    mulai dari `range_name` lewat `values.batchUpdate`; mode 'append' menambahkan baris data
+    di bawah isi sheet lewat `values.append`.
+    Setiap blok dicoba ulang dengan backoff. Jika `checkpoint_path` diberikan, jumlah baris
+    yang sudah terkirim disimpan setelah setiap blok sehingga upload yang gagal dapat
+    dilanjutkan dari blok terakhir dengan memanggil fungsi ini lagi.
+    """
+    try:
+        if mode not in ('overwrite', 'append'):
+            raise ValueError(f"Mode tidak dikenal: {mode}")
+        service = service or get_sheets_service(credentials_file)
+        values_api = service.spreadsheets().values()
+
+        header_rows = 1 if mode == 'overwrite' else 0
+        total_rows = len(df) + header_rows
+        sheet, column, start_row = _split_a1(range_name)
+
+        fingerprint = _frame_fingerprint(df) if checkpoint_path else None
+        rows_written = _read_checkpoint(checkpoint_path, spreadsheet_id, range_name, mode, total_rows, fingerprint)
+        if rows_written:
+            print(f"Melanjutkan upload Google Sheets dari baris ke-{rows_written + 1}")
+        elif mode == 'overwrite':
+            # Upload baru (bukan lanjutan): baris run sebelumnya yang lebih panjang tidak boleh tertinggal
+            sheet_name = _sheet_name(service, spreadsheet_id, range_name)
+            clear = lambda: values_api.clear(spreadsheetId=spreadsheet_id, range=sheet_name, body={})
+            _execute_with_retry(clear, max_retries, backoff_factor)
+
+        while rows_written < total_rows:
+            end = min(rows_written + chunk_size, total_rows)
+            rows = _sheet_values(df.iloc[max(rows_written - header_rows, 0):end - header_rows])
+            if rows_written == 0 and header_rows:
+                rows = [df.columns.tolist()] + rows
+
+            if mode == 'overwrite':
+                body = {
+                    'valueInputOption': 'RAW',
+                    'data': [{'range': f"{sheet}{column}{start_row + rows_written}", 'values': rows}],
+                }
+                request = lambda body=body: values_api.batchUpdate(spreadsheetId=spreadsheet_id, body=body)
+            else:
+                request = lambda rows=rows: values_api.append(
+                    spreadsheetId=spreadsheet_id,
+                    range=range_name,
+                    valueInputOption='RAW',
+                    insertDataOption='INSERT_ROWS',
+                    body={'values': rows}
+                )
+            _execute_with_retry(request, max_retries, backoff_factor)
+
+            rows_written = end
+            if checkpoint_path:
+                _write_checkpoint(checkpoint_path, spreadsheet_id, range_name, mode, total_rows, fingerprint,
+                                  rows_written)
+
+        if checkpoint_path and os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+        print(f"✅ {total_rows} baris dikirim ke Google Sheets dalam blok {chunk_size} baris.")
+        return True
+
+    except Exception as e:
+        print(f"❌ Gagal mengirim ke Google Sheets: {e}")
+        return False
+
+def get_engine(db_url, pool_size=5, max_overflow=5):
+    """Engine SQLAlchemy dengan connection pool yang dipakai ulang untuk URL yang sama."""
+    engine = _ENGINES.get(db_url)
+    if engine is None:
+        engine = create_engine(db_url, pool_size=pool_size, max_overflow=max_overflow, pool_pre_ping=True)
+        _ENGINES[db_url] = engine
+    return engine
+
+def _postgres_type(dtype):
+    """Tipe kolom PostgreSQL untuk dtype pandas."""
+    if pd.api.types.is_bool_dtype(dtype):
+        return "BOOLEAN"
+    if pd.api.types.is_integer_dtype(dtype):
+        return "BIGINT"
+    if pd.api.types.is_float_dtype(dtype):
+        return "DOUBLE PRECISION"
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return "TIMESTAMP"
+    return "TEXT"
+
+def _quote(identifier):
+    """Quote identifier PostgreSQL (nama kolom/tabel) dengan aman."""
+    return '"' + str(identifier).replace('"', '""') + '"'
+
+def _copy_dataframe(cursor, df, table, columns, chunk_size):
+    """Stream DataFrame ke tabel lewat COPY FROM STDIN per potongan baris."""
+    copy_sql = f"COPY {table} ({', '.join(map(_quote, columns))}) FROM STDIN WITH (FORMAT csv)"
+    for start in range(0, len(df), chunk_size):
+        buffer = io.StringIO()
+        df.iloc[start:start + chunk_size].to_csv(buffer, index=False, header=False)
+        buffer.seek(0)
+        cursor.copy_expert(copy_sql, buffer)
+
+def _check_postgres_table(cursor, table_name, column_types, conflict_columns):
+    """Pastikan tabel tujuan punya semua kolom `column_types` dan UNIQUE tepat pada `conflict_columns`.
+
+    Tabel yang dibuat run sebelumnya dengan kunci lain (misalnya run satu sumber tanpa kolom
+    Source) tidak diubah otomatis; ValueError menjelaskan perintah untuk menyesuaikannya.
+    """
+    cursor.execute(
+        "SELECT column_name FROM information_schema.columns "
+        "WHERE table_schema = current_schema() AND table_name = %s", (table_name,))
+    existing = {row[0] for row in cursor.fetchall()}
+    cursor.execute(
+        "SELECT array_agg(a.attname::text) FROM pg_index i "
+        "JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey) "
+        "WHERE i.indrelid = to_regclass(%s) AND i.indisunique GROUP BY i.indexrelid", (_quote(table_name),))
+    unique_keys = [set(row[0]) for row in cursor.fetchall()]
+
+    missing = [col for col in column_types if col not in existing]
+    has_key = set(conflict_columns) in unique_keys
+    if not missing and has_key:
+        return
+    target = _quote(table_name)
+    fixes = [f"ALTER TABLE {target} ADD COLUMN {_quote(col)} {column_types[col]}"
+             + (" NOT NULL DEFAULT ''" if col in conflict_columns and column_types[col] == "TEXT" else "")
+             for col in missing]
+    if not has_key:
+        fixes.append(f"ALTER TABLE {target} ADD UNIQUE ({', '.join(map(_quote, conflict_columns))}) "
+                     "(hapus juga constraint UNIQUE lama)")
+    problems = [f"kolom tidak ada: {', '.join(missing)}"] if missing else []
+    if not has_key:
+        problems.append(f"tidak ada UNIQUE pada ({', '.join(conflict_columns)})")
+    raise ValueError(f"Tabel {table_name} dibuat dengan skema lain ({'; '.join(problems)}). "
+                     f"Sesuaikan dengan: {'; '.join(fixes)}, atau muat ke table_name lain.")
+
+@timed("load.postgres")
+def load_to_postgres(df, db_url, table_name="fashion_products", conflict_columns=("Title", "Size", "Gender"), engine=None, chunk_size=50000, delete_keys=None):
+    """Muat DataFrame ke PostgreSQL dengan COPY ke tabel staging lalu upsert ke tabel tujuan.
+
+    Tabel tujuan dibuat jika belum ada dengan constraint UNIQUE pada `conflict_columns`; tabel
+    lama dengan kolom atau kunci berbeda ditolak dengan pesan cara menyesuaikannya.
+    Baris dengan kunci yang sudah ada diperbarui (`INSERT ... ON CONFLICT DO UPDATE`).
+    `delete_keys` (DataFrame berisi `conflict_columns`) menghapus produk tersebut dalam
+    transaksi yang sama, misalnya produk yang hilang menurut CDC.
+    """
+    try:
+        engine = engine or get_engine(db_url)
+        columns = list(df.columns)
+        update_columns = [col for col in columns if col not in conflict_columns]
+
+        target = _quote(table_name)
+        staging = _quote(f"{table_name}_staging")
+        column_list = ", ".join(map(_quote, columns))
+        key_list = ", ".join(map(_quote, conflict_columns))
+        column_types = {col: _postgres_type(df[col].dtype) for col in columns}
+        column_defs = ", ".join(f"{_quote(col)} {column_types[col]}" for col in columns)
+
+        if update_columns:
+            on_conflict = "DO UPDATE SET " + ", ".join(f"{_quote(col)} = EXCLUDED.{_quote(col)}" for col in update_columns)
+        else:
+            on_conflict = "DO NOTHING"
+
+        connection = engine.raw_connection()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(f"CREATE TABLE IF NOT EXISTS {target} ({column_defs}, UNIQUE ({key_list}))")
+                _check_postgres_table(cursor, table_name, column_types, conflict_columns)
+                cursor.execute(f"CREATE TEMP TABLE {staging} (LIKE {target} INCLUDING DEFAULTS) ON COMMIT DROP")
+                _copy_dataframe(cursor, df, staging, columns, chunk_size)
+                # DISTINCT ON: satu baris per kunci agar ON CONFLICT tidak menyentuh baris yang sama dua kali
+                cursor.execute(
+                    f"INSERT INTO {target} ({column_list}) "
+                    f"SELECT DISTINCT ON ({key_list}) {column_list} FROM {staging} ORDER BY {key_list} "
+                    f"ON CONFLICT ({key_list}) {on_conflict}"
+                )
+                upserted = cursor.rowcount
+                deleted = 0
+                if delete_keys is not None and not delete_keys.empty:
+                    deleted_staging = _quote(f"{table_name}_deleted")
+                    key_defs = ", ".join(f"{_quote(col)} {_postgres_type(df[col].dtype)}" for col in conflict_columns)
+                    cursor.execute(f"CREATE TEMP TABLE {deleted_staging} ({key_defs}) ON COMMIT DROP")
+                    _copy_dataframe(cursor, delete_keys[list(conflict_columns)], deleted_staging, list(conflict_columns), chunk_size)
+                    match = " AND ".join(f"t.{_quote(col)} = d.{_quote(col)}" for col in conflict_columns)
+                    cursor.execute(f"DELETE FROM {target} t USING {deleted_staging} d WHERE {match}")
+                    deleted = cursor.rowcount
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            connection.close()  # Kembalikan koneksi ke pool
+
+        print(f"✅ {upserted} baris di-upsert ke tabel {table_name} PostgreSQL."
+              + (f" {deleted} baris dihapus." if deleted else ""))
+        return True
+
+    except Exception as e:
+        print(f"❌ Gagal memuat ke PostgreSQL: {e}")
+        return False
+
+# Nama lama yang masih dipakai oleh test dan skrip sebelumnya
+save_to_postgresql = load_to_postgres
+
@@ -0,0 +1,199 @@
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+def peak_rss_bytes():
+    """Peak resident set size proses ini dalam bytes, atau None jika tidak bisa diukur."""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux melaporkan KB, macOS melaporkan bytes
+        return peak if sys.platform == "darwin" else peak * 1024
+    except ImportError:
+        try:
+            import psutil
+            info = psutil.Process().memory_info()
+            return getattr(info, "peak_wset", info.rss)
+        except ImportError:
+            return None
+
+class RunMetrics:
+    """Pencatat metrik satu run ETL.
+
+    Untuk setiap tahap dicatat jumlah panggilan, waktu, bytes, baris masuk/keluar/terbuang,
+    dan peak RSS saat tahap terakhir selesai; untuk setiap halaman dicatat waktu fetch dan
+    parsing, bytes, dan jumlah produk. Aman dipakai dari banyak thread.
+    """
+
+    def __init__(self):
+        self.started_at = datetime.now().isoformat()
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+        self.stages = {}
+        self.pages = []
+
+    def record(self, stage, seconds=0.0, bytes_count=0, rows_in=None, rows_out=None):
+        """Tambahkan satu pengukuran ke tahap `stage`."""
+        peak = peak_rss_bytes()
+        with self._lock:
+            entry = self.stages.setdefault(stage, {
+                "calls": 0, "seconds": 0.0, "bytes": 0,
+                "rows_in": 0, "rows_out": 0, "rows_dropped": 0, "peak_rss_bytes": None,
+            })
+            entry["calls"] += 1
+            entry["seconds"] += seconds
+            entry["bytes"] += bytes_count
+            if rows_in is not None:
+                entry["rows_in"] += rows_in
+            if rows_out is not None:
+                entry["rows_out"] += rows_out
+            if rows_in is not None and rows_out is not None:
+                entry["rows_dropped"] += rows_in - rows_out
+            entry["peak_rss_bytes"] = peak
+
+    @contextmanager
+    def stage(self, stage, rows_in=None):
+        """Context manager pengukur waktu; set `result['rows_out']`/`['bytes']` di dalam blok."""
+        result = {"rows_out": None, "bytes": 0}
+        start = time.perf_counter()
+        try:
+            yield result
+        finally:
+            self.record(stage, time.perf_counter() - start, result["bytes"], rows_in, result["rows_out"])
+
+    def record_page(self, url, fetch_seconds, parse_seconds, bytes_count, products, cached=False):
+        """Catat metrik satu halaman katalog."""
+        entry = {
+            "url": url,
+            "fetch_seconds": fetch_seconds,
+            "parse_seconds": parse_seconds,
+            "bytes": bytes_count,
+            "products": products,
+            "cached": cached,
+            "peak_rss_bytes": peak_rss_bytes(),
+        }
+        with self._lock:
+            self.pages.append(entry)
+
+    def report(self):
+        """Ringkasan run dalam bentuk dict yang bisa di-serialisasi ke JSON."""
+        with self._lock:
+            return {
+                "started_at": self.started_at,
+                "duration_seconds": time.perf_counter() - self._start,
+                "peak_rss_bytes": peak_rss_bytes(),
+                "stages": {name: dict(values) for name, values in self.stages.items()},
+                "pages": list(self.pages),
+            }
+
+    def write_json(self, path):
+        """Tulis laporan run ke file JSON."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2)
+        return path
+
+    def to_prometheus(self, prefix="etl"):
+        """Laporan run dalam format teks Prometheus (exposition format)."""
+        report = self.report()
+        lines = []
+
+        def metric(name, metric_type, help_text, samples):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {metric_type}")
+            for labels, value in samples:
+                label_text = ",".join(f'{key}="{value_}"' for key, value_ in labels.items())
+                lines.append(f"{prefix}_{name}{{{label_text}}} {value}" if label_text else f"{prefix}_{name} {value}")
+
+        stages = report["stages"]
+        metric("stage_seconds_total", "counter", "Total waktu per tahap dalam detik.",
+               [({"stage": name}, values["seconds"]) for name, values in stages.items()])
+        metric("stage_calls_total", "counter", "Jumlah panggilan per tahap.",
+               [({"stage": name}, values["calls"]) for name, values in stages.items()])
+        metric("stage_bytes_total", "counter", "Bytes yang diproses per tahap.",
+               [({"stage": name}, values["bytes"]) for name, values in stages.items()])
+        for field in ("rows_in", "rows_out", "rows_dropped"):
+            metric(f"stage_{field}_total", "counter", f"Jumlah baris ({field}) per tahap.",
+                   [({"stage": name}, values[field]) for name, values in stages.items()])
+        metric("pages_total", "counter", "Jumlah halaman yang diproses.", [({}, len(report["pages"]))])
+        metric("run_duration_seconds", "gauge", "Durasi run dalam detik.", [({}, report["duration_seconds"])])
+        if report["peak_rss_bytes"] is not None:
+            metric("peak_rss_bytes", "gauge", "Peak resident set size proses.", [({}, report["peak_rss_bytes"])])
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path, prefix="etl"):
+        """Tulis metrik format Prometheus ke file (misalnya untuk textfile collector)."""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus(prefix))
+        os.replace(tmp_path, path)
+        return path
+
+class _NullMetrics:
+    """Pengganti RunMetrics saat tidak ada run yang diukur; semua pencatatan diabaikan."""
+
+    def record(self, *args, **kwargs):
+        pass
+
+    @contextmanager
+    def stage(self, stage, rows_in=None):
+        yield {"rows_out": None, "bytes": 0}
+
+    def record_page(self, *args, **kwargs):
+        pass
+
+_NULL_METRICS = _NullMetrics()
+_active = None
+
+def start_run():
+    """Mulai pengukuran run baru dan jadikan aktif untuk seluruh modul pipeline."""
+    global _active
+    _active = RunMetrics()
+    return _active
+
+def finish_run():
+    """Hentikan pengukuran dan kembalikan RunMetrics dari run yang aktif."""
+    global _active
+    metrics, _active = _active, None
+    return metrics
+
+def get_metrics():
+    """RunMetrics yang aktif, atau pencatat kosong jika tidak ada run yang diukur."""
+    return _active or _NULL_METRICS
+
+def timed(stage):
+    """Decorator yang mencatat waktu fungsi sebagai `stage`.
+
+    Jumlah baris masuk diambil dari DataFrame pada argumen pertama (atau kedua untuk method).
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            frame = next((arg for arg in args[:2] if hasattr(arg, "columns") and hasattr(arg, "__len__")), None)
+            rows_in = len(frame) if frame is not None else None
+            with get_metrics().stage(stage, rows_in=rows_in):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def profile_call(func, *args, top=25, sort="cumulative", output_path=None, stream=None, **kwargs):
+    """Jalankan `func` di bawah cProfile lalu cetak `top` fungsi terberat menurut `sort`.
+
+    Hanya thread pemanggil yang diprofil; waktu di thread fetch/sink terlihat sebagai waktu
+    tunggu. Dengan `output_path`, statistik lengkap disimpan (bisa dibuka dengan pstats/snakeviz).
+    Mengembalikan hasil `func`.
+    """
+    import cProfile
+    import pstats
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(func, *args, **kwargs)
+    finally:
+        if output_path:
+            profiler.dump_stats(output_path)
+        stats = pstats.Stats(profiler, stream=stream or sys.stdout)
+        stats.strip_dirs().sort_stats(sort).print_stats(top)
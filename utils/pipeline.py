@@ -0,0 +1,45 @@
+from utils.transform import transform_batches, StreamingDeduplicator
+from utils.load import save_to_csv, load_to_gsheet, append_to_gsheet, clear_gsheet
+
+def stream_pipeline(pages, exchange_rate=16000, csv_filename=None, spreadsheet_id=None, range_name='Sheet1!A1', parquet_writer=None, dedup_subset=None, history=None, validator=None, compact=False):
+    """Menjalankan transform dan load per batch halaman secara streaming.
+
+    `pages` adalah iterable daftar produk per halaman (misalnya dari `iter_fashion_studio_pages`).
+    Batch pertama menimpa file CSV/Sheet tujuan (Sheet dikosongkan dulu agar tidak ada baris
+    lama yang tertinggal), batch berikutnya ditambahkan di bawahnya,
+    sehingga hanya satu batch yang berada di memori pada satu waktu. `parquet_writer`
+    (ParquetBatchWriter) ikut menerima setiap batch dan ditutup setelah batch terakhir.
+    Duplikat (berdasarkan `dedup_subset`) dihapus lintas batch lewat StreamingDeduplicator.
+    `history` (HistoryStore) menerima setiap batch sebagai bagian dari satu run yang sama.
+    `validator` (Validator) mengkarantina baris yang tidak lolos validasi di semua batch.
+    Dengan `compact=True`, setiap batch memakai tipe hemat memori seperti mode batch `--compact`.
+    Mengembalikan jumlah total baris bersih yang dimuat.
+    """
+    total_rows = 0
+    batch_count = 0
+    run_id = None
+    try:
+        for df_clean in transform_batches(pages, exchange_rate, StreamingDeduplicator(dedup_subset), validator,
+                                          compact=compact):
+            first_batch = batch_count == 0
+            if csv_filename:
+                save_to_csv(df_clean, csv_filename, append=not first_batch)
+            if parquet_writer is not None:
+                parquet_writer.write(df_clean)
+            if history is not None:
+                run_id = run_id or history.begin_run()
+                history.append(df_clean, run_id)
+            if spreadsheet_id:
+                if first_batch:
+                    clear_gsheet(spreadsheet_id, range_name)
+                    load_to_gsheet(df_clean, spreadsheet_id, range_name)
+                else:
+                    append_to_gsheet(df_clean, spreadsheet_id, range_name)
+            batch_count += 1
+            total_rows += len(df_clean)
+    finally:
+        if parquet_writer is not None:
+            parquet_writer.close()
+
+    print(f"Streaming selesai. {total_rows} baris dari {batch_count} batch berhasil dimuat.")
+    return total_rows
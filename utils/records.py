@@ -0,0 +1,106 @@
+from array import array
+from datetime import datetime, timedelta, timezone
+import numpy as np
+import pandas as pd
+
+COLUMNS = ("Title", "Price", "Rating", "Colors", "Size", "Gender", "Timestamp")
+# Kolom dengan sedikit nilai berbeda; setiap nilai disimpan sekali dan dipakai bersama antar record
+SHARED_COLUMNS = ("Price", "Rating", "Colors", "Size", "Gender")
+# Kolom tambahan (lihat `extra_columns`) berisi nama katalog pada crawl banyak sumber
+SOURCE_COLUMN = "Source"
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_NAT = np.iinfo(np.int64).min
+
+def _timestamp_ns(value):
+    """Timestamp ISO (string atau datetime) sebagai nanodetik sejak epoch, NaT jika tidak valid."""
+    try:
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return (value - _EPOCH) // _MICROSECOND * 1000
+    except (TypeError, ValueError, AttributeError):
+        return _NAT
+
+class ProductBatch:
+    """Kumpulan produk hasil scraping yang disimpan per kolom, bukan sebagai list of dict.
+
+    Setiap field ditambahkan ke list/array miliknya sendiri: Timestamp disimpan sebagai
+    int64 nanodetik di `array`, nilai kolom yang berulang (Price, Rating, Colors, Size,
+    Gender) disimpan sekali dan dipakai bersama, dan dengan `typed=True` Price/Rating/Colors
+    (record dari `typed_product`) disimpan sebagai float64/int64. `to_frame` dan `to_arrow`
+    membungkus array numerik tanpa menyalinnya. Iterasi menghasilkan dict produk seperti
+    semula sehingga batch tetap bisa dipakai di tempat list of dict. `extra_columns`
+    menambah kolom setelah kolom standar, misalnya Source pada crawl banyak sumber.
+    """
+
+    __slots__ = ("typed", "columns", "_columns", "_shared")
+
+    def __init__(self, products=(), typed=False, extra_columns=()):
+        self.typed = typed
+        self.columns = COLUMNS + tuple(extra_columns)
+        self._columns = {column: [] for column in self.columns}
+        self._columns["Timestamp"] = array("q")
+        if typed:
+            self._columns.update(Price=array("d"), Rating=array("d"), Colors=array("q"))
+        self._shared = {column: {} for column in SHARED_COLUMNS + tuple(extra_columns)
+                        if isinstance(self._columns[column], list)}
+        self.extend(products)
+
+    def append(self, product):
+        """Tambahkan satu dict produk (hasil `extract_product_data` atau `typed_product`)."""
+        columns, shared = self._columns, self._shared
+        for column in self.columns:
+            values = columns[column]
+            value = product[column]
+            if column in shared:
+                values.append(shared[column].setdefault(value, value))
+                continue
+            if column == "Timestamp":
+                value = _timestamp_ns(value)
+            try:
+                values.append(value)
+            except BufferError:
+                # Array masih dipakai DataFrame/Arrow hasil konversi sebelumnya; salin dulu
+                # agar data yang sudah dikonversi tidak ikut berubah
+                columns[column] = array(values.typecode, values)
+                columns[column].append(value)
+
+    def extend(self, products):
+        for product in products:
+            self.append(product)
+
+    def __len__(self):
+        return len(self._columns["Title"])
+
+    def __iter__(self):
+        columns = [self._columns[column] for column in self.columns]
+        for values in zip(*columns):
+            product = dict(zip(self.columns, values))
+            ns = product["Timestamp"]
+            product["Timestamp"] = None if ns == _NAT else (_EPOCH + ns // 1000 * _MICROSECOND).isoformat()
+            yield product
+
+    def _numpy_columns(self):
+        """Kolom sebagai array NumPy; kolom `array` dibungkus lewat buffer protocol tanpa copy."""
+        result = {}
+        for column, values in self._columns.items():
+            if column == "Timestamp":
+                result[column] = np.frombuffer(values, dtype="datetime64[ns]")
+            elif isinstance(values, array):
+                result[column] = np.frombuffer(values, dtype=np.float64 if values.typecode == "d" else np.int64)
+            else:
+                result[column] = np.array(values, dtype=object)
+        return result
+
+    def to_frame(self):
+        """DataFrame dengan kolom seperti `pd.DataFrame(list_of_dict)`, Timestamp sebagai datetime64[ns]."""
+        return pd.DataFrame(self._numpy_columns(), columns=list(self.columns), copy=False)
+
+    def to_arrow(self):
+        """pyarrow.Table; kolom numerik dan Timestamp memakai buffer batch tanpa copy."""
+        import pyarrow as pa
+        columns = self._numpy_columns()
+        return pa.table({column: pa.array(columns[column]) for column in self.columns})
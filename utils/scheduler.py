@@ -0,0 +1,97 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Optional
+from urllib.parse import urlsplit
+from utils.async_extract import AsyncRateLimiter, aiter_fashion_studio_pages, create_async_client
+from utils.records import SOURCE_COLUMN, ProductBatch
+
+@dataclass
+class Source:
+    """Satu katalog yang di-crawl: nama (isi kolom Source), URL, batas halaman, dan kesopanan crawl.
+
+    Kecepatan request mengikuti `requests_per_second`, atau 1/`delay` jika tidak di-set.
+    `max_concurrency` membatasi jumlah halaman sumber ini yang diambil bersamaan.
+    """
+    name: str
+    base_url: str
+    max_pages: int = 50
+    delay: float = 2
+    requests_per_second: Optional[float] = None
+    max_concurrency: int = 2
+
+    @property
+    def host(self):
+        return urlsplit(self.base_url).netloc.lower()
+
+    @property
+    def rate(self):
+        if self.requests_per_second:
+            return self.requests_per_second
+        return 1.0 / self.delay if self.delay else None
+
+def host_limiters(sources):
+    """Satu AsyncRateLimiter per host; sumber di host yang sama memakai batas paling lambat di antara mereka."""
+    rates = {}
+    for source in sources:
+        rates.setdefault(source.host, [])
+        if source.rate:
+            rates[source.host].append(source.rate)
+    return {host: AsyncRateLimiter(min(host_rates) if host_rates else None) for host, host_rates in rates.items()}
+
+async def async_crawl_sources(sources, max_connections=10, per_host_connections=2, client=None,
+                              parser="html.parser", cache=None, typed=False, **retry_options):
+    """Crawl semua `sources` bersamaan di satu event loop dan kembalikan satu ProductBatch.
+
+    Semua sumber berbagi satu httpx.AsyncClient dengan paling banyak `max_connections`
+    koneksi. Setiap host punya batas kecepatan sendiri (lihat `host_limiters`) dan paling
+    banyak `per_host_connections` request yang berjalan, sehingga satu katalog besar tidak
+    menghabiskan pool dan antrean koneksi dilayani bergiliran antar host. Setiap produk
+    diberi kolom Source berisi nama sumbernya. Sumber yang gagal dicetak dan dilewati tanpa
+    menghentikan sumber lain.
+    """
+    names = [source.name for source in sources]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Nama sumber harus unik: {', '.join(names)}")
+    limiters = host_limiters(sources)
+    host_slots = {host: asyncio.Semaphore(max(per_host_connections, 1)) for host in limiters}
+    batch = ProductBatch(typed=typed, extra_columns=(SOURCE_COLUMN,))
+    counts = dict.fromkeys(names, 0)
+
+    async def crawl(source):
+        pages = aiter_fashion_studio_pages(
+            source.base_url, max_pages=source.max_pages, max_concurrency=source.max_concurrency,
+            client=client, parser=parser, cache=cache, semaphore=host_slots[source.host],
+            typed=typed, limiter=limiters[source.host], **retry_options)
+        try:
+            async for products in pages:
+                for product in products:
+                    product[SOURCE_COLUMN] = source.name
+                batch.extend(products)
+                counts[source.name] += len(products)
+        except Exception as e:
+            print(f"Terjadi kesalahan saat melakukan scraping sumber {source.name}: {e}")
+        finally:
+            await pages.aclose()
+
+    owns_client = client is None
+    if owns_client:
+        client = create_async_client(max_connections=max_connections)
+    try:
+        await asyncio.gather(*(crawl(source) for source in sources))
+    finally:
+        if owns_client:
+            await client.aclose()
+
+    for name, count in counts.items():
+        print(f"Sumber {name}: {count} produk")
+    return batch
+
+def crawl_sources(sources, max_connections=10, per_host_connections=2, parser="html.parser", cache=None,
+                  typed=False, **retry_options):
+    """Versi sinkron `async_crawl_sources` untuk dipanggil dari `main`.
+
+    `sources` berisi Source atau dict dengan field yang sama (misalnya dari file konfigurasi).
+    """
+    sources = [source if isinstance(source, Source) else Source(**source) for source in sources]
+    return asyncio.run(async_crawl_sources(sources, max_connections, per_host_connections, parser=parser,
+                                           cache=cache, typed=typed, **retry_options))
@@ -0,0 +1,83 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from typing import Optional
+from utils.load import save_to_csv, save_to_parquet, load_to_gsheet_chunked, load_to_postgres
+from utils.history import save_to_history
+
+# Loader yang bisa dipakai sebagai sink: fungsi(df, **opsi) -> True/False
+SINKS = {
+    'csv': save_to_csv,
+    'parquet': save_to_parquet,
+    'gsheet': load_to_gsheet_chunked,
+    'postgres': load_to_postgres,
+    'history': save_to_history,
+}
+
+DEFAULT_SINK_TIMEOUT = 300
+
+@dataclass
+class SinkResult:
+    """Hasil satu sink: berhasil/gagal, durasi (detik), dan pesan error jika ada."""
+    name: str
+    success: bool
+    duration: float
+    error: Optional[str] = None
+
+def register_sink(name, loader=None):
+    """Daftarkan loader sebagai sink; bisa dipakai langsung atau sebagai decorator."""
+    def decorator(func):
+        SINKS[name] = func
+        return func
+    return decorator(loader) if loader is not None else decorator
+
+def _run_loader(loader, df, options):
+    start = time.perf_counter()
+    try:
+        ok = loader(df, **options)
+        error = None if ok is not False else "loader mengembalikan False"
+        return ok is not False, time.perf_counter() - start, error
+    except Exception as e:
+        return False, time.perf_counter() - start, str(e)
+
+def run_sinks(df, sinks, default_timeout=DEFAULT_SINK_TIMEOUT):
+    """Tulis DataFrame ke semua sink secara bersamaan dan kembalikan daftar SinkResult.
+
+    `sinks` adalah dict nama -> opsi loader. Opsi khusus: `timeout` (detik, per sink),
+    `sink` (nama loader di SINKS jika berbeda dari nama entri, misalnya dua file CSV), dan
+    `data` (DataFrame pengganti `df` untuk sink ini, misalnya hanya baris yang berubah).
+    Sink yang melewati batas waktu dilaporkan gagal; thread-nya tidak bisa dihentikan
+    paksa sehingga dibiarkan selesai di latar belakang.
+    """
+    if not sinks:
+        return []
+    unknown = [(options or {}).get('sink', name) for name, options in sinks.items()
+               if (options or {}).get('sink', name) not in SINKS]
+    if unknown:
+        raise ValueError(f"Sink tidak dikenal: {', '.join(unknown)}. Pilihan: {', '.join(SINKS)}")
+
+    executor = ThreadPoolExecutor(max_workers=len(sinks), thread_name_prefix="sink")
+    submitted = []
+    try:
+        for name, options in sinks.items():
+            options = dict(options or {})
+            timeout = options.pop('timeout', default_timeout)
+            loader = SINKS[options.pop('sink', name)]
+            data = options.pop('data', df)
+            started = time.perf_counter()
+            submitted.append((name, executor.submit(_run_loader, loader, data, options), started, timeout))
+
+        results = []
+        for name, future, started, timeout in submitted:
+            remaining = None if timeout is None else max(0.0, started + timeout - time.perf_counter())
+            try:
+                success, duration, error = future.result(timeout=remaining)
+            except FutureTimeoutError:
+                future.cancel()
+                success, duration, error = False, time.perf_counter() - started, f"timeout setelah {timeout} detik"
+            results.append(SinkResult(name, success, duration, error))
+            status = "✅" if success else "❌"
+            print(f"{status} Sink {name}: {duration:.2f} detik" + (f" ({error})" if error else ""))
+        return results
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
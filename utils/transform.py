@@ -1,9 +1,14 @@
 import pandas as pd
 import numpy as np
 import re
+from utils.metrics import get_metrics
+from utils.records import COLUMNS, ProductBatch
+from utils.validate import Validator
 
 def transform_to_DataFrame(data):
     try:
+        if isinstance(data, ProductBatch):
+            return data.to_frame()
         df = pd.DataFrame(data)
         return df
     except Exception as e:
@@ -39,55 +44,291 @@ def extract_colors(colors_str):
         print(f"Error saat mengekstrak colors '{colors_str}': {e}")
         return 0
 
-def transform_data(data, exchange_rate=16000):
+def _factorize(values):
+    """pd.factorize dengan NaN/None sebagai nilai unik terakhir agar setiap kode valid sebagai indeks."""
+    codes, uniques = pd.factorize(values)
+    codes[codes < 0] = len(uniques)
+    return codes, np.append(np.asarray(uniques, dtype=object), np.nan)
+
+def _parse_unique(values, parse, column=None, factorized=None):
+    """Parsing hanya nilai unik lalu dipetakan kembali ke setiap baris.
+
+    Data hasil scraping sangat berulang (rating, jumlah warna, harga), sehingga
+    regex cukup dijalankan sekali per nilai unik. Jika `column` diberikan, nilai yang
+    gagal diparsing dicetak sebagai satu ringkasan, bukan satu pesan per baris.
+    `factorized` berisi (codes, uniques) untuk `values` yang sudah dihitung sebelumnya.
+    """
+    codes, uniques = factorized if factorized is not None else _factorize(values)
+    unique_values = pd.Series(uniques, dtype=object)
+    parsed = parse(unique_values)
+
+    if column:
+        invalid = (parsed.isna() & unique_values.notna()).to_numpy()
+        if invalid.any():
+            invalid_count = int(np.bincount(codes, minlength=len(uniques))[invalid].sum())
+            examples = unique_values[invalid].astype(str).tolist()[:3]
+            print(f"Peringatan: {invalid_count} nilai {column} tidak valid (contoh: {examples})")
+
+    return pd.Series(parsed.to_numpy()[codes], index=values.index, name=values.name)
+
+def clean_price_series(prices, factorized=None):
+    """Versi vektor dari `clean_price` untuk satu kolom Series."""
+    return _parse_unique(prices, lambda values: pd.to_numeric(
+        values.astype(str).str.replace(r'[\$,]', '', regex=True), errors='coerce'
+    ), column='Price', factorized=factorized).astype(float)
+
+def extract_rating_series(ratings, factorized=None):
+    """Versi vektor dari `extract_rating` untuk satu kolom Series."""
+    return _parse_unique(ratings, lambda values: values.astype(str).str.extract(
+        r'(\d+\.\d)', expand=False
+    ).astype(float), column='Rating', factorized=factorized).astype(float)
+
+def extract_colors_series(colors, factorized=None):
+    """Versi vektor dari `extract_colors` untuk satu kolom Series (0 jika tidak ada angka)."""
+    return _parse_unique(colors, lambda values: values.astype(str).str.extract(
+        r'(\d+)', expand=False
+    ).astype(float).fillna(0).astype(int), factorized=factorized).astype(int)
+
+# Kolom yang berbeda untuk setiap baris hasil scraping sehingga tidak ikut menentukan duplikat
+DEDUP_EXCLUDE = ('Timestamp',)
+
+def dedup_columns(columns, subset=None):
+    """Kolom kunci deduplikasi: `subset`, atau semua kolom kecuali DEDUP_EXCLUDE."""
+    if subset is not None:
+        return list(subset)
+    return [col for col in columns if col not in DEDUP_EXCLUDE]
+
+def factorize_columns(df, columns):
+    """Kode integer dan nilai unik per kolom; dipakai bersama oleh deduplikasi dan parsing."""
+    return {col: _factorize(df[col]) for col in columns}
+
+def _combine_codes(factorized):
+    """Gabungkan kode per kolom menjadi satu kode int64 per baris yang unik per kombinasi nilai."""
+    combined = None
+    cardinality = 1
+    for codes, uniques in factorized:
+        size = max(len(uniques), 1)
+        if combined is None:
+            combined, cardinality = codes.astype(np.int64), size
+            continue
+        if cardinality * size >= 2 ** 62:
+            # Padatkan ulang agar perkalian berikutnya tidak overflow
+            combined, compacted = pd.factorize(combined)
+            cardinality = len(compacted)
+        combined = combined * size + codes
+        cardinality *= size
+    return combined
+
+def duplicate_mask(df, subset=None, factorized=None):
+    """Mask baris duplikat (True setelah kemunculan pertama) berdasarkan kolom `subset`.
+
+    Setiap kolom di-factorize sekali, kodenya digabung menjadi satu kunci integer, lalu
+    duplikat dicari dalam satu pass atas kunci itu. `factorized` (hasil `factorize_columns`)
+    bisa diberikan agar kolom yang sama tidak di-factorize ulang.
+    """
+    columns = dedup_columns(df.columns, subset)
+    if df.empty or not columns:
+        return np.zeros(len(df), dtype=bool)
+    factorized = factorized if factorized is not None else factorize_columns(df, columns)
+    combined = _combine_codes(factorized[col] for col in columns)
+    return pd.Series(combined).duplicated().to_numpy()
+
+class StreamingDeduplicator:
+    """Deduplikasi lintas batch tanpa menyimpan DataFrame sebelumnya.
+
+    Hanya hash 64-bit dari kolom kunci setiap baris unik yang disimpan, sehingga batch
+    yang datang bertahap (misalnya per halaman) bisa dicek terhadap semua batch sebelumnya.
+    """
+
+    def __init__(self, subset=None):
+        self.subset = subset
+        self._seen = set()
+
+    def __len__(self):
+        return len(self._seen)
+
+    def mask(self, df):
+        """Mask duplikat untuk batch ini (di dalam batch atau sudah terlihat sebelumnya); hash baru dicatat."""
+        if df.empty:
+            return np.zeros(0, dtype=bool)
+        columns = dedup_columns(df.columns, self.subset)
+        # hash() atas tuple Python jauh lebih murah daripada hash_pandas_object untuk batch kecil;
+        # NaN diganti None karena NaN tidak pernah sama dengan dirinya sendiri
+        rows = df[columns].to_numpy(dtype=object).tolist()
+        hashes = [hash(tuple([None if value != value else value for value in row])) for row in rows]
+        seen = self._seen
+        duplicated = np.empty(len(hashes), dtype=bool)
+        for position, value in enumerate(hashes):
+            duplicated[position] = value in seen
+            seen.add(value)
+        return duplicated
+
+    def filter(self, df):
+        """Kembalikan baris batch yang belum pernah terlihat."""
+        return df[~self.mask(df)]
+
+def memory_usage_bytes(df):
+    """Total memori DataFrame termasuk isi string (`memory_usage(deep=True)`)."""
+    return int(df.memory_usage(deep=True).sum())
+
+def _string_dtype():
+    """String berbasis Arrow jika pyarrow tersedia, jika tidak StringDtype biasa."""
     try:
-        #menghindari SettingWithCopyWarning
-        df = data.copy()
-        
+        import pyarrow  # noqa: F401
+        return "string[pyarrow]"
+    except ImportError:
+        return "string"
+
+def _downcast_float(values, tolerance):
+    """Pakai float32 hanya jika selisih pembulatannya tidak melebihi `tolerance`."""
+    values32 = values.astype(np.float32)
+    error = (values32.astype(float) - values).abs().max()
+    if values.empty or pd.isna(error) or error <= tolerance:
+        return values32
+    return values
+
+def compact_dtypes(df):
+    """Ubah hasil transform_data ke tipe data hemat memori.
+
+    Size/Gender menjadi category, Colors integer terkecil, Price (toleransi Rp1) dan
+    Rating float32 jika presisinya cukup, Timestamp datetime64, dan Title string Arrow.
+    """
+    df['Title'] = df['Title'].astype(_string_dtype())
+    df['Price'] = _downcast_float(df['Price'], tolerance=1.0)
+    df['Rating'] = _downcast_float(df['Rating'], tolerance=1e-4)
+    df['Colors'] = pd.to_numeric(df['Colors'], downcast='integer')
+    df['Size'] = df['Size'].astype('category')
+    df['Gender'] = df['Gender'].astype('category')
+    df['Timestamp'] = pd.to_datetime(df['Timestamp'], format='ISO8601', errors='coerce')
+    return df
+
+def datetime_to_iso(col):
+    """Series datetime64 sebagai string ISO (presisi mikrodetik), None untuk NaT."""
+    values = col.to_numpy()
+    iso = np.datetime_as_string(values, unit='us').astype(object)
+    iso[np.isnat(values)] = None
+    return pd.Series(iso, index=col.index)
+
+def transform_data(data, exchange_rate=16000, compact=False, dedup_subset=None, deduplicator=None, validator=None):
+    """Membersihkan data hasil scraping dan mengonversi tipe datanya.
+
+    Semua filter dihitung sebagai mask terhadap data asli lalu baris yang lolos diambil
+    sekali saja, tanpa rantai copy antar langkah. Dengan `compact=True`, kolom diubah ke
+    tipe hemat memori (lihat `compact_dtypes`) dan penggunaan memori dilaporkan.
+    Duplikat ditentukan dari `dedup_subset` (default semua kolom kecuali Timestamp);
+    hasil factorize kolom kunci dipakai ulang untuk parsing Price/Rating/Colors.
+    Dengan `deduplicator` (StreamingDeduplicator), duplikat dari batch sebelumnya ikut dihapus.
+    Kolom Price, Rating, dan Colors yang sudah numerik (record dari `typed_product`) tidak
+    di-parsing ulang. Hasil akhirnya melewati tahap validasi `validator` (default
+    `Validator()` dengan DEFAULT_RULES, lihat `utils/validate.py`): baris dengan nilai
+    kosong, judul tidak valid, atau nilai di luar rentang dikarantina. Jika transformasi
+    gagal, seluruh data dikarantina dan DataFrame kosong dikembalikan (dengan kolom `COLUMNS`
+    jika input bukan DataFrame); data mentah tidak pernah dikembalikan.
+    """
+    own_validator = validator is None
+    validator = Validator() if own_validator else validator
+    try:
+        missing = [col for col in COLUMNS if col not in data.columns]
+        if missing:
+            raise KeyError(f"Kolom tidak ditemukan: {', '.join(missing)}")
+        metrics = get_metrics()
+        is_numeric = pd.api.types.is_numeric_dtype
+        typed = all(is_numeric(data[col]) for col in ('Price', 'Rating', 'Colors'))
         # Menghapus baris duplikat
-        df_clean = df.drop_duplicates()
-        print(f"Menghapus {len(df) - len(df_clean)} baris duplikat")
-        df = df_clean
-        
-        # Filter data dengan judul tidak valid
-        valid_title_mask = df['Title'] != 'Unknown Product'
-        df_clean = df[valid_title_mask]
-        print(f"Menghapus {len(df) - len(df_clean)} baris dengan judul tidak valid")
-        df = df_clean
-        
-        # Transformasi kolom Price
-        df['Price'] = df['Price'].replace(['Price Not Found', 'Price Unavailable'], np.nan)
+        with metrics.stage("transform.deduplicate", rows_in=len(data)) as stage:
+            if deduplicator is not None:
+                factorized = {}
+                keep = ~deduplicator.mask(data)
+            else:
+                factorized = factorize_columns(data, dedup_columns(data.columns, dedup_subset))
+                keep = ~duplicate_mask(data, dedup_subset, factorized)
+            stage["rows_out"] = int(keep.sum())
+        print(f"Menghapus {len(data) - int(keep.sum())} baris duplikat")
         
-        # Konversi Price ke float dan kali dengan exchange rate
-        df['Price'] = df['Price'].apply(clean_price) * exchange_rate
-        
-        # Hapus baris dengan Price yang tidak valid (NaN)
-        before_len = len(df)
-        df = df.dropna(subset=['Price'])
-        print(f"Menghapus {before_len - len(df)} baris dengan harga tidak valid")
+        with metrics.stage("transform.price", rows_in=int(keep.sum())) as stage:
+            # Transformasi kolom Price, konversi ke float dan kali dengan exchange rate
+            price = data['Price'][keep]
+            if is_numeric(price):
+                price = price.astype(float) * exchange_rate
+            elif 'Price' in factorized:
+                codes, uniques = factorized['Price']
+                uniques = pd.Series(uniques, dtype=object).replace(['Price Not Found', 'Price Unavailable'], np.nan)
+                price = clean_price_series(price, (codes[keep], uniques.to_numpy())) * exchange_rate
+            else:
+                price = clean_price_series(price.replace(['Price Not Found', 'Price Unavailable'], np.nan)) * exchange_rate
+            # Harga yang tidak valid (NaN) ditangani aturan Price.not_null di tahap validasi
+            stage["rows_out"] = len(price)
         
+        def reuse(column):
+            # Kode factorize dari langkah deduplikasi, dipersempit ke baris yang lolos
+            if column not in factorized:
+                return None
+            codes, uniques = factorized[column]
+            return codes[keep], uniques
 
-        df['Rating'] = df['Rating'].apply(extract_rating)
-        df['Colors'] = df['Colors'].apply(extract_colors)
-        df['Size'] = df['Size'].str.replace('Size:', '').str.strip()
-        df['Gender'] = df['Gender'].str.replace('Gender:', '').str.strip()
-        for col in ['Title', 'Price', 'Rating', 'Colors', 'Size', 'Gender', 'Timestamp']:
-            if df[col].isnull().any():
-                print(f"Peringatan: Masih ada nilai null di kolom {col}")
+        cleaned = {
+            'Title': lambda col: col.astype(str),
+            'Price': lambda col: price.astype(float),
+            'Rating': lambda col: col.astype(float) if is_numeric(col) else extract_rating_series(col, reuse('Rating')).astype(float),
+            'Colors': lambda col: col.astype(int) if is_numeric(col) else extract_colors_series(col, reuse('Colors')).astype(int),
+            # Label Size:/Gender: sudah dibuang saat ekstraksi record bertipe
+            'Size': lambda col: col.astype(str) if typed else col.str.replace('Size:', '').str.strip().astype(str),
+            'Gender': lambda col: col.astype(str) if typed else col.str.replace('Gender:', '').str.strip().astype(str),
+            # Timestamp datetime64 (dari ProductBatch) dikembalikan ke string ISO seperti record biasa;
+            # NaT menjadi None agar tetap tertangkap aturan Timestamp.not_null
+            'Timestamp': lambda col: (datetime_to_iso(col) if pd.api.types.is_datetime64_dtype(col)
+                                      else col.astype(str)),
+        }
+        # Satu-satunya materialisasi: setiap kolom diambil sekali untuk baris yang lolos
+        with metrics.stage("transform.columns", rows_in=int(keep.sum())) as stage:
+            df = pd.DataFrame({
+                col: cleaned[col](data[col][keep]) if col in cleaned else data[col][keep]
+                for col in data.columns
+            })
+            stage["rows_out"] = len(df)
+        
+        df = validator.apply(df)
         
-        # Validasi tipe data
-        df['Title'] = df['Title'].astype(str)
-        df['Price'] = df['Price'].astype(float)
-        df['Rating'] = df['Rating'].astype(float)
-        df['Colors'] = df['Colors'].astype(int)
-        df['Size'] = df['Size'].astype(str)
-        df['Gender'] = df['Gender'].astype(str)
-        df['Timestamp'] = df['Timestamp'].astype(str)
+        if compact:
+            with metrics.stage("transform.compact", rows_in=len(df)) as stage:
+                before = memory_usage_bytes(data)
+                df = compact_dtypes(df)
+                after = memory_usage_bytes(df)
+                stage["rows_out"] = len(df)
+            print(f"Penggunaan memori: {before / 1e6:.2f} MB -> {after / 1e6:.2f} MB")
         
         print(f"Transformasi selesai. Hasil: {len(df)} baris data bersih.")
         return df
         
     except Exception as e:
         print(f"Error saat melakukan transformasi data: {e}")
-        # Return data asli sebagai fallback
-        return data
\ No newline at end of file
+        # Data mentah tidak boleh lolos ke sink tanpa validasi
+        if isinstance(data, pd.DataFrame):
+            validator.reject(data, f"transformasi gagal: {e}")
+            return data.iloc[0:0]
+        # Input bukan DataFrame (misalnya list record atau None): karantina sebisanya
+        validator.reject(transform_to_DataFrame(data), f"transformasi gagal: {e}")
+        return pd.DataFrame(columns=list(COLUMNS))
+    finally:
+        if own_validator and validator.rows_quarantined:
+            print(validator.summary())
+
+def transform_batches(batches, exchange_rate=16000, deduplicator=None, validator=None, compact=False):
+    """Generator: ubah setiap batch (list of dict per halaman) menjadi DataFrame bersih.
+
+    Batch yang kosong setelah dibersihkan tidak di-yield. Tanpa `deduplicator`
+    (StreamingDeduplicator), duplikat hanya dihapus di dalam batch. `validator` (Validator,
+    default `Validator()`) dipakai untuk semua batch sehingga karantina dan laporannya
+    mencakup seluruh run. Dengan `compact=True`, setiap batch diubah ke tipe hemat memori.
+    """
+    own_validator = validator is None
+    validator = Validator() if own_validator else validator
+    for batch in batches:
+        if not batch:
+            continue
+        df_clean = transform_data(transform_to_DataFrame(batch), exchange_rate, compact=compact,
+                                  deduplicator=deduplicator, validator=validator)
+        if not df_clean.empty:
+            yield df_clean
+    if own_validator and validator.rows_quarantined:
+        print(validator.summary())
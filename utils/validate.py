@@ -0,0 +1,197 @@
+import json
+import os
+from dataclasses import dataclass
+from typing import Any
+import numpy as np
+import pandas as pd
+from utils.metrics import get_metrics
+
+REASON_COLUMN = "Alasan"
+
+@dataclass(frozen=True)
+class Rule:
+    """Satu aturan kualitas data untuk satu kolom.
+
+    `check` adalah salah satu dari 'not_null', 'range' (value = (min, max), None berarti
+    tanpa batas), 'allowed' atau 'forbidden' (value = kumpulan nilai), dan 'regex'
+    (value = pola yang harus cocok penuh). Selain 'not_null', nilai kosong dianggap lolos
+    agar satu baris kosong tidak dilaporkan oleh banyak aturan sekaligus.
+    """
+    name: str
+    column: str
+    check: str
+    value: Any = None
+
+    def failures(self, df):
+        """Mask boolean (array NumPy) baris yang melanggar aturan ini."""
+        if self.column not in df.columns:
+            return np.ones(len(df), dtype=bool)
+        values = df[self.column]
+        present = values.notna().to_numpy()
+        if self.check == "not_null":
+            return ~present
+        if self.check == "range":
+            # Kolom yang belum numerik (misalnya data yang gagal ditransformasi) ikut melanggar
+            numbers = values if pd.api.types.is_numeric_dtype(values) else pd.to_numeric(values, errors="coerce")
+            numbers = numbers.to_numpy(dtype=float, na_value=np.nan)
+            minimum, maximum = self.value
+            with np.errstate(invalid="ignore"):
+                ok = ~np.isnan(numbers)
+                if minimum is not None:
+                    ok &= numbers >= minimum
+                if maximum is not None:
+                    ok &= numbers <= maximum
+            return present & ~ok
+        if self.check in ("allowed", "forbidden"):
+            found = values.isin(list(self.value)).to_numpy()
+            return present & (~found if self.check == "allowed" else found)
+        if self.check == "regex":
+            # Pola dicocokkan sekali per nilai unik, lalu dipetakan kembali ke setiap baris
+            codes, uniques = pd.factorize(values)
+            matched = pd.Series(uniques, dtype=object).astype(str).str.fullmatch(self.value).to_numpy(dtype=bool)
+            return present & ~matched[codes]
+        raise ValueError(f"Jenis aturan tidak dikenal: {self.check}")
+
+def not_null(column):
+    return Rule(f"{column}.not_null", column, "not_null")
+
+def in_range(column, minimum=None, maximum=None):
+    return Rule(f"{column}.range", column, "range", (minimum, maximum))
+
+def one_of(column, values):
+    return Rule(f"{column}.allowed", column, "allowed", tuple(values))
+
+def none_of(column, values):
+    return Rule(f"{column}.forbidden", column, "forbidden", tuple(values))
+
+def matches(column, pattern):
+    return Rule(f"{column}.regex", column, "regex", pattern)
+
+# Aturan untuk output `transform_data`
+DEFAULT_RULES = (
+    *(not_null(col) for col in ("Title", "Price", "Rating", "Colors", "Size", "Gender", "Timestamp")),
+    none_of("Title", ["Unknown Product"]),
+    in_range("Price", minimum=0),
+    in_range("Rating", minimum=0, maximum=5),
+    in_range("Colors", minimum=0),
+)
+
+def _failure_reasons(rules, masks, positions):
+    """Alasan karantina (nama aturan yang dilanggar, dipisah '; ') untuk setiap baris `positions`.
+
+    Pelanggaran setiap baris dikodekan sebagai bitmask, lalu nama aturan digabung sekali per
+    kombinasi unik dan dipetakan kembali ke baris lewat kode factorize.
+    """
+    codes = np.zeros(len(positions), dtype=np.int64)
+    bound = 1
+    for mask in masks:
+        if bound > 2 ** 61:
+            # Padatkan kode agar bitmask tidak melebihi int64 pada aturan yang sangat banyak
+            codes, uniques = pd.factorize(codes)
+            bound = len(uniques)
+        codes = codes * 2 + mask[positions]
+        bound *= 2
+    codes, _ = pd.factorize(codes)
+    _, first = np.unique(codes, return_index=True)
+    labels = np.array(["; ".join(rule.name for rule, mask in zip(rules, masks) if mask[positions[row]])
+                       for row in first], dtype=object)
+    return labels[codes]
+
+class Validator:
+    """Tahap validasi: pisahkan baris yang lolos semua aturan dari baris yang dikarantina.
+
+    Semua aturan dievaluasi sebagai mask boolean atas seluruh batch sekaligus. Baris yang
+    gagal ditulis (ditambahkan) ke `quarantine_path` berupa CSV dengan kolom Alasan berisi
+    nama aturan yang dilanggar; tanpa `quarantine_path` baris tersebut disimpan di memori
+    dan bisa diambil lewat `quarantined`. Jumlah pelanggaran per aturan diakumulasi lintas batch
+    untuk `report`. Jika validasi sendiri error, seluruh batch dikarantina; data yang
+    belum tervalidasi tidak pernah diteruskan.
+    """
+
+    def __init__(self, rules=DEFAULT_RULES, quarantine_path=None):
+        self.rules = tuple(rules)
+        self.quarantine_path = quarantine_path
+        self.rows_in = 0
+        self.rows_valid = 0
+        self.rows_quarantined = 0
+        self.failures = {rule.name: 0 for rule in self.rules}
+        self._quarantined = []
+
+    def apply(self, df):
+        """Kembalikan baris `df` yang lolos semua aturan; sisanya dikarantina."""
+        with get_metrics().stage("transform.validate", rows_in=len(df)) as stage:
+            try:
+                failed = np.zeros(len(df), dtype=bool)
+                masks = []
+                for rule in self.rules:
+                    mask = rule.failures(df)
+                    masks.append(mask)
+                    failed |= mask
+                positions = np.flatnonzero(failed)
+                for rule, mask in zip(self.rules, masks):
+                    self.failures[rule.name] += int(mask.sum())
+                self._quarantine(df.iloc[positions], _failure_reasons(self.rules, masks, positions))
+                valid = df[~failed]
+            except Exception as e:
+                print(f"Error saat validasi data: {e}")
+                self._quarantine(df, f"validasi gagal: {e}")
+                valid = df.iloc[0:0]
+            self.rows_in += len(df)
+            self.rows_valid += len(valid)
+            stage["rows_out"] = len(valid)
+        if len(valid) < len(df):
+            print(f"Mengkarantina {len(df) - len(valid)} baris yang tidak lolos validasi")
+        return valid
+
+    def reject(self, df, reason):
+        """Karantina seluruh `df` dengan satu alasan, misalnya batch yang gagal ditransformasi."""
+        self.rows_in += len(df)
+        self._quarantine(df, reason)
+
+    def _quarantine(self, rows, reasons):
+        if rows.empty:
+            return
+        self.rows_quarantined += len(rows)
+        try:
+            rows = rows.assign(**{REASON_COLUMN: reasons})
+            if self.quarantine_path is None:
+                self._quarantined.append(rows)
+                return
+            directory = os.path.dirname(self.quarantine_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            write_header = not os.path.exists(self.quarantine_path)
+            rows.to_csv(self.quarantine_path, mode="a", header=write_header, index=False)
+        except Exception as e:
+            # Baris tetap tidak diteruskan dan tetap terhitung di report
+            print(f"Gagal mencatat {len(rows)} baris karantina: {e}")
+
+    def quarantined(self):
+        """Baris yang dikarantina di memori (tanpa `quarantine_path`) beserta kolom Alasan."""
+        if not self._quarantined:
+            return pd.DataFrame(columns=[REASON_COLUMN])
+        return pd.concat(self._quarantined, ignore_index=True)
+
+    def report(self):
+        """Ringkasan validasi yang bisa di-serialisasi ke JSON."""
+        return {
+            "rows_in": self.rows_in,
+            "rows_valid": self.rows_valid,
+            "rows_quarantined": self.rows_quarantined,
+            "quarantine_path": self.quarantine_path if self.rows_quarantined else None,
+            "rules": [
+                {"name": rule.name, "column": rule.column, "check": rule.check, "failed": self.failures[rule.name]}
+                for rule in self.rules
+            ],
+        }
+
+    def write_report(self, path):
+        """Tulis `report` ke file JSON."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2)
+        return path
+
+    def summary(self):
+        failed = [f"{name} ({count})" for name, count in self.failures.items() if count]
+        return (f"Validasi: {self.rows_valid} lolos, {self.rows_quarantined} dikarantina dari {self.rows_in} baris"
+                + (f"; pelanggaran: {', '.join(failed)}" if failed else ""))